@@ -4,6 +4,9 @@ import math
 
 import config
 from combat import Drone, Projectile
+from spatial_index import clip_motion
+from threat_map import ThreatMap
+from combat_events import compact
 
 
 class AggressiveDefensiveDrone(Drone):
@@ -33,8 +36,23 @@ class AggressiveDefensiveDrone(Drone):
         self.optimal_range = optimal_range
         self.state = "idle"
         self.target = None
+        # Set when an AI scheduler owns target acquisition
+        self.scheduled = False
+        self.sighted = None
+        self.thinker = None
 
-    def update(self, dt: float, targets: list) -> None:
+    def think(self, targets: list, threats: ThreatMap | None = None) -> None:
+        """Pick the hostile to chase and shoot at until the next decision."""
+        self.sighted = self._find_target(targets, threats)
+
+    def _sight(self, targets: list, threats: ThreatMap | None):
+        if not self.scheduled:
+            return self._find_target(targets, threats)
+        return self.sighted
+
+    def update(
+        self, dt: float, targets: list, threats: ThreatMap | None = None
+    ) -> None:
         """Intercept nearby threats while keeping orbital phase."""
 
         self.lifetime -= dt
@@ -44,7 +62,7 @@ class AggressiveDefensiveDrone(Drone):
         if self.state == "idle":
             self.x = self.owner.x + math.cos(self.angle) * self.radius
             self.y = self.owner.y + math.sin(self.angle) * self.radius
-            threat = self._find_target(targets)
+            threat = self._sight(targets, threats)
             if threat:
                 self.target = threat.ship
                 self.state = "intercept"
@@ -58,8 +76,14 @@ class AggressiveDefensiveDrone(Drone):
             dy = ty - self.y
             dist = math.hypot(dx, dy) or 1.0
             if dist > self.optimal_range:
-                self.x += (dx / dist * self.intercept_speed) * dt
-                self.y += (dy / dist * self.intercept_speed) * dt
+                self.x, self.y = clip_motion(
+                    getattr(self.owner, "_sectors", None),
+                    self.x,
+                    self.y,
+                    self.x + (dx / dist * self.intercept_speed) * dt,
+                    self.y + (dy / dist * self.intercept_speed) * dt,
+                    self.size / 2,
+                )
             else:
                 self.state = "idle"
                 self.target = None
@@ -74,9 +98,9 @@ class AggressiveDefensiveDrone(Drone):
         if self._timer > 0:
             self._timer -= dt
         else:
-            target = self._find_target(targets)
+            target = self._sight(targets, threats)
             if target:
-                proj = Projectile(
+                proj = Projectile.pool.acquire(
                     self.x,
                     self.y,
                     target.ship.x,
@@ -87,7 +111,8 @@ class AggressiveDefensiveDrone(Drone):
                 self.projectiles.append(proj)
                 self._timer = self.fire_cooldown
 
-        for proj in list(self.projectiles):
+        for proj in self.projectiles:
             proj.update(dt)
-            if proj.expired():
-                self.projectiles.remove(proj)
+        dead = [p for p in self.projectiles if p.expired()]
+        compact(self.projectiles, dead)
+        Projectile.pool.release_all(dead)
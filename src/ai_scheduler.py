@@ -0,0 +1,95 @@
+"""Time-sliced scheduler that spreads AI decisions across frames."""
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+import config
+
+# Successive registrations are offset by the golden ratio so thinkers with the
+# same rate never line up on the same frame.
+_STAGGER = 0.6180339887
+
+
+@dataclass
+class Thinker:
+    """A registered think function and when it is next due."""
+
+    think: Callable[[float], None]
+    interval: float
+    priority: int = 0
+    due: float = 0.0
+    last: float = 0.0
+    active: bool = field(default=True, repr=False)
+
+    def cancel(self) -> None:
+        self.active = False
+
+
+class AIScheduler:
+    """Run think functions at their own rate within a per-frame budget.
+
+    ``think`` receives the seconds elapsed since its previous call. Agents
+    keep integrating movement every tick from their last decision; only the
+    decision itself is scheduled. Once ``budget_ms`` is spent the remaining
+    due thinkers are deferred, lowest priority first, unless they have been
+    waiting longer than ``config.AI_MAX_DEFER``.
+    """
+
+    def __init__(
+        self,
+        budget_ms: float = config.AI_FRAME_BUDGET_MS,
+        timer: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.budget_ms = budget_ms
+        self.timer = timer
+        self.time = 0.0
+        self.thinkers: list[Thinker] = []
+        self.spent_ms = 0.0
+        self.ran = 0
+        self.deferred = 0
+        self._phase = 0.0
+
+    def __len__(self) -> int:
+        return len(self.thinkers)
+
+    def register(
+        self, think: Callable[[float], None], rate: float, priority: int = 0
+    ) -> Thinker:
+        """Call ``think`` about ``rate`` times per second; higher ``priority`` runs first."""
+        interval = 1.0 / rate
+        self._phase = (self._phase + _STAGGER) % 1.0
+        thinker = Thinker(
+            think,
+            interval,
+            priority,
+            due=self.time + interval * self._phase,
+            last=self.time,
+        )
+        self.thinkers.append(thinker)
+        return thinker
+
+    def tick(self, dt: float) -> None:
+        self.time += dt
+        now = self.time
+        self.thinkers = [t for t in self.thinkers if t.active]
+        due = [t for t in self.thinkers if t.due <= now]
+        due.sort(key=lambda t: (-t.priority, t.due))
+        start = self.timer()
+        ran = deferred = 0
+        for thinker in due:
+            if not thinker.active:
+                continue
+            over_budget = (self.timer() - start) * 1000.0 >= self.budget_ms
+            if over_budget and now - thinker.due < config.AI_MAX_DEFER:
+                deferred += 1
+                continue
+            thinker.think(now - thinker.last)
+            thinker.last = now
+            thinker.due += thinker.interval
+            if thinker.due <= now:
+                thinker.due = now + thinker.interval
+            ran += 1
+        self.spent_ms = (self.timer() - start) * 1000.0
+        self.ran = ran
+        self.deferred = deferred
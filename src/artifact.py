@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import math
+import numpy as np
 import pygame
 import config
+from combat_events import CombatEvents, compact
+from particles import PARTICLES
 
 
 @dataclass
@@ -68,6 +71,20 @@ class EMPWave:
         self.radius = radius
         self.duration = duration
         self.timer = 0.0
+        # The shock ring is a burst of dots expanding at a constant speed
+        self.emitter = PARTICLES.new_emitter()
+        ang = np.linspace(0.0, math.tau, config.EMP_WAVE_PARTICLES, endpoint=False)
+        speed = radius / duration
+        PARTICLES.emit(
+            self.emitter,
+            np.full(len(ang), x),
+            y,
+            np.cos(ang) * speed,
+            np.sin(ang) * speed,
+            life=duration,
+            size=2,
+            color=(100, 200, 255),
+        )
 
     def update(self, dt: float) -> None:
         self.timer += dt
@@ -82,18 +99,7 @@ class EMPWave:
         offset_y: float = 0.0,
         zoom: float = 1.0,
     ) -> None:
-        progress = min(1.0, self.timer / self.duration)
-        cur_radius = self.radius * progress
-        alpha = max(0, int(255 * (1.0 - progress)))
-        surf = pygame.Surface(
-            (config.WINDOW_WIDTH, config.WINDOW_HEIGHT), pygame.SRCALPHA
-        )
-        pos = (
-            int((self.x - offset_x) * zoom),
-            int((self.y - offset_y) * zoom),
-        )
-        pygame.draw.circle(surf, (100, 200, 255, alpha), pos, int(cur_radius * zoom), 2)
-        screen.blit(surf, (0, 0))
+        PARTICLES.draw(screen, offset_x, offset_y, zoom, emitter=self.emitter)
 
 
 class EMPArtifact(Artifact):
@@ -348,7 +354,9 @@ class Decoy:
         self.lifetime = lifetime
         self.hp = hp
 
-    def update(self, dt: float, targets: list) -> None:
+    def update(
+        self, dt: float, targets: list, events: CombatEvents | None = None
+    ) -> None:
         self.lifetime -= dt
         rect = pygame.Rect(
             self.x - self.size / 2,
@@ -357,12 +365,18 @@ class Decoy:
             self.size,
         )
         for obj in targets:
-            for proj in list(obj.ship.projectiles):
-                if rect.collidepoint(proj.x, proj.y):
-                    self.hp -= proj.damage
-                    obj.ship.projectiles.remove(proj)
-                    if self.hp <= 0:
-                        break
+            caught = []
+            for proj in obj.ship.projectiles:
+                if not rect.collidepoint(proj.x, proj.y):
+                    continue
+                if events is not None and not events.despawn(obj.ship.projectiles, proj):
+                    continue
+                self.hp -= proj.damage
+                caught.append(proj)
+                if self.hp <= 0:
+                    break
+            if events is None:
+                compact(obj.ship.projectiles, caught)
 
     def expired(self) -> bool:
         return self.lifetime <= 0 or self.hp <= 0
@@ -12,6 +12,8 @@ ASTEROID_TYPES = {
 class Asteroid:
     """Small asteroid that can contain extractable resources."""
 
+    __slots__ = ("name", "x", "y", "radius", "kind", "color", "resources", "resistance")
+
     _id_counter = 1
 
     def __init__(
@@ -1,29 +1,11 @@
 import pygame
 import math
 import random
+import numpy as np
 import config
+from particles import PARTICLES
 
 
-class _Particle:
-    """Simple particle that orbits the black hole."""
-
-    def __init__(self, hole: "BlackHole") -> None:
-        self.angle = random.uniform(0, math.tau)
-        # Particles now span the full gravitational range for a wider swirl
-        self.radius = random.uniform(hole.radius, hole.pull_range)
-        self.speed = random.uniform(0.5, 1.2)
-        self.size = random.randint(1, 3)
-        # Dark purple hue for a more ominous effect
-        self.color = (80, 0, 80)
-        self.lifetime = random.uniform(4.0, 8.0)
-
-    def update(self, dt: float) -> None:
-        self.angle += self.speed * dt
-        self.lifetime -= dt
-
-    def expired(self) -> bool:
-        return self.lifetime <= 0
-
 class BlackHole:
     """Dangerous anomaly that pulls nearby ships."""
 
@@ -34,9 +16,8 @@ class BlackHole:
         self.radius = radius if radius is not None else config.BLACKHOLE_RADIUS
         self.pull_range = pull_range if pull_range is not None else config.BLACKHOLE_RANGE
         self.strength = strength if strength is not None else config.BLACKHOLE_STRENGTH
-        self.particles: list[_Particle] = []
-        for _ in range(30):
-            self.particles.append(_Particle(self))
+        self.emitter = PARTICLES.new_emitter()
+        self._swirl(30)
 
     @staticmethod
     def random_blackhole(xmin: int, xmax: int, ymin: int, ymax: int):
@@ -44,13 +25,26 @@ class BlackHole:
         y = random.randint(ymin, ymax)
         return BlackHole(x, y)
 
+    def _swirl(self, count: int) -> None:
+        """Spawn ``count`` particles orbiting across the full gravitational range."""
+        PARTICLES.emit_orbit(
+            self.emitter,
+            self.x,
+            self.y,
+            np.random.uniform(0, math.tau, count),
+            np.random.uniform(self.radius, self.pull_range, count),
+            np.random.uniform(0.5, 1.2, count),
+            np.random.uniform(4.0, 8.0, count),
+            size=np.random.randint(1, 4, count),
+            # Dark purple hue for a more ominous effect
+            color=(80, 0, 80),
+        )
+
     def update(self, dt: float) -> None:
-        """Advance particle animation."""
-        for p in list(self.particles):
-            p.update(dt)
-            if p.expired():
-                self.particles.remove(p)
-                self.particles.append(_Particle(self))
+        """Top the swirl back up; the engine animates the particles."""
+        missing = 30 - PARTICLES.count(self.emitter)
+        if missing > 0:
+            self._swirl(missing)
 
     def draw(self, screen: pygame.Surface, offset_x: float = 0,
              offset_y: float = 0, zoom: float = 1.0) -> None:
@@ -76,10 +70,7 @@ class BlackHole:
             screen.blit(halo, (center[0] - halo_radius, center[1] - halo_radius))
 
         # Draw orbiting particles in a dark purple hue
-        for p in self.particles:
-            px = center[0] + int(math.cos(p.angle) * p.radius * zoom)
-            py = center[1] + int(math.sin(p.angle) * p.radius * zoom)
-            pygame.draw.circle(screen, p.color, (px, py), max(1, int(p.size * zoom)))
+        PARTICLES.draw(screen, offset_x, offset_y, zoom, emitter=self.emitter)
 
         pygame.draw.circle(screen, (80, 0, 80), center, scaled_radius, 1)
 
@@ -116,7 +107,10 @@ class TemporaryBlackHole(BlackHole):
 
     def update(self, dt: float) -> None:
         self.lifetime -= dt
-        super().update(dt)
+        if self.expired():
+            PARTICLES.kill(self.emitter)
+        else:
+            super().update(dt)
 
     def expired(self) -> bool:
         return self.lifetime <= 0
@@ -2,8 +2,14 @@ import math
 import random
 from dataclasses import dataclass, field
 from typing import List
+import numpy as np
 import pygame
 import config
+from spatial_index import first_hits
+from threat_map import ThreatMap
+from combat_events import CombatEvents, compact, deal_damage
+from pool import Pool
+from particles import PARTICLES
 
 
 @dataclass
@@ -27,7 +33,7 @@ class Weapon:
         if not self.can_fire():
             return None
         self._timer = 0.0
-        return Projectile(x, y, tx, ty, self.speed, self.damage)
+        return Projectile.pool.acquire(x, y, tx, ty, self.speed, self.damage)
 
     def fire_homing(self, x: float, y: float, target, turn_rate: float = config.HOMING_PROJECTILE_TURN_RATE):
         """Fire a projectile that homes in on ``target``."""
@@ -38,7 +44,32 @@ class Weapon:
 
 
 class Projectile:
-    """Projectile fired by a weapon with optional curvature and range."""
+    """Projectile fired by a weapon with optional curvature and range.
+
+    Plain projectiles are recycled through ``Projectile.pool``; create them
+    with ``Projectile.pool.acquire(...)`` and release them once they die.
+    ``generation`` changes every time an instance is reused, so code that
+    keeps a projectile across frames can tell it has become a new shot.
+    Owners draw them through :func:`render_projectiles` so that, once a
+    ``Projectile.batch`` is installed, every owner's shots share one pass.
+    """
+
+    __slots__ = (
+        "x",
+        "y",
+        "damage",
+        "vx",
+        "vy",
+        "curvature",
+        "max_distance",
+        "traveled",
+        "trail_color",
+        "trail",
+        "generation",
+    )
+
+    pool: Pool
+    batch: "ProjectileBatch | None" = None
 
     def __init__(
         self,
@@ -51,6 +82,20 @@ class Projectile:
         curvature: float = 0.0,
         max_distance: float = config.PROJECTILE_MAX_DISTANCE,
         trail_color: tuple[int, int, int] | None = None,
+    ) -> None:
+        self.reset(x, y, tx, ty, speed, damage, curvature, max_distance, trail_color)
+
+    def reset(
+        self,
+        x: float,
+        y: float,
+        tx: float,
+        ty: float,
+        speed: float,
+        damage: int,
+        curvature: float = 0.0,
+        max_distance: float = config.PROJECTILE_MAX_DISTANCE,
+        trail_color: tuple[int, int, int] | None = None,
     ) -> None:
         self.x = x
         self.y = y
@@ -65,6 +110,7 @@ class Projectile:
         self.traveled = 0.0
         self.trail_color = trail_color
         self.trail: list[tuple[float, float]] = []
+        self.generation = getattr(self, "generation", -1) + 1
 
     def update(self, dt: float) -> None:
         self.x += self.vx * dt
@@ -98,6 +144,121 @@ class Projectile:
         pygame.draw.circle(screen, (255, 50, 50), pos, radius)
 
 
+Projectile.pool = Pool(Projectile)
+
+_HEAD_SPRITES: dict[int, pygame.Surface] = {}
+
+
+def _head_sprite(radius: int) -> pygame.Surface:
+    sprite = _HEAD_SPRITES.get(radius)
+    if sprite is None:
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+        sprite.set_colorkey((0, 0, 0))
+        pygame.draw.circle(sprite, (255, 50, 50), (radius, radius), radius)
+        _HEAD_SPRITES[radius] = sprite
+    return sprite
+
+
+def draw_projectiles(
+    screen: pygame.Surface,
+    projectiles: list,
+    offset_x: float = 0.0,
+    offset_y: float = 0.0,
+    zoom: float = 1.0,
+) -> None:
+    """Draw projectiles with their positions and trails transformed in bulk.
+
+    Shots further than ``config.PROJECTILE_CULL_MARGIN`` pixels off screen
+    are skipped. Plain heads are blitted from one cached sprite; subclasses
+    with their own look fall back to their ``draw``.
+    """
+    plain = []
+    for proj in projectiles:
+        if type(proj).draw is Projectile.draw:
+            plain.append(proj)
+        else:
+            proj.draw(screen, offset_x, offset_y, zoom)
+    if not plain:
+        return
+    origin = np.array((offset_x, offset_y))
+    pos = np.fromiter(
+        (v for proj in plain for v in (proj.x, proj.y)), float, len(plain) * 2
+    ).reshape(-1, 2)
+    pos = ((pos - origin) * zoom).astype(int)
+    width, height = screen.get_size()
+    margin = config.PROJECTILE_CULL_MARGIN
+    seen = (
+        (pos[:, 0] >= -margin)
+        & (pos[:, 0] < width + margin)
+        & (pos[:, 1] >= -margin)
+        & (pos[:, 1] < height + margin)
+    )
+    visible = np.flatnonzero(seen).tolist()
+    trails = [plain[i] for i in visible if plain[i].trail_color and len(plain[i].trail) > 1]
+    if trails:
+        points = np.array([pt for proj in trails for pt in proj.trail])
+        points = ((points - origin) * zoom).astype(int).tolist()
+        line_w = max(1, int(2 * zoom))
+        start = 0
+        for proj in trails:
+            end = start + len(proj.trail)
+            pygame.draw.lines(screen, proj.trail_color, False, points[start:end], line_w)
+            start = end
+    radius = max(1, int(3 * zoom))
+    sprite = _head_sprite(radius)
+    screen.blits(
+        [(sprite, (x - radius, y - radius)) for x, y in pos[seen].tolist()],
+        doreturn=False,
+    )
+
+
+class ProjectileBatch:
+    """Collect projectiles from every owner and draw them in one pass.
+
+    Shots queued with the same screen and camera are drawn together on
+    :meth:`flush`; a change of camera flushes what was queued before.
+    """
+
+    def __init__(self) -> None:
+        self._view: tuple | None = None
+        self._pending: list = []
+
+    def add(
+        self,
+        screen: pygame.Surface,
+        projectiles: list,
+        offset_x: float,
+        offset_y: float,
+        zoom: float,
+    ) -> None:
+        view = (screen, offset_x, offset_y, zoom)
+        if view != self._view:
+            self.flush()
+            self._view = view
+        self._pending.extend(projectiles)
+
+    def flush(self) -> None:
+        if self._pending:
+            screen, offset_x, offset_y, zoom = self._view
+            draw_projectiles(screen, self._pending, offset_x, offset_y, zoom)
+            self._pending.clear()
+        self._view = None
+
+
+def render_projectiles(
+    screen: pygame.Surface,
+    projectiles: list,
+    offset_x: float = 0.0,
+    offset_y: float = 0.0,
+    zoom: float = 1.0,
+) -> None:
+    """Queue ``projectiles`` on ``Projectile.batch``, or draw them now if unset."""
+    if Projectile.batch is not None:
+        Projectile.batch.add(screen, projectiles, offset_x, offset_y, zoom)
+    else:
+        draw_projectiles(screen, projectiles, offset_x, offset_y, zoom)
+
+
 class HomingProjectile(Projectile):
     """Projectile that gradually turns to follow a moving target."""
 
@@ -204,6 +365,37 @@ class Shield:
         self.strength = max(0.0, self.strength - amount)
 
 
+def probe_beams(beams: list, targets: list) -> None:
+    """Lock every probing beam onto the first body along it.
+
+    All beams are tested against all bodies in one NumPy pass, so callers
+    with several beams should probe them together before updating them.
+    """
+    probing = [beam for beam in beams if beam.state == "probe"]
+    if not probing:
+        return
+    bodies = []
+    for obj in targets:
+        target = getattr(obj, "ship", obj)
+        if hasattr(target, "x") and hasattr(target, "y") and hasattr(target, "size"):
+            bodies.append(target)
+    if not bodies:
+        return
+    seg = np.array([beam.segment() for beam in probing], dtype=float)
+    idx, _ = first_hits(
+        seg[:, 0],
+        seg[:, 1],
+        seg[:, 2],
+        seg[:, 3],
+        [b.x for b in bodies],
+        [b.y for b in bodies],
+        [b.size / 2 for b in bodies],
+    )
+    for beam, i in zip(probing, idx):
+        if i >= 0:
+            beam.lock(bodies[i])
+
+
 class LaserBeam:
     """Laser beam with probe and channelling phases."""
 
@@ -236,6 +428,15 @@ class LaserBeam:
         ey = y1 + math.sin(self.angle) * self.length
         return ex, ey
 
+    def segment(self) -> tuple[float, float, float, float]:
+        return (*self._start_point(), *self._end_point())
+
+    def lock(self, target) -> None:
+        """Start channelling into ``target``."""
+        self.target = target
+        self.state = "channel"
+        self.timer = self.channel_time
+
     def hits(self, target) -> bool:
         px, py = target.x, target.y
         half = target.size / 2
@@ -251,20 +452,12 @@ class LaserBeam:
         dist = math.hypot(px - cx, py - cy)
         return dist <= half
 
-    def update(self, dt: float, targets: list) -> None:
+    def update(
+        self, dt: float, targets: list, events: CombatEvents | None = None
+    ) -> None:
         if self.state == "probe":
-            for obj in targets:
-                target = getattr(obj, "ship", obj)
-                if (
-                    hasattr(target, "x")
-                    and hasattr(target, "y")
-                    and hasattr(target, "size")
-                    and self.hits(target)
-                ):
-                    self.target = target
-                    self.state = "channel"
-                    self.timer = self.channel_time
-                    break
+            if targets:
+                probe_beams([self], targets)
             self.timer -= dt
             if self.timer <= 0 and self.state != "channel":
                 self.state = "fizzle"
@@ -280,7 +473,7 @@ class LaserBeam:
                     self.state = "done"
                 else:
                     self.angle = math.atan2(dy, dx)
-                    self.target.take_damage(self.damage_rate * dt)
+                    deal_damage(events, self.target, self.damage_rate * dt, self)
                     self.timer -= dt
                     if self.timer <= 0:
                         self.state = "done"
@@ -530,7 +723,7 @@ class Drone:
         self.x = owner.x
         self.y = owner.y
 
-    def update(self, dt: float, targets: List) -> None:
+    def update(self, dt: float, targets: List, threats: ThreatMap | None = None) -> None:
         self.lifetime -= dt
         self.angle += self.orbit_speed * dt
         self.x = self.owner.x + math.cos(self.angle) * self.radius
@@ -538,9 +731,9 @@ class Drone:
         if self._timer > 0:
             self._timer -= dt
         else:
-            target = self._find_target(targets)
+            target = self._find_target(targets, threats)
             if target:
-                proj = Projectile(
+                proj = Projectile.pool.acquire(
                     self.x,
                     self.y,
                     target.ship.x,
@@ -550,15 +743,18 @@ class Drone:
                 )
                 self.projectiles.append(proj)
                 self._timer = self.fire_cooldown
-        for proj in list(self.projectiles):
+        for proj in self.projectiles:
             proj.update(dt)
-            if proj.expired():
-                self.projectiles.remove(proj)
+        dead = [p for p in self.projectiles if p.expired()]
+        compact(self.projectiles, dead)
+        Projectile.pool.release_all(dead)
 
-    def _find_target(self, targets: List):
+    def _find_target(self, targets: List, threats: ThreatMap | None = None):
         nearest = None
         # Increased engagement range
         min_d = 250.0
+        if threats is not None:
+            return threats.nearest_ship(self.x, self.y, min_d)[0]
         for obj in targets:
             d = math.hypot(obj.ship.x - self.x, obj.ship.y - self.y)
             if d < min_d:
@@ -578,8 +774,7 @@ class Drone:
     ) -> None:
         pos = (int((self.x - offset_x) * zoom), int((self.y - offset_y) * zoom))
         pygame.draw.circle(screen, (150, 150, 255), pos, max(2, int(5 * zoom)))
-        for proj in self.projectiles:
-            proj.draw(screen, offset_x, offset_y, zoom)
+        render_projectiles(screen, self.projectiles, offset_x, offset_y, zoom)
 
 
 class LaserWeapon(Weapon):
@@ -662,7 +857,12 @@ class IonSymbiontShot(Projectile):
         self.timer = 3.0  # deal damage over 3 seconds
         self.exploding = False
 
-    def update(self, dt: float, targets: list | None = None) -> None:
+    def update(
+        self,
+        dt: float,
+        targets: list | None = None,
+        events: CombatEvents | None = None,
+    ) -> None:
         if self.exploding:
             self.timer -= dt
             return
@@ -687,7 +887,7 @@ class IonSymbiontShot(Projectile):
             self.y = self.target.y + self.offset[1]
             if self.timer > 0:
                 damage_rate = self.damage / 3.0
-                self.target.take_damage(damage_rate * dt)
+                deal_damage(events, self.target, damage_rate * dt, self)
                 self.timer -= dt
             if self.timer <= 0:
                 self.exploding = True
@@ -804,42 +1004,7 @@ class ChronoTachionicWhip(Weapon):
             self._field_timer = 0.0
             return SlowField(self.owner, tx, ty, radius=250)
         speed = self.speed * 0.95
-        return Projectile(x, y, tx, ty, speed, self.damage)
-
-
-class _SporeParticle:
-    """Small particle emitted by a ``SporeCloud``."""
-
-    def __init__(self, cloud) -> None:
-        ang = cloud.angle + random.uniform(-cloud.arc / 2, cloud.arc / 2)
-        dist = random.uniform(0, cloud.radius)
-        self.target_x = cloud.x + math.cos(ang) * dist
-        self.target_y = cloud.y + math.sin(ang) * dist
-        self.x = cloud.x
-        self.y = cloud.y
-        travel_time = 0.4
-        self.vx = (self.target_x - self.x) / travel_time
-        self.vy = (self.target_y - self.y) / travel_time
-        self._move_timer = 0.0
-        self._move_duration = travel_time
-        self.max_life = cloud.duration
-        self.life = self.max_life
-
-    def update(self, dt: float) -> None:
-        if self._move_timer < self._move_duration:
-            step = min(dt, self._move_duration - self._move_timer)
-            self.x += self.vx * step
-            self.y += self.vy * step
-            self._move_timer += step
-            if self._move_timer >= self._move_duration:
-                self.x = self.target_x
-                self.y = self.target_y
-                self.vx = 0.0
-                self.vy = 0.0
-        self.life -= dt
-
-    def expired(self) -> bool:
-        return self.life <= 0
+        return Projectile.pool.acquire(x, y, tx, ty, speed, self.damage)
 
 
 class SporeCloud:
@@ -874,7 +1039,7 @@ class SporeCloud:
         self.damage = damage
         self.timer = 0.0
         self._tick = 0.0
-        self.particles: list[_SporeParticle] = []
+        self.emitter = PARTICLES.new_emitter()
 
         # Shorten the radius if a structure falls inside the cone
         if structures:
@@ -901,17 +1066,32 @@ class SporeCloud:
     def update(self, dt: float) -> bool:
         self.timer += dt
         self._tick += dt
-        if len(self.particles) < 60:
-            self.particles.append(_SporeParticle(self))
-        for p in list(self.particles):
-            p.update(dt)
-            if p.expired():
-                self.particles.remove(p)
+        if self.expired():
+            PARTICLES.kill(self.emitter)
+        elif PARTICLES.count(self.emitter) < config.SPORE_CLOUD_PARTICLES:
+            self._emit_spore()
         if self._tick >= 1.0:
             self._tick -= 1.0
             return True
         return False
 
+    def _emit_spore(self) -> None:
+        """Release one spore that drifts to a random point in the cone and settles."""
+        ang = self.angle + random.uniform(-self.arc / 2, self.arc / 2)
+        dist = random.uniform(0, self.radius)
+        travel_time = 0.4
+        PARTICLES.emit(
+            self.emitter,
+            self.x,
+            self.y,
+            math.cos(ang) * dist / travel_time,
+            math.sin(ang) * dist / travel_time,
+            life=self.duration,
+            size=math.ceil(1 * 1.15),
+            color=(120, 200, 120),
+            move=travel_time,
+        )
+
     def expired(self) -> bool:
         return self.timer >= self.duration
 
@@ -923,15 +1103,7 @@ class SporeCloud:
         zoom: float = 1.0,
     ) -> None:
         # Damage cone is invisible; only draw particles
-        for p in self.particles:
-            px = int((p.x - offset_x) * zoom)
-            py = int((p.y - offset_y) * zoom)
-            alpha = max(0, min(255, int(p.life / p.max_life * 255)))
-            size = int(math.ceil(3 * 1.15))
-            radius = int(math.ceil(1 * 1.15))
-            surf = pygame.Surface((size, size), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (120, 200, 120, alpha), (size // 2, size // 2), radius)
-            screen.blit(surf, (px - size // 2, py - size // 2))
+        PARTICLES.draw(screen, offset_x, offset_y, zoom, emitter=self.emitter)
 
 
 class SporesWeapon(Weapon):
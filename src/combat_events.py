@@ -0,0 +1,114 @@
+"""Per-tick combat event buffer with a single resolution phase."""
+
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass
+class CombatEvent:
+    """Something that happened during a tick's collision phase.
+
+    ``kind`` is ``"hit"``, ``"explosion"``, ``"kill"`` or ``"despawn"``.
+    Hits carry the damage ``amount`` dealt to ``target`` by ``source``;
+    explosions carry their position and ``radius``.
+    """
+
+    kind: str
+    target: object = None
+    source: object = None
+    amount: float = 0.0
+    x: float = 0.0
+    y: float = 0.0
+    radius: float = 0.0
+
+
+class CombatEvents:
+    """Collect hits, explosions and despawns, then apply them in one go.
+
+    Collision code records what happened instead of mutating state, so no
+    list is changed while it is being iterated. :meth:`resolve` applies the
+    damage summed per target, compacts every touched projectile list once
+    and hands the tick's events to subscribers.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[CombatEvent] = []
+        self._damage: dict[int, list] = {}
+        self._despawn: dict[int, tuple[list, set[int]]] = {}
+        self._gone: set[int] = set()
+        self._subscribers: list[Callable[[list[CombatEvent]], None]] = []
+
+    def subscribe(self, callback: Callable[[list[CombatEvent]], None]) -> None:
+        """Call ``callback(events)`` after every :meth:`resolve`."""
+        self._subscribers.append(callback)
+
+    def hit(self, target, amount: float, source=None) -> None:
+        self.events.append(CombatEvent("hit", target, source, amount))
+        entry = self._damage.get(id(target))
+        if entry is None:
+            self._damage[id(target)] = [target, amount]
+        else:
+            entry[1] += amount
+
+    def explosion(self, x: float, y: float, radius: float, source=None) -> None:
+        self.events.append(CombatEvent("explosion", source=source, x=x, y=y, radius=radius))
+
+    def despawn(self, container: list, obj) -> bool:
+        """Mark ``obj`` for removal from ``container``; ``False`` if already gone."""
+        if id(obj) in self._gone:
+            return False
+        self._gone.add(id(obj))
+        bucket = self._despawn.get(id(container))
+        if bucket is None:
+            bucket = self._despawn[id(container)] = (container, set())
+        bucket[1].add(id(obj))
+        self.events.append(CombatEvent("despawn", target=obj))
+        return True
+
+    def gone(self, obj) -> bool:
+        return id(obj) in self._gone
+
+    def resolve(self) -> list[CombatEvent]:
+        """Apply the buffered effects and return the tick's events."""
+        for target, amount in self._damage.values():
+            before = getattr(target, "hull", None)
+            target.take_damage(amount)
+            if before is not None and before > 0 and target.hull <= 0:
+                self.events.append(CombatEvent("kill", target))
+        for container, ids in self._despawn.values():
+            container[:] = [obj for obj in container if id(obj) not in ids]
+        events = self.events
+        self.events = []
+        self._damage.clear()
+        self._despawn.clear()
+        self._gone.clear()
+        for callback in self._subscribers:
+            callback(events)
+        return events
+
+
+def deal_damage(events: CombatEvents | None, target, amount: float, source=None) -> None:
+    """Record a hit on ``events`` or apply it at once when there is no buffer."""
+    if events is None:
+        target.take_damage(amount)
+    else:
+        events.hit(target, amount, source)
+
+
+def in_play(events: CombatEvents | None, items: list) -> list:
+    """Return the entries of ``items`` not despawned on ``events`` this tick.
+
+    Despawned projectiles stay in their lists until :meth:`CombatEvents.resolve`;
+    loops that move or collide projectiles go through this so an absorbed
+    shot cannot still hit something later in the same tick.
+    """
+    if events is None or not events._gone:
+        return items
+    return [obj for obj in items if not events.gone(obj)]
+
+
+def compact(items: list, dead: list) -> None:
+    """Drop ``dead`` from ``items`` in one pass instead of repeated ``remove``."""
+    if dead:
+        ids = {id(obj) for obj in dead}
+        items[:] = [obj for obj in items if id(obj) not in ids]
@@ -72,6 +72,7 @@ ORBIT_PROJECTILE_CURVATURE = 4.0        # radians per second of bullet curve
 ORBIT_TRIGGER_RANGE = 350   # max distance to start an orbit
 PROJECTILE_MAX_DISTANCE = 1200          # maximum distance a projectile can travel
 HOMING_PROJECTILE_TURN_RATE = 6.0       # rad/s a guided projectile can turn
+PROJECTILE_CULL_MARGIN = 60             # screen pixels past the edge a projectile still draws
 PIRATE_TURRET_RANGE = 500               # engagement range for Pirate capital turrets
 
 SECTOR_WIDTH = 2000
@@ -211,3 +212,77 @@ STATION_PRICE_UPDATE_PERIOD = 1.0
 STATION_MIN_PRICE_MULT = 0.5
 STATION_MAX_PRICE_MULT = 1.5
 
+
+# --- Trade route queries -----------------------------------------------------
+# Cached trade routes are dropped once a station price drifts this fraction
+# away from the value used to build them
+TRADE_CACHE_PRICE_THRESHOLD = 0.05
+# Route origins are snapped to cells of this size when caching results
+TRADE_CACHE_CELL = 250
+# Number of best-paying destinations considered for each purchase
+TRADE_SELL_CANDIDATES = 3
+
+# --- Navigation graph --------------------------------------------------------
+NAV_LINK_RANGE = 1500          # longest straight leg between two waypoints
+NAV_SYSTEM_GATES = 8           # waypoints placed around each star system
+NAV_SYSTEM_MARGIN = 60         # gap between a system's outer orbit and its waypoints
+NAV_BLACKHOLE_CLEARANCE = 200  # distance routes keep from black hole cores
+NAV_OBSTACLE_MARGIN = 40       # clearance kept around capital ships
+NAV_OBSTACLE_TOLERANCE = 50    # capital ship movement that triggers an edge update
+NAV_WAYPOINT_RADIUS = 40       # intermediate waypoints count as reached within this
+NAV_DETOUR_DISTANCE = 80       # sidestep taken when autopilot bumps into something
+NAV_MAX_DETOURS = 8            # consecutive detours before autopilot gives up
+NAV_TRANSIT_TIMEOUT = WORMHOLE_DELAY + 3.0  # seconds to wait at a wormhole or portal
+
+# --- Flow field navigation ---------------------------------------------------
+FLOW_FIELD_CELL = 50           # world pixels per flow field cell
+FLOW_FIELD_CACHE = 8           # destination fields kept before evicting the oldest
+FLOW_FIELD_MARGIN = 20         # extra clearance stamped around obstacles
+FLOW_FIELD_ARRIVE_RADIUS = 60  # ships following a field stop this close to its goal
+
+# --- NPC fleets --------------------------------------------------------------
+FLEET_ESCORTS_PER_CAPITAL = 6  # lightweight escorts patrolling each capital ship
+FLEET_PATROL_RADIUS = 900      # how far from their capital ship escorts patrol
+FLEET_FORMATION_RADIUS = 120   # spread of escorts around their rally point
+FLEET_IDLE_TIME = 6.0          # seconds a group waits before picking a new rally point
+FLEET_PROMOTE_RANGE = 600      # escorts closer than this become full ships
+FLEET_DEMOTE_RANGE = 900       # promoted escorts beyond this return to the fleet
+
+# --- Spatial index -----------------------------------------------------------
+SPATIAL_INDEX_CELL = 200       # grid cell size used to bucket bodies
+
+# --- Threat map --------------------------------------------------------------
+THREAT_MAP_CELL = 250          # grid cell size used to bucket hostile ships and shots
+
+# --- AI scheduling -----------------------------------------------------------
+AI_FRAME_BUDGET_MS = 2.0       # milliseconds of AI thinking allowed per frame
+AI_MAX_DEFER = 0.5             # seconds a thinker may be deferred before it runs anyway
+AI_TURRET_THINK_RATE = 8.0     # turret target acquisitions per second
+AI_DRONE_THINK_RATE = 6.0      # drone decisions per second
+AI_ARM_THINK_RATE = 1.0        # Solar Dominion arm retargets per second
+AI_CREATURE_THINK_RATE = 5.0   # planet creature decisions per second
+
+# --- Object pools ------------------------------------------------------------
+POOL_CAPACITY = 1024           # spare objects each pool keeps for reuse
+SPORE_CLOUD_PARTICLES = 60     # particles alive in a spore cloud at once
+
+# --- Particle engine ---------------------------------------------------------
+PARTICLE_BUDGET = 4000         # particles alive across every emitter at once
+PARTICLE_SOFT_LIMIT = 0.75     # share of the budget after which emission thins out
+PARTICLE_ALPHA_LEVELS = 8      # fade steps cached per dot sprite
+EMP_WAVE_PARTICLES = 48        # dots forming an EMP shock ring
+
+# --- Garbage collection ------------------------------------------------------
+GC_GAMEPLAY_THRESHOLDS = (5000, 20, 40)  # gen0/gen1/gen2 thresholds while flying
+GC_IDLE_INTERVAL = 2.0         # seconds a modal screen stays open between full collections
+GC_REPORT_ON_EXIT = False      # print collector pauses and pool usage when the game closes
+
+# --- Terrain flags -----------------------------------------------------------
+TERRAIN_FLAG_RESOLUTION = 2    # surface pixels per terrain flag cell
+RIVER_INDEX_CELL = 120         # grid cell size used to bucket river segments
+TERRAIN_TILE_SIZE = 512        # side of the pre-composited static terrain tiles
+
+# --- Planet creatures --------------------------------------------------------
+CREATURE_GRID_CELL = 200       # world pixels per creature grid cell
+CREATURE_WAKE_RADIUS = 900     # creatures farther than this from the explorer sleep
+CREATURE_CHASE_RADIUS = 200    # hostile creatures chase the explorer within this range
@@ -0,0 +1,201 @@
+"""Struct-of-arrays simulation for the creatures on a planet surface.
+
+Creatures are bucketed into a coarse grid and only those in cells near the
+explorer are awake; sleeping creatures neither think nor move, so a surface
+can hold hundreds of them. Awake creatures decide and move in vectorized
+passes, and hostiles chasing the explorer follow a flow field over the
+surface's blocked grid that is rebuilt only when the explorer changes cell.
+"""
+
+import math
+
+import numpy as np
+import pygame
+
+import config
+from flow_field import FlowField, integrate_cost
+
+
+class CreatureManager:
+    """Simulate :class:`~planet_surface.Creature` records in bulk.
+
+    Positions and velocities live in parallel arrays. After each update the
+    awake creatures' state is written back to their ``Creature`` objects;
+    sleeping ones do not move, so their objects never go stale.
+    """
+
+    _FLOAT_FIELDS = ("x", "y", "vx", "vy", "speed", "size")
+
+    def __init__(
+        self,
+        world_w: int,
+        world_h: int,
+        cell: int = config.CREATURE_GRID_CELL,
+    ) -> None:
+        self.world_w = world_w
+        self.world_h = world_h
+        self.cell = cell
+        self.count = 0
+        for name in self._FLOAT_FIELDS:
+            setattr(self, name, np.zeros(16))
+        self.hostile = np.zeros(16, dtype=bool)
+        self.chasing = np.zeros(16, dtype=bool)
+        self.awake = np.zeros(16, dtype=bool)
+        self.col = np.zeros(16, dtype=np.int32)
+        self.row = np.zeros(16, dtype=np.int32)
+        self.creatures: list = []
+        self._blocked: np.ndarray | None = None
+        self._blocked_cell = 1
+        self._field: FlowField | None = None
+        self._field_cell: tuple[int, int] | None = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        return iter(self.creatures)
+
+    def _grow(self) -> None:
+        capacity = len(self.x) * 2
+        for name in self._FLOAT_FIELDS + ("hostile", "chasing", "awake", "col", "row"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+
+    def add(self, creature) -> int:
+        """Take over simulation of ``creature`` and return its index."""
+        if self.count == len(self.x):
+            self._grow()
+        i = self.count
+        self.count += 1
+        self.x[i] = creature.x
+        self.y[i] = creature.y
+        self.vx[i] = creature.vx
+        self.vy[i] = creature.vy
+        self.speed[i] = creature.speed
+        self.size[i] = creature.size
+        self.hostile[i] = creature.hostile
+        self.chasing[i] = creature.chasing
+        self.col[i] = int(creature.x // self.cell)
+        self.row[i] = int(creature.y // self.cell)
+        self.creatures.append(creature)
+        return i
+
+    def set_obstacles(self, blocked, cell: int) -> None:
+        """Use the ``cell``-pixel ``blocked`` grid for chase paths."""
+        self._blocked = np.asarray(blocked, dtype=bool)
+        self._blocked_cell = cell
+        self._field = None
+        self._field_cell = None
+
+    def _flow(self, x: float, y: float) -> FlowField | None:
+        if self._blocked is None or not self._blocked.size:
+            return None
+        rows, cols = self._blocked.shape
+        key = (
+            min(rows - 1, max(0, int(y // self._blocked_cell))),
+            min(cols - 1, max(0, int(x // self._blocked_cell))),
+        )
+        if key != self._field_cell:
+            cost = integrate_cost(self._blocked, *key)
+            self._field = FlowField(x, y, self._blocked_cell, cost)
+            self._field_cell = key
+        return self._field
+
+    def wake(self, x: float, y: float, radius: float = config.CREATURE_WAKE_RADIUS) -> None:
+        """Wake creatures in grid cells within ``radius`` of ``(x, y)``; the rest sleep."""
+        n = self.count
+        reach = math.ceil(radius / self.cell)
+        c = int(x // self.cell)
+        r = int(y // self.cell)
+        self.awake[:n] = (np.abs(self.col[:n] - c) <= reach) & (
+            np.abs(self.row[:n] - r) <= reach
+        )
+
+    def think(self, target_x: float, target_y: float, elapsed: float) -> None:
+        """Vectorized :meth:`Creature.think` for every awake creature."""
+        n = self.count
+        awake = self.awake[:n]
+        hostile = awake & self.hostile[:n]
+        if hostile.any():
+            idx = np.flatnonzero(hostile)
+            dx = target_x - self.x[idx]
+            dy = target_y - self.y[idx]
+            dist = np.hypot(dx, dy)
+            chasing = (dist > 0) & (dist < config.CREATURE_CHASE_RADIUS)
+            self.chasing[idx] = chasing
+            idx = idx[chasing]
+            if len(idx):
+                dx = dx[chasing] / dist[chasing]
+                dy = dy[chasing] / dist[chasing]
+                field = self._flow(target_x, target_y)
+                if field is not None:
+                    fx, fy = field.sample_many(self.x[idx], self.y[idx])
+                    # Close enough to skip the grid and lunge straight in
+                    far = dist[chasing] > self._blocked_cell
+                    dx = np.where(far, fx, dx)
+                    dy = np.where(far, fy, dy)
+                self.vx[idx] = dx * self.speed[idx]
+                self.vy[idx] = dy * self.speed[idx]
+        # About 1.2 heading changes per second, as at 60 FPS before scheduling
+        wander = awake & ~self.hostile[:n]
+        wander &= np.random.random(n) < min(1.0, 1.2 * elapsed)
+        if wander.any():
+            idx = np.flatnonzero(wander)
+            ang = np.random.uniform(0, 2 * math.pi, len(idx))
+            self.vx[idx] = np.cos(ang) * self.speed[idx]
+            self.vy[idx] = np.sin(ang) * self.speed[idx]
+
+    def update(self, dt: float) -> None:
+        """Move awake creatures and refresh their grid cells and objects."""
+        idx = np.flatnonzero(self.awake[: self.count])
+        if not len(idx):
+            return
+        hostile = self.hostile[idx]
+        damp = np.where(hostile, np.where(self.chasing[idx], 1.0, 0.9), 0.98)
+        vx = self.vx[idx] * damp
+        vy = self.vy[idx] * damp
+        x = np.clip(self.x[idx] + vx * dt, 0, self.world_w - 1)
+        y = np.clip(self.y[idx] + vy * dt, 0, self.world_h - 1)
+        self.vx[idx] = vx
+        self.vy[idx] = vy
+        self.x[idx] = x
+        self.y[idx] = y
+        self.col[idx] = (x // self.cell).astype(np.int32)
+        self.row[idx] = (y // self.cell).astype(np.int32)
+        chasing = self.chasing[idx]
+        for k, i in enumerate(idx.tolist()):
+            creature = self.creatures[i]
+            creature.x = float(x[k])
+            creature.y = float(y[k])
+            creature.vx = float(vx[k])
+            creature.vy = float(vy[k])
+            creature.chasing = bool(chasing[k])
+
+    def hostile_contacts(self, x: float, y: float, radius: float) -> int:
+        """Return how many awake hostiles overlap a circle at ``(x, y)``."""
+        n = self.count
+        mask = self.awake[:n] & self.hostile[:n]
+        if not mask.any():
+            return 0
+        idx = np.flatnonzero(mask)
+        dist = np.hypot(self.x[idx] - x, self.y[idx] - y)
+        return int(np.count_nonzero(dist < self.size[idx] + radius))
+
+    def draw(self, screen: pygame.Surface, off_x: float, off_y: float) -> None:
+        """Draw the awake creatures that fall inside the view."""
+        n = self.count
+        sw, sh = screen.get_size()
+        half = self.size[:n] / 2
+        sx = self.x[:n] - off_x
+        sy = self.y[:n] - off_y
+        visible = (
+            self.awake[:n]
+            & (sx + half >= 0)
+            & (sx - half < sw)
+            & (sy + half >= 0)
+            & (sy - half < sh)
+        )
+        for i in np.flatnonzero(visible).tolist():
+            self.creatures[i].draw(screen, off_x, off_y)
@@ -0,0 +1,84 @@
+"""Instanced tree and stone sprites stamped onto planet surfaces.
+
+Each distinct tree or stone look is rendered once and then blitted wherever
+it is placed. Placements are queued and written with one ``Surface.blits``
+call per layer, together with their collision footprints.
+"""
+
+import pygame
+
+# Sprites are colour-keyed; this colour never appears in generated palettes
+_KEY = (255, 0, 255)
+_SOLID = (255, 255, 255, 255)
+
+
+def tree_radius(r: int) -> int:
+    """Return the drawn canopy radius for a tree of base size ``r``."""
+    # Trees are scaled up slightly for a denser look and then increased by
+    # an additional 10% as requested
+    return int(r * 1.38 * 1.15 * 1.2 * 1.10)
+
+
+class Decorations:
+    """Queue of decoration instances and the sprite palette they share."""
+
+    def __init__(self) -> None:
+        self._sprites: dict[tuple, pygame.Surface] = {}
+        self._art: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        self._solid: list[tuple[pygame.Surface, tuple[int, int]]] = []
+
+    def __len__(self) -> int:
+        return len(self._art)
+
+    def _tree_sprite(self, r: int, canopy: tuple, trunk: tuple) -> pygame.Surface:
+        key = ("tree", r, canopy, trunk)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            trunk_width = max(2, r // 2)
+            sprite = pygame.Surface((2 * r + 1, 3 * r + 1))
+            sprite.fill(_KEY)
+            sprite.set_colorkey(_KEY)
+            pygame.draw.rect(sprite, trunk, (r - trunk_width // 2, r, trunk_width, r * 2))
+            pygame.draw.circle(sprite, canopy, (r, r), r)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _footprint(self, width: int, height: int) -> pygame.Surface:
+        key = ("rect", width, height)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+            sprite.fill(_SOLID)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _disc(self, r: int, color: tuple) -> pygame.Surface:
+        key = ("disc", r, color)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((2 * r + 1, 2 * r + 1), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (r, r), r)
+            self._sprites[key] = sprite
+        return sprite
+
+    def tree(self, x: int, y: int, r: int, canopy: tuple, trunk: tuple) -> None:
+        """Queue a tree whose canopy centre is ``(x, y)``."""
+        r = tree_radius(r)
+        self._art.append((self._tree_sprite(r, canopy, trunk), (x - r, y - r)))
+        # Only the lower half of the trunk collides so canopies do not block
+        trunk_width = max(2, r // 2)
+        self._solid.append(
+            (self._footprint(trunk_width, r), (x - trunk_width // 2, y + r))
+        )
+
+    def stone(self, x: int, y: int, r: int, color: tuple = (80, 80, 80)) -> None:
+        """Queue a solid round stone centred on ``(x, y)``."""
+        self._art.append((self._disc(r, color), (x - r, y - r)))
+        self._solid.append((self._disc(r, _SOLID), (x - r, y - r)))
+
+    def flush(self, surface: pygame.Surface, collision_surface: pygame.Surface) -> None:
+        """Blit queued art and collision footprints, then empty the queue."""
+        surface.blits(self._art, doreturn=False)
+        collision_surface.blits(self._solid, doreturn=False)
+        self._art.clear()
+        self._solid.clear()
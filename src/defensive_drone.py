@@ -1,6 +1,8 @@
 import math
 import pygame
 import config
+from spatial_index import clip_motion
+from threat_map import ThreatMap
 
 
 class DefensiveDrone:
@@ -28,9 +30,33 @@ class DefensiveDrone:
         self.y = owner.y + math.sin(angle) * self.orbit_radius
         self.state = "idle"
         self.target = None
+        self._target_gen = None
+        # Set when an AI scheduler owns threat detection
+        self.scheduled = False
+        self.sighted = None
+        self._sighted_gen = None
+        self.thinker = None
 
-    def _find_threat(self, objects: list) -> object | None:
+    def think(self, objects: list, threats: ThreatMap | None = None) -> None:
+        """Look for a threat to intercept until the next decision."""
+        self.sighted = self._find_threat(objects, threats)
+        self._sighted_gen = getattr(self.sighted, "generation", None)
+
+    def _lock(self, threat) -> None:
+        """Chase ``threat``, remembering which life of a pooled shot it is."""
+        self.target = threat
+        self._target_gen = getattr(threat, "generation", None)
+
+    def _target_recycled(self) -> bool:
+        """Return ``True`` when the chased projectile was reused as a new shot."""
+        return getattr(self.target, "generation", None) != self._target_gen
+
+    def _find_threat(
+        self, objects: list, threats: ThreatMap | None = None
+    ) -> object | None:
         detection = config.DEF_DRONE_DETECTION_RANGE
+        if threats is not None:
+            return threats.first_threat(self.owner, detection)
         for obj in objects:
             dist = math.hypot(obj.ship.x - self.owner.x, obj.ship.y - self.owner.y)
             if dist <= detection:
@@ -41,7 +67,9 @@ class DefensiveDrone:
                     return proj
         return None
 
-    def update(self, dt: float, objects: list) -> None:
+    def update(
+        self, dt: float, objects: list, threats: ThreatMap | None = None
+    ) -> None:
         """Update the drone state while preserving its orbit angle."""
         # Advance the orbit angle even when intercepting so spacing is kept
         self.angle = (self.angle + self.orbit_speed * dt) % (2 * math.pi)
@@ -49,10 +77,18 @@ class DefensiveDrone:
         if self.state == "idle":
             self.x = self.owner.x + math.cos(self.angle) * self.orbit_radius
             self.y = self.owner.y + math.sin(self.angle) * self.orbit_radius
-            threat = self._find_threat(objects)
+            if self.scheduled:
+                threat = self.sighted
+                if getattr(threat, "generation", None) != self._sighted_gen:
+                    threat = self.sighted = None
+            else:
+                threat = self._find_threat(objects, threats)
             if threat:
-                self.target = threat
+                self._lock(threat)
                 self.state = "intercept"
+        elif self._target_recycled():
+            self.state = "idle"
+            self.target = None
         else:
             if isinstance(self.target, object):
                 tx = getattr(self.target, "x", self.owner.x)
@@ -64,8 +100,14 @@ class DefensiveDrone:
             dx = tx - self.x
             dy = ty - self.y
             dist = math.hypot(dx, dy) or 1.0
-            self.x += (dx / dist * self.intercept_speed) * dt
-            self.y += (dy / dist * self.intercept_speed) * dt
+            self.x, self.y = clip_motion(
+                getattr(self.owner, "_sectors", None),
+                self.x,
+                self.y,
+                self.x + (dx / dist * self.intercept_speed) * dt,
+                self.y + (dy / dist * self.intercept_speed) * dt,
+                self.size / 2,
+            )
             safe = (self.size + target_size) * 0.5
             if dist <= safe:
                 self.state = "idle"
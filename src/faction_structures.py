@@ -5,17 +5,20 @@ import math
 from dataclasses import dataclass, field
 from typing import Any
 from star import Star
-from combat import Drone, Bomb, GuidedMissile
+from combat import Drone, Bomb, GuidedMissile, render_projectiles
 from defensive_drone import DefensiveDrone
 from learning_defensive_drone import LearningDefensiveDrone
 from aggressive_defensive_drone import AggressiveDefensiveDrone
+from threat_map import ThreatMap
+from ai_scheduler import AIScheduler
+from combat_events import CombatEvents, compact, deal_damage, in_play
 from station import SpaceStation
 import pygame
 import config
 from tech_tree import ResearchManager
 
 
-@dataclass
+@dataclass(slots=True)
 class CityBuilding:
     """Simple decorative building used for Cosmic Guild cities."""
 
@@ -121,17 +124,21 @@ class Turret:
     orientation: float = field(init=False)
     offset_x: float = field(init=False)
     offset_y: float = field(init=False)
+    target: Any = field(default=None, init=False, repr=False)
+    scheduled: bool = field(default=False, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.orientation = self.angle
         self.offset_x = math.cos(self.angle) * self.length
         self.offset_y = math.sin(self.angle) * self.length
 
-    def update(self, dt: float, targets: list) -> None:
-        if self._timer > 0:
-            self._timer -= dt
-        base_x = self.owner.x + self.offset_x
-        base_y = self.owner.y + self.offset_y
+    def _nearest(
+        self, base_x: float, base_y: float, targets: list, threats: ThreatMap | None
+    ) -> tuple:
+        """Return the closest hostile ship to the turret base and its distance."""
+        if threats is not None:
+            en, min_d = threats.nearest_ship(base_x, base_y, config.PIRATE_TURRET_RANGE)
+            return (en.ship if en else None), min_d
         nearest = None
         min_d = float("inf")
         for obj in targets:
@@ -139,6 +146,32 @@ class Turret:
             if d < min_d:
                 min_d = d
                 nearest = obj.ship
+        return nearest, min_d
+
+    def think(self, targets: list, threats: ThreatMap | None = None) -> None:
+        """Pick the closest hostile ship as the turret's target."""
+        base_x = self.owner.x + self.offset_x
+        base_y = self.owner.y + self.offset_y
+        self.target = self._nearest(base_x, base_y, targets, threats)[0]
+
+    def _aim(
+        self, base_x: float, base_y: float, targets: list, threats: ThreatMap | None
+    ) -> tuple:
+        """Return the current target and its distance, thinking first when unscheduled."""
+        if not self.scheduled:
+            self.think(targets, threats)
+        if self.target is None:
+            return None, float("inf")
+        return self.target, math.hypot(self.target.x - base_x, self.target.y - base_y)
+
+    def update(
+        self, dt: float, targets: list, threats: ThreatMap | None = None
+    ) -> None:
+        if self._timer > 0:
+            self._timer -= dt
+        base_x = self.owner.x + self.offset_x
+        base_y = self.owner.y + self.offset_y
+        nearest, min_d = self._aim(base_x, base_y, targets, threats)
         if nearest and min_d <= config.PIRATE_TURRET_RANGE:
             desired = math.atan2(nearest.y - base_y, nearest.x - base_x)
             diff = (desired - self.orientation + math.pi) % (2 * math.pi) - math.pi
@@ -167,18 +200,14 @@ class Turret:
 class MissileTurret(Turret):
     """Turret variant that launches guided missiles."""
 
-    def update(self, dt: float, targets: list) -> None:
+    def update(
+        self, dt: float, targets: list, threats: ThreatMap | None = None
+    ) -> None:
         if self._timer > 0:
             self._timer -= dt
         base_x = self.owner.x + self.offset_x
         base_y = self.owner.y + self.offset_y
-        nearest = None
-        min_d = float("inf")
-        for obj in targets:
-            d = math.hypot(obj.ship.x - base_x, obj.ship.y - base_y)
-            if d < min_d:
-                min_d = d
-                nearest = obj.ship
+        nearest, min_d = self._aim(base_x, base_y, targets, threats)
         if nearest and min_d <= config.PIRATE_TURRET_RANGE:
             desired = math.atan2(nearest.y - base_y, nearest.x - base_x)
             diff = (desired - self.orientation + math.pi) % (2 * math.pi) - math.pi
@@ -212,23 +241,31 @@ class CityTurret(CityBuilding):
         self.projectiles: list = []
         self.turret = MissileTurret(self, 0.0, 0.0)
 
-    def update(self, dt: float, targets: list) -> None:
-        self.turret.update(dt, targets)
-        for proj in list(self.projectiles):
+    def update(
+        self,
+        dt: float,
+        targets: list,
+        threats: ThreatMap | None = None,
+        events: CombatEvents | None = None,
+    ) -> None:
+        self.turret.update(dt, targets, threats)
+        dead = []
+        for proj in in_play(events, self.projectiles):
             proj.update(dt)
             hit = False
             if not getattr(proj, "exploded", False):
                 for en in targets:
                     if math.hypot(proj.x - en.ship.x, proj.y - en.ship.y) <= en.ship.collision_radius:
-                        en.ship.take_damage(proj.damage)
+                        deal_damage(events, en.ship, proj.damage, self)
                         hit = True
                         break
             else:
                 for en in targets:
                     if math.hypot(proj.x - en.ship.x, proj.y - en.ship.y) <= proj.explosion_radius:
-                        en.ship.take_damage(proj.damage)
+                        deal_damage(events, en.ship, proj.damage, self)
             if hit or proj.expired():
-                self.projectiles.remove(proj)
+                dead.append(proj)
+        compact(self.projectiles, dead)
 
     def draw(
         self,
@@ -238,8 +275,7 @@ class CityTurret(CityBuilding):
         zoom: float = 1.0,
     ) -> None:
         super().draw(screen, offset_x, offset_y, zoom)
-        for proj in self.projectiles:
-            proj.draw(screen, offset_x, offset_y, zoom)
+        render_projectiles(screen, self.projectiles, offset_x, offset_y, zoom)
 
 @dataclass
 class EngagementRing:
@@ -312,6 +348,7 @@ class CapitalShip(FactionStructure):
     outline_color: Color | None = None
     engagement_ring: EngagementRing | None = None
     city_stations: list[Any] = field(default_factory=list)
+    scheduled: bool = field(default=False, init=False, repr=False)
 
     def apply_fraction_traits(self, fraction: Fraction) -> None:
         super().apply_fraction_traits(fraction)
@@ -411,39 +448,95 @@ class CapitalShip(FactionStructure):
                 for i in range(4)
             ]
 
+    def schedule(self, scheduler: AIScheduler) -> None:
+        """Let ``scheduler`` drive arm retargeting and turret and drone decisions.
+
+        The thinkers read the hostiles and threat map from this ship's latest
+        :meth:`update`, so tick the scheduler after updating the ships.
+        """
+        self.scheduled = True
+        self._hostiles = []
+        self._threats = None
+        if self.arms:
+            scheduler.register(
+                lambda elapsed: self._retarget_arms(), config.AI_ARM_THINK_RATE
+            )
+        turrets = list(self.turrets)
+        turrets.extend(s.turret for s in self.city_stations if hasattr(s, "turret"))
+        for turret in turrets:
+            turret.scheduled = True
+            scheduler.register(
+                lambda elapsed, t=turret: t.think(self._hostiles, self._threats),
+                config.AI_TURRET_THINK_RATE,
+                priority=2,
+            )
+        for drone in self.drones:
+            if not hasattr(drone, "think"):
+                continue
+            drone.scheduled = True
+            drone.thinker = scheduler.register(
+                lambda elapsed, d=drone: d.think(self._hostiles, self._threats),
+                config.AI_DRONE_THINK_RATE,
+                priority=1,
+            )
+
+    def _retarget_arms(self) -> None:
+        """Link each channel arm to the nearest star not claimed by another arm."""
+        stars: list[Star] = []
+        for sec in getattr(self, "_sectors", None) or []:
+            for system in sec.systems:
+                stars.append(system.star)
+        used = set()
+        for arm in self.arms:
+            nearest = None
+            min_d = float("inf")
+            for star in stars:
+                if star in used and star is not arm.target:
+                    continue
+                d = math.hypot(star.x - self.x, star.y - self.y)
+                if d < min_d:
+                    min_d = d
+                    nearest = star
+            if nearest:
+                arm.target = nearest
+                used.add(nearest)
+
     def update(
         self,
         dt: float,
         sectors: list,
         targets: list | None = None,
         player: object | None = None,
+        threat_maps: dict | None = None,
+        events: CombatEvents | None = None,
     ) -> None:
+        """Advance arms, drones and turrets against hostile ships.
+
+        ``threat_maps`` maps faction names to the :class:`ThreatMap` built this
+        tick so capital ships of one faction share a single snapshot. Hits
+        are recorded on ``events`` when given and applied when it resolves.
+        """
         if not self.fraction:
             return
+        # Drones clip their intercept moves against these sectors
+        self._sectors = sectors
         if targets is None:
             targets = []
         hostiles_all = [e for e in targets if e.fraction != self.fraction]
         if player and getattr(player, "fraction", None) != self.fraction:
             hostiles_all.append(type("_P", (), {"ship": player})())
+        if threat_maps is None:
+            threat_maps = {}
+        threats = threat_maps.get(self.fraction.name)
+        if threats is None and (self.drones or self.turrets or self.city_stations):
+            threats = ThreatMap(hostiles_all, events=events)
+            threat_maps[self.fraction.name] = threats
+        self._hostiles = hostiles_all
+        self._threats = threats
         if self.fraction.name == "Solar Dominion":
-            stars: list[Star] = []
-            for sec in sectors:
-                for system in sec.systems:
-                    stars.append(system.star)
-            used = set()
+            if not self.scheduled:
+                self._retarget_arms()
             for arm in self.arms:
-                nearest = None
-                min_d = float("inf")
-                for star in stars:
-                    if star in used and star is not arm.target:
-                        continue
-                    d = math.hypot(star.x - self.x, star.y - self.y)
-                    if d < min_d:
-                        min_d = d
-                        nearest = star
-                if nearest:
-                    arm.target = nearest
-                    used.add(nearest)
                 if arm.target:
                     tx = arm.target.x
                     ty = arm.target.y
@@ -468,8 +561,9 @@ class CapitalShip(FactionStructure):
                         arm.target.energy -= amount
         elif self.fraction.name == "Nebula Order":
             hostiles = hostiles_all
-            for drone in list(self.drones):
-                drone.update(dt, hostiles)
+            lost = []
+            for drone in self.drones:
+                drone.update(dt, hostiles, threats)
 
                 rect = pygame.Rect(
                     drone.x - drone.size / 2,
@@ -478,34 +572,39 @@ class CapitalShip(FactionStructure):
                     drone.size,
                 )
 
-                for en in hostiles:
-                    for proj in list(en.ship.projectiles):
-                        if rect.collidepoint(proj.x, proj.y):
-                            drone.hp -= proj.damage
-                            en.ship.projectiles.remove(proj)
+                for proj, source in threats.projectiles_in(rect):
+                    if threats.remove_projectile(proj, source):
+                        drone.hp -= proj.damage
 
-                for proj in list(drone.projectiles):
+                spent = []
+                for proj in in_play(events, drone.projectiles):
                     for en in hostiles:
                         if (
                             math.hypot(proj.x - en.ship.x, proj.y - en.ship.y)
                             <= en.ship.collision_radius
                         ):
-                            en.ship.take_damage(proj.damage)
-                            drone.projectiles.remove(proj)
+                            deal_damage(events, en.ship, proj.damage, drone)
+                            spent.append(proj)
                             break
+                compact(drone.projectiles, spent)
 
                 for en in hostiles:
                     if math.hypot(en.ship.x - drone.x, en.ship.y - drone.y) <= en.ship.collision_radius + drone.size / 2:
                         drone.hp -= 5
-                        en.ship.take_damage(5)
+                        deal_damage(events, en.ship, 5, drone)
 
                 if drone.expired():
-                    self.drones.remove(drone)
+                    thinker = getattr(drone, "thinker", None)
+                    if thinker:
+                        thinker.cancel()
+                    lost.append(drone)
+            compact(self.drones, lost)
         elif self.fraction.name == "Pirate Clans":
             hostiles = hostiles_all
             for turret in self.turrets:
-                turret.update(dt, hostiles)
-            for proj in list(self.projectiles):
+                turret.update(dt, hostiles, threats)
+            dead = []
+            for proj in in_play(events, self.projectiles):
                 proj.update(dt)
                 for en in hostiles:
                     if (
@@ -514,35 +613,40 @@ class CapitalShip(FactionStructure):
                         <= proj.radius * 0.5
                     ):
                         proj.explode()
+                        if events is not None:
+                            events.explosion(proj.x, proj.y, proj.radius, self)
                 if proj.exploded:
                     for en in hostiles:
                         if math.hypot(proj.x - en.ship.x, proj.y - en.ship.y) <= proj.radius:
-                            en.ship.take_damage(proj.damage)
+                            deal_damage(events, en.ship, proj.damage, self)
                 if proj.expired():
-                    self.projectiles.remove(proj)
+                    dead.append(proj)
+            compact(self.projectiles, dead)
         elif self.fraction.name == "Free Explorers":
             hostiles = hostiles_all
             for turret in self.turrets:
-                turret.update(dt, hostiles)
-            for proj in list(self.projectiles):
+                turret.update(dt, hostiles, threats)
+            dead = []
+            for proj in in_play(events, self.projectiles):
                 proj.update(dt)
                 hit = False
                 if not getattr(proj, "exploded", False):
                     for en in hostiles:
                         if math.hypot(proj.x - en.ship.x, proj.y - en.ship.y) <= en.ship.collision_radius:
-                            en.ship.take_damage(proj.damage)
+                            deal_damage(events, en.ship, proj.damage, self)
                             hit = True
                             break
                 else:
                     for en in hostiles:
                         if math.hypot(proj.x - en.ship.x, proj.y - en.ship.y) <= proj.explosion_radius:
-                            en.ship.take_damage(proj.damage)
+                            deal_damage(events, en.ship, proj.damage, self)
                 if hit or proj.expired():
-                    self.projectiles.remove(proj)
+                    dead.append(proj)
+            compact(self.projectiles, dead)
 
         for station in self.city_stations:
             if hasattr(station, "update"):
-                station.update(dt, hostiles_all)
+                station.update(dt, hostiles_all, threats, events)
 
     def draw(
         self,
@@ -675,8 +779,7 @@ class CapitalShip(FactionStructure):
                 rect = pygame.Rect(tx - size_w // 2, ty - size_h // 2, size_w, size_h)
                 pygame.draw.rect(screen, turret_color, rect)
                 pygame.draw.rect(screen, border_color, rect, max(1, int(2 * zoom)))
-            for proj in self.projectiles:
-                proj.draw(screen, offset_x, offset_y, zoom)
+            render_projectiles(screen, self.projectiles, offset_x, offset_y, zoom)
         elif self.fraction and self.fraction.name == "Free Explorers":
             pygame.draw.circle(screen, self.color, (x, y), scaled)
             outline_c = self.outline_color or (0, 0, 0)
@@ -696,8 +799,7 @@ class CapitalShip(FactionStructure):
                 rect = pygame.Rect(tx - size_w // 2, ty - size_h // 2, size_w, size_h)
                 pygame.draw.rect(screen, turret_color, rect)
                 pygame.draw.rect(screen, border_color, rect, max(1, int(2 * zoom)))
-            for proj in self.projectiles:
-                proj.draw(screen, offset_x, offset_y, zoom)
+            render_projectiles(screen, self.projectiles, offset_x, offset_y, zoom)
         elif self.shape == "angular":
             # square hull with triangular wings
             hull = pygame.Rect(x - scaled // 2, y - scaled // 2, scaled, scaled)
@@ -0,0 +1,300 @@
+"""Lightweight NPC ships stored as NumPy arrays."""
+
+import math
+import random
+from dataclasses import dataclass
+
+import numpy as np
+import pygame
+
+import config
+from ship import Ship
+
+
+@dataclass
+class FleetGroup:
+    """Ships patrolling around ``anchor`` and sharing one rally point."""
+
+    anchor: object
+    rally_x: float
+    rally_y: float
+    wait: float = 0.0
+    field: object | None = None
+
+
+class Fleet:
+    """Struct-of-arrays container for many NPC ships.
+
+    Positions, velocities, hull, shield and patrol state live in parallel
+    arrays so a whole fleet moves in one vectorized pass. Individual ships
+    are promoted to full :class:`Ship` objects when the player comes close
+    and demoted again once they are left behind.
+    """
+
+    _FLOAT_FIELDS = (
+        "x", "y", "vx", "vy", "angle", "hull", "shield", "max_shield",
+        "speed_factor", "accel_factor", "size", "offset_x", "offset_y",
+    )
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.count = 0
+        for name in self._FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity))
+        self.group = np.zeros(capacity, dtype=np.int32)
+        self.models: list = []
+        self.fractions: list = []
+        self.colors: list = []
+        self.groups: list[FleetGroup] = []
+        # Promoted Ship -> group index
+        self.promoted: dict[Ship, int] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _grow(self) -> None:
+        capacity = len(self.x) * 2
+        for name in self._FLOAT_FIELDS + ("group",):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+
+    def add_group(self, anchor) -> int:
+        self.groups.append(FleetGroup(anchor, anchor.x, anchor.y))
+        return len(self.groups) - 1
+
+    def add(
+        self,
+        x: float,
+        y: float,
+        model=None,
+        fraction=None,
+        group: int = 0,
+        speed_factor: float = 1.0,
+    ) -> int:
+        if self.count == len(self.x):
+            self._grow()
+        i = self.count
+        self.count += 1
+        ang = random.uniform(0, 2 * math.pi)
+        spread = random.uniform(0, config.FLEET_FORMATION_RADIUS)
+        values = {
+            "x": x,
+            "y": y,
+            "vx": 0.0,
+            "vy": 0.0,
+            "angle": -math.pi / 2,
+            "hull": model.hull if model else 100,
+            "shield": model.shield if model else 100,
+            "max_shield": model.shield if model else 100,
+            "speed_factor": speed_factor,
+            "accel_factor": model.accel_factor if model else 1.0,
+            "size": model.size if model else config.SHIP_SIZE,
+            "offset_x": math.cos(ang) * spread,
+            "offset_y": math.sin(ang) * spread,
+        }
+        for name, value in values.items():
+            getattr(self, name)[i] = value
+        self.group[i] = group
+        self.models.append(model)
+        self.fractions.append(fraction)
+        self.colors.append(model.color if model else config.SHIP_COLOR)
+        return i
+
+    def remove(self, i: int) -> None:
+        """Remove entry ``i`` by moving the last entry into its slot."""
+        last = self.count - 1
+        for name in self._FLOAT_FIELDS + ("group",):
+            arr = getattr(self, name)
+            arr[i] = arr[last]
+        for lst in (self.models, self.fractions, self.colors):
+            lst[i] = lst[last]
+            lst.pop()
+        self.count = last
+
+    def take_damage(self, i: int, amount: float) -> None:
+        """Damage entry ``i``; shields absorb first. Destroyed ships are removed."""
+        absorbed = min(self.shield[i], amount)
+        self.shield[i] -= absorbed
+        self.hull[i] -= amount - absorbed
+        if self.hull[i] <= 0:
+            self.remove(i)
+
+    # --- Simulation ----------------------------------------------------------
+
+    def _update_groups(self, dt: float, flow_map) -> None:
+        n = self.count
+        for g, group in enumerate(self.groups):
+            members = self.group[:n] == g
+            escorts = [s for s, sg in self.promoted.items() if sg == g and s.pilot is None]
+            if not members.any() and not escorts:
+                continue
+            xs = np.concatenate((self.x[:n][members], [s.x for s in escorts]))
+            ys = np.concatenate((self.y[:n][members], [s.y for s in escorts]))
+            dist = np.hypot(xs - group.rally_x, ys - group.rally_y)
+            if (dist < config.FLEET_FORMATION_RADIUS * 1.5).all():
+                group.wait += dt
+                if group.wait >= config.FLEET_IDLE_TIME:
+                    ang = random.uniform(0, 2 * math.pi)
+                    r = random.uniform(0, config.FLEET_PATROL_RADIUS)
+                    group.rally_x = group.anchor.x + math.cos(ang) * r
+                    group.rally_y = group.anchor.y + math.sin(ang) * r
+                    group.wait = 0.0
+                    group.field = None
+            if flow_map is not None and group.field is None:
+                group.field = flow_map.field_to(group.rally_x, group.rally_y)
+            # Promoted escorts keep patrolling with their group
+            for ship in escorts:
+                far = math.hypot(ship.x - group.rally_x, ship.y - group.rally_y)
+                if group.field is not None and far > config.FLEET_FORMATION_RADIUS:
+                    ship.follow_flow(group.field)
+
+    def update(
+        self,
+        dt: float,
+        world_width: int,
+        world_height: int,
+        blackholes=None,
+        flow_map=None,
+    ) -> None:
+        """Advance every fleet ship in one vectorized pass."""
+        if flow_map is not None and flow_map.update_obstacles():
+            for group in self.groups:
+                group.field = None
+        self._update_groups(dt, flow_map)
+        n = self.count
+        if not n:
+            return
+        x, y = self.x[:n], self.y[:n]
+        vx, vy = self.vx[:n], self.vy[:n]
+        gid = self.group[:n]
+
+        rally_x = np.array([g.rally_x for g in self.groups])[gid]
+        rally_y = np.array([g.rally_y for g in self.groups])[gid]
+        tx = rally_x + self.offset_x[:n] - x
+        ty = rally_y + self.offset_y[:n] - y
+        dist = np.hypot(tx, ty)
+        dir_x = tx / np.maximum(dist, 1e-6)
+        dir_y = ty / np.maximum(dist, 1e-6)
+        # Far from the rally point, follow the group's shared flow field
+        far = np.hypot(rally_x - x, rally_y - y) > config.FLEET_FORMATION_RADIUS
+        for g, group in enumerate(self.groups):
+            sel = far & (gid == g)
+            if group.field is not None and sel.any():
+                dir_x[sel], dir_y[sel] = group.field.sample_many(x[sel], y[sel])
+        # Ease off near the formation slot instead of overshooting
+        thrust = np.clip(dist / config.FLEET_FORMATION_RADIUS, 0.0, 1.0)
+        accel = config.SHIP_ACCELERATION * self.accel_factor[:n] * self.speed_factor[:n] * thrust
+        vx += dir_x * accel * dt
+        vy += dir_y * accel * dt
+        vx *= config.SHIP_FRICTION
+        vy *= config.SHIP_FRICTION
+        limit = config.SHIP_MAX_SPEED * self.speed_factor[:n]
+        speed = np.hypot(vx, vy)
+        scale = np.where(speed > limit, limit / np.maximum(speed, 1e-6), 1.0)
+        vx *= scale
+        vy *= scale
+
+        swallowed = np.zeros(n, dtype=bool)
+        for hole in blackholes or []:
+            dx = hole.x - x
+            dy = hole.y - y
+            d = np.hypot(dx, dy)
+            inside = (d < hole.pull_range) & (d > 0)
+            pull = np.where(inside, hole.strength / np.maximum(d, 1e-6), 0.0)
+            vx += np.where(inside, dx / np.maximum(d, 1e-6), 0.0) * pull * dt
+            vy += np.where(inside, dy / np.maximum(d, 1e-6), 0.0) * pull * dt
+            swallowed |= d < hole.radius
+
+        moving = np.hypot(vx, vy) > 1e-3
+        self.angle[:n] = np.where(moving, np.arctan2(vy, vx), self.angle[:n])
+        np.clip(x + vx * dt, 0, world_width, out=x)
+        np.clip(y + vy * dt, 0, world_height, out=y)
+        np.minimum(self.max_shield[:n], self.shield[:n] + dt, out=self.shield[:n])
+
+        for i in sorted(np.nonzero(swallowed)[0], reverse=True):
+            self.remove(int(i))
+
+    # --- Promotion -----------------------------------------------------------
+
+    def promote(self, i: int) -> Ship:
+        """Turn entry ``i`` into a full :class:`Ship` and drop it from the fleet."""
+        ship = Ship(
+            self.x[i],
+            self.y[i],
+            self.models[i],
+            fraction=self.fractions[i],
+            speed_factor=float(self.speed_factor[i]),
+        )
+        ship.vx = float(self.vx[i])
+        ship.vy = float(self.vy[i])
+        ship.angle = float(self.angle[i])
+        ship.hull = int(self.hull[i])
+        ship.shield.strength = float(self.shield[i])
+        group = self.groups[int(self.group[i])]
+        if group.field is not None:
+            ship.follow_flow(group.field)
+        self.promoted[ship] = int(self.group[i])
+        self.remove(i)
+        return ship
+
+    def demote(self, ship: Ship) -> int:
+        """Return a previously promoted ship to the fleet arrays."""
+        group = self.promoted.pop(ship)
+        i = self.add(ship.x, ship.y, ship.model, ship.fraction, group, ship.speed_factor)
+        self.vx[i] = ship.vx
+        self.vy[i] = ship.vy
+        self.angle[i] = ship.angle
+        self.hull[i] = ship.hull
+        self.shield[i] = ship.shield.strength
+        return i
+
+    def sync_with(self, player_ship, ships: list) -> None:
+        """Promote fleet ships near ``player_ship`` into ``ships`` and demote far ones.
+
+        ``ships`` should be a list reserved for promoted escorts, updated and
+        drawn as NPCs; escorts of every faction end up in it.
+        """
+        for ship in list(self.promoted):
+            if ship.hull <= 0 or ship not in ships:
+                del self.promoted[ship]
+                continue
+            d = math.hypot(ship.x - player_ship.x, ship.y - player_ship.y)
+            if d > config.FLEET_DEMOTE_RANGE and ship.pilot is None and not ship.specials:
+                ships.remove(ship)
+                self.demote(ship)
+        n = self.count
+        if not n:
+            return
+        d = np.hypot(self.x[:n] - player_ship.x, self.y[:n] - player_ship.y)
+        for i in sorted(np.nonzero(d < config.FLEET_PROMOTE_RANGE)[0], reverse=True):
+            ships.append(self.promote(int(i)))
+
+    # --- Drawing -------------------------------------------------------------
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        offset_x: float = 0.0,
+        offset_y: float = 0.0,
+        zoom: float = 1.0,
+    ) -> None:
+        n = self.count
+        if not n:
+            return
+        cx = (self.x[:n] - offset_x) * zoom
+        cy = (self.y[:n] - offset_y) * zoom
+        half_h = self.size[:n] * 0.75 * zoom
+        half_b = self.size[:n] * 0.5 * zoom
+        width, height = screen.get_size()
+        visible = (cx > -half_h) & (cx < width + half_h) & (cy > -half_h) & (cy < height + half_h)
+        cos_a = np.cos(self.angle[:n])
+        sin_a = np.sin(self.angle[:n])
+        for i in np.nonzero(visible)[0]:
+            c, s, h, b = cos_a[i], sin_a[i], half_h[i], half_b[i]
+            points = [
+                (cx[i] + c * h, cy[i] + s * h),
+                (cx[i] - c * h - s * b, cy[i] - s * h + c * b),
+                (cx[i] - c * h + s * b, cy[i] - s * h - c * b),
+            ]
+            pygame.draw.polygon(screen, self.colors[i], points)
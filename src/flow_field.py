@@ -0,0 +1,211 @@
+"""Shared flow fields that steer many NPC ships toward common goals."""
+
+import copy
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+import config
+
+# Neighbour offsets (row, col) and the cost of stepping to them
+_NEIGHBOURS = [
+    (-1, 0, 1.0),
+    (1, 0, 1.0),
+    (0, -1, 1.0),
+    (0, 1, 1.0),
+    (-1, -1, math.sqrt(2)),
+    (-1, 1, math.sqrt(2)),
+    (1, -1, math.sqrt(2)),
+    (1, 1, math.sqrt(2)),
+]
+_STEP_X = np.array([dc for _dr, dc, _w in _NEIGHBOURS], dtype=float)
+_STEP_Y = np.array([dr for dr, _dc, _w in _NEIGHBOURS], dtype=float)
+_STEP_LEN = np.hypot(_STEP_X, _STEP_Y)
+
+
+def _shift(grid: np.ndarray, dr: int, dc: int, fill: float) -> np.ndarray:
+    """Return ``grid`` moved so ``out[r, c] == grid[r + dr, c + dc]``."""
+    out = np.full_like(grid, fill)
+    rows, cols = grid.shape
+    out[max(0, -dr): rows - max(0, dr), max(0, -dc): cols - max(0, dc)] = grid[
+        max(0, dr): rows - max(0, -dr), max(0, dc): cols - max(0, -dc)
+    ]
+    return out
+
+
+def integrate_cost(blocked: np.ndarray, goal_r: int, goal_c: int) -> np.ndarray:
+    """Return travel cost (in cells) from each cell of ``blocked`` to the goal cell."""
+    blocked = blocked.copy()
+    blocked[goal_r, goal_c] = False
+    cost = np.full(blocked.shape, np.inf)
+    cost[goal_r, goal_c] = 0.0
+    while True:
+        new = cost
+        for dr, dc, w in _NEIGHBOURS:
+            new = np.minimum(new, _shift(cost, dr, dc, np.inf) + w)
+        new[blocked] = np.inf
+        if np.array_equal(new, cost):
+            return cost
+        cost = new
+
+
+class FlowField:
+    """Unit steering vectors leading every cell toward one goal."""
+
+    def __init__(self, goal_x: float, goal_y: float, cell: int, cost: np.ndarray) -> None:
+        self.goal_x = goal_x
+        self.goal_y = goal_y
+        self.cell = cell
+        self.cost = cost
+        costs = np.stack([_shift(cost, dr, dc, np.inf) + w for dr, dc, w in _NEIGHBOURS])
+        best = np.argmin(costs, axis=0)
+        # Cells cut off from the goal (deep inside an obstacle) aim straight at it
+        reachable = np.isfinite(np.min(costs, axis=0))
+        rows, cols = cost.shape
+        gx = goal_x - (np.arange(cols)[None, :] + 0.5) * cell
+        gy = goal_y - (np.arange(rows)[:, None] + 0.5) * cell
+        dist = np.maximum(np.hypot(gx, gy), 1e-6)
+        self.dir_x = np.where(reachable, _STEP_X[best] / _STEP_LEN[best], gx / dist)
+        self.dir_y = np.where(reachable, _STEP_Y[best] / _STEP_LEN[best], gy / dist)
+        self.goal_cell = (int(goal_y // cell), int(goal_x // cell))
+
+    def retarget(self, goal_x: float, goal_y: float) -> "FlowField":
+        """Return a field sharing this one's grids but ending at another point.
+
+        Only valid for a goal inside the same cell; steering outside the
+        goal cell does not depend on where in the cell the goal lies.
+        """
+        field = copy.copy(self)
+        field.goal_x = goal_x
+        field.goal_y = goal_y
+        return field
+
+    def sample(self, x: float, y: float) -> tuple[float, float]:
+        """Return the unit direction to follow from ``(x, y)``."""
+        rows, cols = self.dir_x.shape
+        r = min(rows - 1, max(0, int(y // self.cell)))
+        c = min(cols - 1, max(0, int(x // self.cell)))
+        if (r, c) == self.goal_cell:
+            dx = self.goal_x - x
+            dy = self.goal_y - y
+            dist = math.hypot(dx, dy)
+            return (dx / dist, dy / dist) if dist > 1e-6 else (0.0, 0.0)
+        return float(self.dir_x[r, c]), float(self.dir_y[r, c])
+
+    def sample_many(self, xs: np.ndarray, ys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized :meth:`sample` for arrays of positions."""
+        rows, cols = self.dir_x.shape
+        r = np.clip((ys // self.cell).astype(int), 0, rows - 1)
+        c = np.clip((xs // self.cell).astype(int), 0, cols - 1)
+        dx = self.dir_x[r, c]
+        dy = self.dir_y[r, c]
+        at_goal = (r == self.goal_cell[0]) & (c == self.goal_cell[1])
+        if at_goal.any():
+            gx = self.goal_x - xs[at_goal]
+            gy = self.goal_y - ys[at_goal]
+            dist = np.maximum(np.hypot(gx, gy), 1e-6)
+            dx = dx.copy()
+            dy = dy.copy()
+            dx[at_goal] = gx / dist
+            dy[at_goal] = gy / dist
+        return dx, dy
+
+
+class FlowFieldMap:
+    """Coarse obstacle grid of the world plus a cache of flow fields.
+
+    Stars, stations, black-hole danger zones, planets and capital ships are
+    stamped into the grid. Fields are built once per destination cell and
+    shared by every ship heading there; moving bodies are re-stamped by
+    :meth:`update_obstacles`, which also drops the cached fields.
+    """
+
+    def __init__(
+        self,
+        sectors,
+        world_width: int,
+        world_height: int,
+        blackholes=None,
+        capital_ships=None,
+        cell: int = config.FLOW_FIELD_CELL,
+    ) -> None:
+        self.cell = cell
+        self.cols = math.ceil(world_width / cell)
+        self.rows = math.ceil(world_height / cell)
+        self._static = np.zeros((self.rows, self.cols), dtype=bool)
+        for sector in sectors:
+            for system in sector.systems:
+                self._stamp(self._static, system.star.x, system.star.y, system.star.radius)
+                for station in system.stations:
+                    self._stamp(self._static, station.x, station.y, station.radius)
+        for hole in blackholes or []:
+            self._stamp(
+                self._static, hole.x, hole.y, hole.radius + config.NAV_BLACKHOLE_CLEARANCE
+            )
+        self._movers = [p for s in sectors for sys in s.systems for p in sys.planets]
+        self._movers.extend(capital_ships or [])
+        self._mover_pos: list[tuple[float, float]] = []
+        self.blocked = self._static
+        self._restamp()
+        self._fields: OrderedDict[tuple[int, int], FlowField] = OrderedDict()
+        self._rally: dict[str, tuple[float, float]] = {}
+
+    def _stamp(self, grid: np.ndarray, x: float, y: float, radius: float) -> None:
+        r = radius + config.FLOW_FIELD_MARGIN
+        c0 = max(0, int((x - r) // self.cell))
+        c1 = min(self.cols, int((x + r) // self.cell) + 1)
+        r0 = max(0, int((y - r) // self.cell))
+        r1 = min(self.rows, int((y + r) // self.cell) + 1)
+        if c0 >= c1 or r0 >= r1:
+            return
+        cx = (np.arange(c0, c1) + 0.5) * self.cell
+        cy = (np.arange(r0, r1) + 0.5) * self.cell
+        inside = (cx[None, :] - x) ** 2 + (cy[:, None] - y) ** 2 < r * r
+        grid[r0:r1, c0:c1] |= inside
+
+    def _restamp(self) -> None:
+        grid = self._static.copy()
+        self._mover_pos = []
+        for body in self._movers:
+            self._stamp(grid, body.x, body.y, body.radius)
+            self._mover_pos.append((body.x, body.y))
+        self.blocked = grid
+
+    def update_obstacles(self) -> bool:
+        """Re-stamp moving bodies once any moved half a cell; return ``True`` if so."""
+        limit = self.cell / 2
+        for body, (x, y) in zip(self._movers, self._mover_pos):
+            if abs(body.x - x) > limit or abs(body.y - y) > limit:
+                self._restamp()
+                self._fields.clear()
+                return True
+        return False
+
+    def field_to(self, x: float, y: float) -> FlowField:
+        """Return the (cached) field leading to ``(x, y)``."""
+        r = min(self.rows - 1, max(0, int(y // self.cell)))
+        c = min(self.cols - 1, max(0, int(x // self.cell)))
+        field = self._fields.get((r, c))
+        if field is not None:
+            # Any goal in the cell shares the integrated grid
+            self._fields.move_to_end((r, c))
+            if (field.goal_x, field.goal_y) == (x, y):
+                return field
+            return field.retarget(x, y)
+        field = FlowField(x, y, self.cell, self._integrate(r, c))
+        self._fields[(r, c)] = field
+        if len(self._fields) > config.FLOW_FIELD_CACHE:
+            self._fields.popitem(last=False)
+        return field
+
+    def set_rally(self, key: str, x: float, y: float) -> None:
+        """Set the rally point shared by every ship of ``key`` (e.g. a faction)."""
+        self._rally[key] = (x, y)
+
+    def rally_field(self, key: str) -> FlowField | None:
+        point = self._rally.get(key)
+        return self.field_to(*point) if point else None
+
+    def _integrate(self, goal_r: int, goal_c: int) -> np.ndarray:
+        return integrate_cost(self.blocked, goal_r, goal_c)
@@ -0,0 +1,94 @@
+"""Garbage collector policy for a game with large, long-lived worlds.
+
+World generation leaves tens of thousands of objects that live until the
+game closes. :meth:`GCPolicy.freeze_world` moves them into the permanent
+generation so routine collections during flight stop rescanning them, and
+the collector's pauses are timed so hitches can be attributed.
+"""
+
+import gc
+import time
+from dataclasses import dataclass, field
+
+import config
+
+
+@dataclass
+class GCStats:
+    """Pause timings per collector generation."""
+
+    collections: list[int] = field(default_factory=lambda: [0, 0, 0])
+    total_ms: list[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    worst_ms: list[float] = field(default_factory=lambda: [0.0, 0.0, 0.0])
+    last_ms: float = 0.0
+
+    def report(self) -> str:
+        lines = []
+        for gen in range(3):
+            count = self.collections[gen]
+            mean = self.total_ms[gen] / count if count else 0.0
+            lines.append(
+                f"gen{gen}: {count} collections, "
+                f"mean {mean:.2f} ms, worst {self.worst_ms[gen]:.2f} ms"
+            )
+        return "\n".join(lines)
+
+
+class GCPolicy:
+    """Freeze generated worlds, tune thresholds and time collector pauses.
+
+    ``idle`` is called on frames where a modal screen is open, where a full
+    collection is invisible to the player; at most one runs every
+    ``config.GC_IDLE_INTERVAL`` seconds.
+    """
+
+    def __init__(self, thresholds: tuple[int, int, int] = config.GC_GAMEPLAY_THRESHOLDS) -> None:
+        self.thresholds = thresholds
+        self.stats = GCStats()
+        self._default = gc.get_threshold()
+        self._start = 0.0
+        self._idle = 0.0
+        gc.callbacks.append(self._time)
+
+    def _time(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._start = time.perf_counter()
+            return
+        ms = (time.perf_counter() - self._start) * 1000.0
+        gen = info["generation"]
+        self.stats.collections[gen] += 1
+        self.stats.total_ms[gen] += ms
+        self.stats.worst_ms[gen] = max(self.stats.worst_ms[gen], ms)
+        self.stats.last_ms = ms
+
+    def freeze_world(self) -> int:
+        """Collect once, then exempt every surviving object from future scans.
+
+        Returns the number of objects now frozen.
+        """
+        gc.collect()
+        gc.freeze()
+        return gc.get_freeze_count()
+
+    def release_world(self) -> int:
+        """Thaw frozen objects so a discarded scene can be reclaimed, then refreeze."""
+        gc.unfreeze()
+        return self.freeze_world()
+
+    def enter_gameplay(self) -> None:
+        gc.set_threshold(*self.thresholds)
+
+    def idle(self, dt: float) -> bool:
+        """Run a full collection when a modal screen has been open long enough."""
+        self._idle += dt
+        if self._idle < config.GC_IDLE_INTERVAL:
+            return False
+        self._idle = 0.0
+        gc.collect()
+        return True
+
+    def close(self) -> None:
+        """Restore the interpreter's defaults and stop timing collections."""
+        gc.set_threshold(*self._default)
+        if self._time in gc.callbacks:
+            gc.callbacks.remove(self._time)
@@ -5,6 +5,8 @@ from pathlib import Path
 from dataclasses import dataclass, field
 
 from defensive_drone import DefensiveDrone
+from spatial_index import clip_motion
+from threat_map import ThreatMap
 import config
 
 
@@ -34,6 +36,8 @@ class LearningDefensiveDrone(DefensiveDrone):
     q_table_version: int = field(default=Q_TABLE_VERSION, init=False, repr=False)
     prev_hp: float = field(default=0.0, init=False, repr=False)
     _wander_target: tuple | None = field(default=None, init=False, repr=False)
+    action: str = field(default="patrol", init=False, repr=False)
+    _last: tuple | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         super().__init__(
@@ -71,9 +75,9 @@ class LearningDefensiveDrone(DefensiveDrone):
     # ------------------------------------------------------------------
     # Q-learning helpers
     # ------------------------------------------------------------------
-    def _state(self, objects: list) -> tuple:
+    def _state(self, objects: list, threats: ThreatMap | None = None) -> tuple:
         """Return a simple discrete state description."""
-        threat = self._find_threat(objects)
+        threat = self._find_threat(objects, threats)
         if threat:
             d_threat = _dist(self.x, self.y, getattr(threat, "x", 0), getattr(threat, "y", 0))
             if d_threat <= self.detection_range * 0.5:
@@ -117,8 +121,14 @@ class LearningDefensiveDrone(DefensiveDrone):
         dx = tx - self.x
         dy = ty - self.y
         dist = math.hypot(dx, dy) or 1.0
-        self.x += (dx / dist * speed) * dt
-        self.y += (dy / dist * speed) * dt
+        self.x, self.y = clip_motion(
+            getattr(self.owner, "_sectors", None),
+            self.x,
+            self.y,
+            self.x + (dx / dist * speed) * dt,
+            self.y + (dy / dist * speed) * dt,
+            self.size / 2,
+        )
 
     def _patrol(self, dt: float) -> None:
         if self._wander_target is None or _dist(self.x, self.y, *self._wander_target) < 5:
@@ -130,9 +140,15 @@ class LearningDefensiveDrone(DefensiveDrone):
             )
         self._move_towards(self._wander_target[0], self._wander_target[1], self.orbit_speed * 60, dt)
 
-    def _intercept(self, dt: float, objects: list) -> None:
-        if self.target is None or isinstance(self.target, object) and getattr(self.target, "expired", lambda: False)():
-            self.target = self._find_threat(objects)
+    def _intercept(
+        self, dt: float, objects: list, threats: ThreatMap | None = None
+    ) -> None:
+        if (
+            self.target is None
+            or self._target_recycled()
+            or isinstance(self.target, object) and getattr(self.target, "expired", lambda: False)()
+        ):
+            self._lock(self._find_threat(objects, threats))
         if self.target:
             tx = getattr(self.target, "x", self.owner.x)
             ty = getattr(self.target, "y", self.owner.y)
@@ -147,7 +163,9 @@ class LearningDefensiveDrone(DefensiveDrone):
         if _dist(self.x, self.y, self.owner.x, self.owner.y) <= self.owner.size * 1.5:
             self._wander_target = None
 
-    def compute_reward(self, objects: list) -> float:
+    def compute_reward(
+        self, objects: list, threats: ThreatMap | None = None
+    ) -> float:
         reward = 0.0
         if self.prev_hp:
             reward -= (self.prev_hp - self.hp)
@@ -156,7 +174,7 @@ class LearningDefensiveDrone(DefensiveDrone):
             reward += 0.05
         else:
             reward -= 0.05
-        threat = self._find_threat(objects)
+        threat = self._find_threat(objects, threats)
         if threat and _dist(self.x, self.y, getattr(threat, "x", 0), getattr(threat, "y", 0)) <= self.size * 1.5:
             reward += 0.2
         return reward
@@ -164,18 +182,41 @@ class LearningDefensiveDrone(DefensiveDrone):
     # ------------------------------------------------------------------
     # Main update
     # ------------------------------------------------------------------
-    def update(self, dt: float, objects: list) -> None:
+    def think(self, objects: list, threats: ThreatMap | None = None) -> None:
+        """Learn from the previous decision and choose the next action."""
         if not self.prev_hp:
             self.prev_hp = self.hp
-        state = self._state(objects)
-        action = self.choose_action(state)
+        state = self._state(objects, threats)
+        if self._last is not None:
+            reward = self.compute_reward(objects, threats)
+            self.learn(*self._last, reward, state)
+            self.prev_hp = self.hp
+        self.action = self.choose_action(state)
+        self._last = (state, self.action)
+
+    def _act(
+        self, action: str, dt: float, objects: list, threats: ThreatMap | None
+    ) -> None:
         if action == "patrol":
             self._patrol(dt)
         elif action == "intercept":
-            self._intercept(dt, objects)
+            self._intercept(dt, objects, threats)
         else:
             self._return(dt)
-        reward = self.compute_reward(objects)
-        next_state = self._state(objects)
+
+    def update(
+        self, dt: float, objects: list, threats: ThreatMap | None = None
+    ) -> None:
+        if self.scheduled:
+            # Keep executing the last decision between scheduled thinks
+            self._act(self.action, dt, objects, threats)
+            return
+        if not self.prev_hp:
+            self.prev_hp = self.hp
+        state = self._state(objects, threats)
+        action = self.choose_action(state)
+        self._act(action, dt, objects, threats)
+        reward = self.compute_reward(objects, threats)
+        next_state = self._state(objects, threats)
         self.learn(state, action, reward, next_state)
         self.prev_hp = self.hp
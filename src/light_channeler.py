@@ -2,7 +2,8 @@ import math
 import random
 import pygame
 import config
-from combat import Weapon, Projectile
+from combat import Weapon, Projectile, render_projectiles
+from combat_events import CombatEvents, compact, deal_damage, in_play
 
 
 class Channeler:
@@ -147,7 +148,12 @@ class StarTurret:
     def connected(self) -> bool:
         return self.battery.channeler is not None
 
-    def update(self, dt: float, targets: list | None = None) -> None:
+    def update(
+        self,
+        dt: float,
+        targets: list | None = None,
+        events: CombatEvents | None = None,
+    ) -> None:
         self.timer += dt
         if self.timer < self.deploy_delay:
             return
@@ -163,7 +169,7 @@ class StarTurret:
             ):
                 self.battery.energy -= config.STAR_TURRET_ENERGY_PER_SHOT
             ang = self.angle + random.uniform(-self.arc / 2, self.arc / 2)
-            proj = Projectile(
+            proj = Projectile.pool.acquire(
                 self.x,
                 self.y,
                 self.x + math.cos(ang),
@@ -173,7 +179,8 @@ class StarTurret:
                 max_distance=config.STAR_TURRET_PROJECTILE_MAX_DISTANCE,
             )
             self.projectiles.append(proj)
-        for proj in list(self.projectiles):
+        dead = []
+        for proj in in_play(events, self.projectiles):
             proj.update(dt)
             hit = False
             if targets:
@@ -182,11 +189,13 @@ class StarTurret:
                         math.hypot(proj.x - t.ship.x, proj.y - t.ship.y)
                         <= t.ship.collision_radius
                     ):
-                        t.ship.take_damage(proj.damage)
+                        deal_damage(events, t.ship, proj.damage, self)
                         hit = True
                         break
             if hit or proj.expired():
-                self.projectiles.remove(proj)
+                dead.append(proj)
+        compact(self.projectiles, dead)
+        Projectile.pool.release_all(dead)
 
     def expired(self) -> bool:
         return self.hp <= 0
@@ -204,8 +213,7 @@ class StarTurret:
             fill = int(bar_w * max(0.0, min(1.0, self.hp / self.max_hp)))
             if fill > 0:
                 pygame.draw.rect(screen, (150, 0, 0), (bar_x, bar_y, fill, bar_h))
-            for proj in self.projectiles:
-                proj.draw(screen, offset_x, offset_y, zoom)
+            render_projectiles(screen, self.projectiles, offset_x, offset_y, zoom)
 
 
 class LightChannelerWeapon(Weapon):
@@ -5,7 +5,7 @@ import types
 import config
 import control_settings as controls
 import game_settings as settings
-from ship import Ship, choose_ship_table
+from ship import Ship, SHIP_MODELS, choose_ship_table
 from carrier import Carrier
 from combat import (
     LaserWeapon,
@@ -16,12 +16,24 @@ from combat import (
     IonizedSymbiontWeapon,
     ChronoTachionicWhip,
     SporesWeapon,
+    Projectile,
+    ProjectileBatch,
 )
 from light_channeler import LightChannelerWeapon
 from sector import create_sectors
+from particles import PARTICLES
+from gc_policy import GCPolicy
+from pool import pool_report
 from fraction import FRACTIONS
 from faction_structures import spawn_capital_ships
 from portal import Portal, spawn_explorer_portals
+from trade import MarketIndex, TradeRouteSolver
+from navigation import NavGraph
+from flow_field import FlowFieldMap
+from fleet import Fleet
+from ai_scheduler import AIScheduler
+from special_systems import SpecialSystems
+from combat_events import CombatEvents
 from star import Star
 from planet import Planet
 from station import SpaceStation
@@ -116,6 +128,7 @@ def draw_station_ui(
 
 def main():
     pygame.init()
+    gc_policy = GCPolicy()
     screen = pygame.display.set_mode((config.WINDOW_WIDTH, config.WINDOW_HEIGHT))
     pygame.display.set_caption("VastVoid")
     controls.load_bindings()
@@ -143,6 +156,37 @@ def main():
     portals: list[Portal] = []
     if free_flagship:
         portals = spawn_explorer_portals(free_flagship, world_width, world_height)
+    # Hits are buffered during the frame and applied in one resolution step
+    combat_events = CombatEvents()
+    # Specials from every ship are updated together once per frame
+    Ship.special_systems = SpecialSystems(combat_events)
+    # Shots from every owner are drawn together once per frame
+    Projectile.batch = ProjectileBatch()
+    # Turret, drone and arm decisions are spread across frames
+    ai_scheduler = AIScheduler()
+    for cap in capital_ships:
+        cap.schedule(ai_scheduler)
+    market_index = MarketIndex.from_sectors(sectors)
+    trade_solver = TradeRouteSolver(market_index, wormholes, portals)
+    nav_graph = NavGraph(sectors, blackholes, wormholes, portals, capital_ships)
+    flow_map = FlowFieldMap(
+        sectors, world_width, world_height, blackholes, capital_ships
+    )
+    # Lightweight escorts patrol around every capital ship
+    npc_fleet = Fleet()
+    for cap in capital_ships:
+        group = npc_fleet.add_group(cap)
+        for _ in range(config.FLEET_ESCORTS_PER_CAPITAL):
+            npc_fleet.add(
+                cap.x + random.uniform(-cap.radius, cap.radius) * 2,
+                cap.y + random.uniform(-cap.radius, cap.radius) * 2,
+                random.choice(SHIP_MODELS),
+                cap.fraction,
+                group,
+                config.NPC_SPEED_FACTOR,
+            )
+    # Escorts promoted near the player; kept apart from the player's ships
+    npc_ships: list[Ship] = []
 
     chosen_model = choose_ship_table(screen)
     player.ship_model = chosen_model
@@ -198,7 +242,7 @@ def main():
         25,
         ["Plan Route", "Inventory", "Weapons", "Artifacts", "Research", "Ajustes"],
     )
-    route_planner = RoutePlanner()
+    route_planner = RoutePlanner(nav_graph)
     ability_bar = AbilityBar()
     ability_bar.set_ship(ship)
     carrier = Carrier(ship.x + 150, ship.y + 80, fraction=player.fraction)
@@ -233,6 +277,10 @@ def main():
     last_pan_time = config.CAMERA_RECENTER_DELAY
     load_mode = False
 
+    # Everything generated so far lives for the whole session
+    gc_policy.freeze_world()
+    gc_policy.enter_gameplay()
+
     clock = pygame.time.Clock()
     running = True
     while running:
@@ -278,6 +326,22 @@ def main():
         if cbm.docked and crew_window is None:
             crew_window = CrewTransferWindow(cbm.ship_a, cbm.ship_b)
 
+        # Modal screens pause the world, so collections there go unnoticed
+        if current_surface is None and any((
+            inventory_window,
+            crafting_window,
+            weapon_menu,
+            artifact_menu,
+            research_window,
+            settings_window,
+            hyper_map,
+            carrier_move_map,
+            carrier_window,
+            crew_window,
+            market_window,
+        )):
+            gc_policy.idle(dt)
+
         if current_surface:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -314,6 +378,8 @@ def main():
                     ship.y = planet.y
                     camera_x = ship.x
                     camera_y = ship.y
+                    # Let the abandoned surface be reclaimed at the transition
+                    gc_policy.release_world()
                     break
             if current_surface:
                 keys = pygame.key.get_pressed()
@@ -554,7 +620,9 @@ def main():
                     inventory_window = InventoryWindow(player)
                     continue
                 if event.type == pygame.KEYDOWN and event.key == controls.get_key("open_market"):
-                    market_window = MarketWindow(current_station, player)
+                    market_window = MarketWindow(
+                        current_station, player, market_index, trade_solver
+                    )
                     continue
                 if event.type == pygame.KEYDOWN and event.key == controls.get_key("open_weapons"):
                     weapon_menu = WeaponMenu(ship)
@@ -580,7 +648,9 @@ def main():
                     and event.button == 1
                     and market_rect.collidepoint(event.pos)
                 ):
-                    market_window = MarketWindow(current_station, player)
+                    market_window = MarketWindow(
+                        current_station, player, market_index, trade_solver
+                    )
                     continue
                 continue
 
@@ -599,6 +669,8 @@ def main():
                 settings_window = SettingsWindow()
 
             route_planner.handle_event(event, sectors, (camera_x, camera_y), zoom)
+            if route_planner.destination and route_planner.route is None:
+                route_planner.plan(ship, "Hyperdrive" in player.features)
             if ability_bar.handle_event(event, ship):
                 # Hyperjump is unlocked via the "Hyperdrive" research. Only
                 # open the destination map once the feature is available.
@@ -645,7 +717,7 @@ def main():
                     and event.button == 1
                     and auto_rect.collidepoint(event.pos)
                 ):
-                    ship.start_autopilot(route_planner.destination)
+                    ship.start_autopilot(route_planner.destination, route_planner.route)
                     continue
 
             if event.type == pygame.KEYDOWN:
@@ -808,6 +880,20 @@ def main():
                 hostiles,
                 structures,
             )
+        for npc in npc_ships:
+            npc.update(
+                _NullKeys(),
+                dt,
+                world_width,
+                world_height,
+                sectors,
+                blackholes,
+                hostiles,
+                structures,
+            )
+        Ship.special_systems.run(dt)
+        npc_fleet.update(dt, world_width, world_height, blackholes, flow_map)
+        npc_fleet.sync_with(ship, npc_ships)
         if cbm.animation:
             cbm.animation.update(dt)
             if cbm.animation.done:
@@ -820,6 +906,7 @@ def main():
             )
             if dist <= approaching_planet.radius + 20:
                 current_surface = PlanetSurface(approaching_planet, player)
+                gc_policy.freeze_world()
                 approaching_planet = None
                 camera_x = current_surface.camera_x
                 camera_y = current_surface.camera_y
@@ -871,10 +958,16 @@ def main():
         for sector in sectors:
             sector.update(dt)
         # Update roaming capital ships so their arms can track nearby stars
+        # Capital ships of one faction share this tick's threat map
+        threat_maps: dict = {}
         for cap in capital_ships:
             # Pass the player's ship so capital ships know the player's
             # faction when determining hostiles and can target it correctly
-            cap.update(dt, sectors, [], ship)
+            cap.update(dt, sectors, [], ship, threat_maps, combat_events)
+        ai_scheduler.tick(dt)
+        combat_events.resolve()
+        PARTICLES.update(dt)
+        nav_graph.update_obstacles()
 
         screen.fill(config.BACKGROUND_COLOR)
         if route_planner.active:
@@ -919,11 +1012,15 @@ def main():
             zoom,
             aura_color=player.fraction.color if player.fraction else None,
         )
+        npc_fleet.draw(screen, offset_x, offset_y, zoom)
+        for npc in npc_ships:
+            npc.draw_projectiles(screen, offset_x, offset_y, zoom)
         for extra in extra_ships:
             extra_ship = getattr(extra, "ship", extra)
             extra_ship.draw_projectiles(screen, offset_x, offset_y, zoom)
         ship.draw_projectiles(screen, offset_x, offset_y, zoom)
         ship.draw_specials(screen, offset_x, offset_y, zoom)
+        Projectile.batch.flush()
         for extra in extra_ships:
             extra_ship = getattr(extra, "ship", extra)
             extra_ship.draw_at(
@@ -934,6 +1031,15 @@ def main():
                 player.fraction,
                 player.fraction.color if player.fraction else None,
             )
+        for npc in npc_ships:
+            npc.draw_at(
+                screen,
+                offset_x,
+                offset_y,
+                zoom,
+                player.fraction,
+                npc.fraction.color if npc.fraction else None,
+            )
         ship.draw_at(screen, offset_x, offset_y, zoom, player.fraction)
         if cbm.animation:
             cbm.animation.draw(screen, offset_x, offset_y, zoom)
@@ -1103,6 +1209,10 @@ def main():
         if hasattr(extra, "save_q_table"):
             extra.save_q_table()
 
+    if config.GC_REPORT_ON_EXIT:
+        print(gc_policy.stats.report())
+        print(pool_report())
+    gc_policy.close()
     pygame.quit()
 
 
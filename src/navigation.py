@@ -0,0 +1,339 @@
+"""Navigation graph used to plan multi-leg autopilot routes."""
+
+import heapq
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+import config
+from ship import hyperjump_duration
+
+
+@dataclass
+class RouteLeg:
+    """One step of a route.
+
+    ``kind`` is ``"fly"`` for autopilot flight, ``"wormhole"`` or ``"portal"``
+    for a transit from ``entry`` to ``(x, y)`` and ``"jump"`` for a hyperjump.
+    """
+
+    kind: str
+    x: float
+    y: float
+    target: object | None = None
+    entry: tuple[float, float] | None = None
+
+
+@dataclass
+class Route:
+    legs: list[RouteLeg]
+    time: float
+
+
+def segment_hits(ax, ay, bx, by, cx, cy, r) -> np.ndarray:
+    """Return a ``segments x circles`` mask of segments crossing circles."""
+    ax = np.asarray(ax, dtype=float)[:, None]
+    ay = np.asarray(ay, dtype=float)[:, None]
+    dx = np.asarray(bx, dtype=float)[:, None] - ax
+    dy = np.asarray(by, dtype=float)[:, None] - ay
+    cx = np.asarray(cx, dtype=float)[None, :]
+    cy = np.asarray(cy, dtype=float)[None, :]
+    length_sq = np.maximum(dx * dx + dy * dy, 1e-9)
+    t = np.clip(((cx - ax) * dx + (cy - ay) * dy) / length_sq, 0.0, 1.0)
+    px = ax + t * dx - cx
+    py = ay + t * dy - cy
+    return px * px + py * py < np.asarray(r, dtype=float)[None, :] ** 2
+
+
+def _system_radius(system) -> float:
+    star = system.star
+    radius = star.radius
+    for body in list(system.planets) + list(system.stations):
+        radius = max(radius, math.hypot(body.x - star.x, body.y - star.y) + body.radius)
+    return radius
+
+
+class NavGraph:
+    """Visibility graph over star-system gates, wormholes and portals.
+
+    Star systems, black-hole danger zones and capital ships are circular
+    obstacles. Each system gets ``NAV_SYSTEM_GATES`` waypoints just outside
+    its outer orbit; straight legs between waypoints are kept when they miss
+    every obstacle. Shortest-time rows are computed lazily with Dijkstra and
+    cached, and only the rows affected by a moving capital ship are dropped.
+    """
+
+    def __init__(
+        self,
+        sectors,
+        blackholes=None,
+        wormholes=None,
+        portals=None,
+        capital_ships=None,
+        speed: float = config.AUTOPILOT_SPEED,
+    ) -> None:
+        self.speed = speed
+        self.xs: list[float] = []
+        self.ys: list[float] = []
+        self.refs: list = []
+        self.system_gates: dict[int, list[int]] = {}
+        obstacles: list[tuple[float, float, float]] = []
+
+        for sector in sectors:
+            for system in sector.systems:
+                radius = _system_radius(system)
+                obstacles.append((system.star.x, system.star.y, radius))
+                gate_r = radius + config.NAV_SYSTEM_MARGIN
+                gates = []
+                for i in range(config.NAV_SYSTEM_GATES):
+                    ang = 2 * math.pi * i / config.NAV_SYSTEM_GATES
+                    gates.append(
+                        self._add_node(
+                            system.star.x + math.cos(ang) * gate_r,
+                            system.star.y + math.sin(ang) * gate_r,
+                            system,
+                        )
+                    )
+                self.system_gates[id(system)] = gates
+        for hole in blackholes or []:
+            obstacles.append((hole.x, hole.y, hole.radius + config.NAV_BLACKHOLE_CLEARANCE))
+
+        self._movers = []
+        for cap in capital_ships or []:
+            self._movers.append((cap, len(obstacles), cap.x, cap.y))
+            obstacles.append((cap.x, cap.y, cap.radius + config.NAV_OBSTACLE_MARGIN))
+
+        self.ox = np.array([o[0] for o in obstacles], dtype=float)
+        self.oy = np.array([o[1] for o in obstacles], dtype=float)
+        self.orad = np.array([o[2] for o in obstacles], dtype=float)
+
+        # Transit edges: (from node, to node, seconds, kind)
+        transits: list[tuple[int, int, float, str]] = []
+        index: dict[int, int] = {}
+        for kind, delay, objs in (
+            ("wormhole", config.WORMHOLE_DELAY, wormholes or []),
+            ("portal", 0.0, portals or []),
+        ):
+            objs = [o for o in objs if o.pair]
+            for obj in objs:
+                index[id(obj)] = self._add_node(obj.x, obj.y, obj)
+            for obj in objs:
+                transits.append((index[id(obj)], index[id(obj.pair)], delay, kind))
+
+        self.adj: list[dict[int, tuple[float, str]]] = [{} for _ in self.xs]
+        # Wormhole and portal edges, restored when a fly edge over them closes
+        self._transits: dict[tuple[int, int], tuple[float, str]] = {}
+        for a, b, delay, kind in transits:
+            self.adj[a][b] = (delay, kind)
+            self._transits[(a, b)] = (delay, kind)
+
+        xs = np.array(self.xs)
+        ys = np.array(self.ys)
+        dist = np.hypot(xs[:, None] - xs[None, :], ys[:, None] - ys[None, :])
+        pa, pb = np.nonzero(np.triu(dist <= config.NAV_LINK_RANGE, k=1))
+        self._pa = pa
+        self._pb = pb
+        self._plen = dist[pa, pb]
+        hits = segment_hits(xs[pa], ys[pa], xs[pb], ys[pb], self.ox, self.oy, self.orad)
+        # Obstacles that swallow an endpoint cannot block its edges
+        inside = self._containment(xs, ys)
+        self._blockers = hits & ~inside[pa] & ~inside[pb]
+        self._open = ~self._blockers.any(axis=1)
+        for p in np.nonzero(self._open)[0]:
+            self._link(int(pa[p]), int(pb[p]), float(self._plen[p]))
+        self._rows: dict[int, tuple[list[float], list[int]]] = {}
+
+    def _add_node(self, x: float, y: float, ref) -> int:
+        self.xs.append(float(x))
+        self.ys.append(float(y))
+        self.refs.append(ref)
+        return len(self.xs) - 1
+
+    def _containment(self, xs, ys) -> np.ndarray:
+        dx = np.asarray(xs, dtype=float)[:, None] - self.ox[None, :]
+        dy = np.asarray(ys, dtype=float)[:, None] - self.oy[None, :]
+        return dx * dx + dy * dy < self.orad[None, :] ** 2
+
+    def _link(self, a: int, b: int, length: float) -> None:
+        t = length / self.speed
+        if self.adj[a].get(b, (math.inf,))[0] > t:
+            self.adj[a][b] = (t, "fly")
+        if self.adj[b].get(a, (math.inf,))[0] > t:
+            self.adj[b][a] = (t, "fly")
+
+    def _unlink(self, a: int, b: int) -> None:
+        for u, v in ((a, b), (b, a)):
+            if self.adj[u].get(v, (0, ""))[1] != "fly":
+                continue
+            transit = self._transits.get((u, v))
+            if transit is None:
+                del self.adj[u][v]
+            else:
+                self.adj[u][v] = transit
+
+    # --- Shortest paths ------------------------------------------------------
+
+    def _row(self, source: int) -> tuple[list[float], list[int]]:
+        row = self._rows.get(source)
+        if row is not None:
+            return row
+        dist = [math.inf] * len(self.xs)
+        prev = [-1] * len(self.xs)
+        dist[source] = 0.0
+        heap = [(0.0, source)]
+        while heap:
+            d, node = heapq.heappop(heap)
+            if d > dist[node]:
+                continue
+            for nxt, (w, _kind) in self.adj[node].items():
+                nd = d + w
+                if nd < dist[nxt]:
+                    dist[nxt] = nd
+                    prev[nxt] = node
+                    heapq.heappush(heap, (nd, nxt))
+        row = (dist, prev)
+        self._rows[source] = row
+        return row
+
+    def system_time(self, a, b) -> float:
+        """Return the cached shortest travel time between two star systems."""
+        best = math.inf
+        for s in self.system_gates[id(a)]:
+            dist = self._row(s)[0]
+            for g in self.system_gates[id(b)]:
+                best = min(best, dist[g])
+        return best
+
+    def _links(self, x: float, y: float) -> list[tuple[int, float]]:
+        """Return nodes reachable in a straight line from ``(x, y)``."""
+        xs = np.array(self.xs)
+        ys = np.array(self.ys)
+        dist = np.hypot(xs - x, ys - y)
+        near = np.nonzero(dist <= config.NAV_LINK_RANGE)[0]
+        if not len(near):
+            return []
+        hits = segment_hits(
+            np.full(len(near), x), np.full(len(near), y), xs[near], ys[near],
+            self.ox, self.oy, self.orad,
+        )
+        inside = self._containment([x], [y])[0]
+        hits &= ~inside[None, :] & ~self._containment(xs[near], ys[near])
+        return [
+            (int(n), float(dist[n]) / self.speed)
+            for n, blocked in zip(near, hits.any(axis=1))
+            if not blocked
+        ]
+
+    def _clear(self, ax: float, ay: float, bx: float, by: float) -> bool:
+        hits = segment_hits([ax], [ay], [bx], [by], self.ox, self.oy, self.orad)[0]
+        inside = self._containment([ax, bx], [ay, by]).any(axis=0)
+        return not (hits & ~inside).any()
+
+    def find_route(
+        self,
+        x: float,
+        y: float,
+        goal,
+        hyperdrive: bool = False,
+        jump_wait: float = 0.0,
+    ) -> Route:
+        """Return the fastest route from ``(x, y)`` to ``goal``.
+
+        With ``hyperdrive`` a single hyperjump, either straight to the goal
+        or to a waypoint near it, is also considered. ``jump_wait`` is the
+        drive's remaining cooldown and is added to the cost of the jump.
+        """
+        gx, gy = goal.x, goal.y
+        final = RouteLeg("fly", gx, gy, goal)
+        direct = math.hypot(gx - x, gy - y) / self.speed
+        best_time = direct if self._clear(x, y, gx, gy) else math.inf
+        best = [final]
+
+        goal_links = self._links(gx, gy)
+        for s, ts in self._links(x, y):
+            dist, _prev = self._row(s)
+            for g, tg in goal_links:
+                t = ts + dist[g] + tg
+                if t < best_time:
+                    best_time = t
+                    best = self._legs(s, g) + [final]
+
+        if hyperdrive:
+            def jump(tx, ty):
+                return (
+                    jump_wait
+                    + config.HYPERJUMP_DELAY
+                    + hyperjump_duration(math.hypot(tx - x, ty - y))
+                )
+
+            t = jump(gx, gy)
+            if t < best_time:
+                best_time = t
+                best = [RouteLeg("jump", gx, gy), final]
+            for g, tg in goal_links:
+                t = jump(self.xs[g], self.ys[g]) + tg
+                if t < best_time:
+                    best_time = t
+                    best = [RouteLeg("jump", self.xs[g], self.ys[g]), final]
+
+        if best_time == math.inf:
+            # Nothing is reachable; fly straight and let autopilot detour
+            best_time = direct
+        return Route(best, best_time)
+
+    def _legs(self, s: int, g: int) -> list[RouteLeg]:
+        _dist, prev = self._row(s)
+        path = [g]
+        while path[-1] != s:
+            path.append(prev[path[-1]])
+        path.reverse()
+        legs = [RouteLeg("fly", self.xs[s], self.ys[s])]
+        for a, b in zip(path, path[1:]):
+            kind = self.adj[a][b][1]
+            entry = (self.xs[a], self.ys[a]) if kind != "fly" else None
+            legs.append(RouteLeg(kind, self.xs[b], self.ys[b], entry=entry))
+        return legs
+
+    # --- Moving obstacles ----------------------------------------------------
+
+    def update_obstacles(self) -> None:
+        """Re-test edges around capital ships that moved since the last call."""
+        for i, (cap, col, last_x, last_y) in enumerate(self._movers):
+            if math.hypot(cap.x - last_x, cap.y - last_y) < config.NAV_OBSTACLE_TOLERANCE:
+                continue
+            self._movers[i] = (cap, col, cap.x, cap.y)
+            self.ox[col] = cap.x
+            self.oy[col] = cap.y
+            self._retest(col)
+
+    def _retest(self, col: int) -> None:
+        xs = np.array(self.xs)
+        ys = np.array(self.ys)
+        pa, pb = self._pa, self._pb
+        circle = ([self.ox[col]], [self.oy[col]], [self.orad[col]])
+        hits = segment_hits(xs[pa], ys[pa], xs[pb], ys[pb], *circle)[:, 0]
+        dx = xs - self.ox[col]
+        dy = ys - self.oy[col]
+        inside = dx * dx + dy * dy < self.orad[col] ** 2
+        self._blockers[:, col] = hits & ~inside[pa] & ~inside[pb]
+        now_open = ~self._blockers.any(axis=1)
+        for p in np.nonzero(now_open != self._open)[0]:
+            a, b = int(pa[p]), int(pb[p])
+            if now_open[p]:
+                self._link(a, b, float(self._plen[p]))
+                self._drop_rows_improved_by(a, b, float(self._plen[p]) / self.speed)
+            else:
+                self._unlink(a, b)
+                self._drop_rows_using(a, b)
+        self._open = now_open
+
+    def _drop_rows_using(self, a: int, b: int) -> None:
+        for src, (_dist, prev) in list(self._rows.items()):
+            if prev[b] == a or prev[a] == b:
+                del self._rows[src]
+
+    def _drop_rows_improved_by(self, a: int, b: int, w: float) -> None:
+        for src, (dist, _prev) in list(self._rows.items()):
+            if dist[a] + w < dist[b] - 1e-9 or dist[b] + w < dist[a] - 1e-9:
+                del self._rows[src]
@@ -0,0 +1,263 @@
+"""Array-backed particle engine shared by every visual emitter.
+
+Particles live in NumPy arrays and are advanced together in
+:meth:`ParticleEngine.update`. Each emitter draws its own particles so
+they keep their place in the drawing order, but a draw is a single
+``Surface.blits`` call over cached dot sprites.
+"""
+
+import math
+
+import numpy as np
+import pygame
+
+import config
+
+_FLOAT_FIELDS = (
+    "x",
+    "y",
+    "vx",
+    "vy",
+    "life",
+    "max_life",
+    "size",
+    "move",
+    "cx",
+    "cy",
+    "ang",
+    "rad",
+    "spin",
+)
+_BOOL_FIELDS = ("orbit", "fade", "shrink")
+
+
+class ParticleEngine:
+    """Fixed-budget particle store with vectorised update and batched drawing.
+
+    ``move`` is how long a particle keeps travelling before it settles;
+    orbiting particles circle ``(cx, cy)`` at radius ``rad``. Once the live
+    count passes ``config.PARTICLE_SOFT_LIMIT`` of the budget new bursts are
+    thinned proportionally, and nothing is emitted when the budget is full.
+    """
+
+    def __init__(self, capacity: int = config.PARTICLE_BUDGET) -> None:
+        self.capacity = capacity
+        self.n = 0
+        for name in _FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity))
+        for name in _BOOL_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=bool))
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.emitter = np.zeros(capacity, dtype=np.int32)
+        self.dropped = 0
+        self._counts: dict[int, int] = {}
+        self._next_emitter = 1
+        self._sprites: dict[tuple, pygame.Surface] = {}
+
+    def __len__(self) -> int:
+        return self.n
+
+    def new_emitter(self) -> int:
+        """Return a fresh id used to tag, count and draw an owner's particles."""
+        eid = self._next_emitter
+        self._next_emitter += 1
+        return eid
+
+    def count(self, emitter: int) -> int:
+        return self._counts.get(emitter, 0)
+
+    def _allow(self, wanted: int) -> int:
+        soft = int(self.capacity * config.PARTICLE_SOFT_LIMIT)
+        allowed = self.capacity - self.n
+        if self.n > soft:
+            allowed = min(allowed, int(wanted * allowed / (self.capacity - soft)))
+        allowed = max(0, min(wanted, allowed))
+        self.dropped += wanted - allowed
+        return allowed
+
+    def emit(
+        self,
+        emitter: int,
+        x,
+        y,
+        vx=0.0,
+        vy=0.0,
+        *,
+        life: float,
+        size: float,
+        color: tuple[int, int, int],
+        move: float = math.inf,
+        fade: bool = True,
+        shrink: bool = False,
+    ) -> int:
+        """Spawn particles at ``(x, y)`` moving by ``(vx, vy)``; arrays spawn many.
+
+        Returns how many particles the budget allowed.
+        """
+        x, y, vx, vy = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(x, dtype=float)), y, vx, vy
+        )
+        k = self._allow(len(x))
+        if not k:
+            return 0
+        sl = slice(self.n, self.n + k)
+        self.x[sl] = x[:k]
+        self.y[sl] = y[:k]
+        self.vx[sl] = vx[:k]
+        self.vy[sl] = vy[:k]
+        self.move[sl] = move
+        self.orbit[sl] = False
+        self._fill(sl, emitter, life, size, color, fade, shrink)
+        return k
+
+    def emit_orbit(
+        self,
+        emitter: int,
+        cx: float,
+        cy: float,
+        ang,
+        rad,
+        spin,
+        life,
+        *,
+        size,
+        color: tuple[int, int, int],
+    ) -> int:
+        """Spawn particles circling ``(cx, cy)``; per-particle values may be arrays."""
+        ang, rad, spin, life, size = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(ang, dtype=float)), rad, spin, life, size
+        )
+        k = self._allow(len(ang))
+        if not k:
+            return 0
+        sl = slice(self.n, self.n + k)
+        self.cx[sl] = cx
+        self.cy[sl] = cy
+        self.ang[sl] = ang[:k]
+        self.rad[sl] = rad[:k]
+        self.spin[sl] = spin[:k]
+        self.x[sl] = cx + np.cos(ang[:k]) * rad[:k]
+        self.y[sl] = cy + np.sin(ang[:k]) * rad[:k]
+        self.vx[sl] = 0.0
+        self.vy[sl] = 0.0
+        self.move[sl] = 0.0
+        self.orbit[sl] = True
+        self._fill(sl, emitter, life[:k], size[:k], color, False, False)
+        return k
+
+    def _fill(self, sl, emitter, life, size, color, fade, shrink) -> None:
+        self.life[sl] = life
+        self.max_life[sl] = life
+        self.size[sl] = size
+        self.color[sl] = color
+        self.fade[sl] = fade
+        self.shrink[sl] = shrink
+        self.emitter[sl] = emitter
+        k = sl.stop - sl.start
+        self._counts[emitter] = self._counts.get(emitter, 0) + k
+        self.n = sl.stop
+
+    def kill(self, emitter: int) -> None:
+        """Remove every particle belonging to ``emitter``."""
+        if self._counts.get(emitter):
+            self._compact(self.emitter[: self.n] != emitter)
+
+    def update(self, dt: float) -> None:
+        n = self.n
+        if not n:
+            return
+        move = self.move[:n]
+        step = np.clip(move, 0.0, dt)
+        self.x[:n] += self.vx[:n] * step
+        self.y[:n] += self.vy[:n] * step
+        move -= dt
+        orbit = self.orbit[:n]
+        if orbit.any():
+            self.ang[:n][orbit] += self.spin[:n][orbit] * dt
+            ang = self.ang[:n][orbit]
+            rad = self.rad[:n][orbit]
+            self.x[:n][orbit] = self.cx[:n][orbit] + np.cos(ang) * rad
+            self.y[:n][orbit] = self.cy[:n][orbit] + np.sin(ang) * rad
+        self.life[:n] -= dt
+        keep = self.life[:n] > 0
+        if not keep.all():
+            self._compact(keep)
+
+    def _compact(self, keep: np.ndarray) -> None:
+        n = self.n
+        gone, counts = np.unique(self.emitter[:n][~keep], return_counts=True)
+        for eid, c in zip(gone.tolist(), counts.tolist()):
+            left = self._counts.get(eid, 0) - c
+            if left > 0:
+                self._counts[eid] = left
+            else:
+                self._counts.pop(eid, None)
+        k = int(np.count_nonzero(keep))
+        for name in _FLOAT_FIELDS + _BOOL_FIELDS + ("color", "emitter"):
+            arr = getattr(self, name)
+            arr[:k] = arr[:n][keep]
+        self.n = k
+
+    def _sprite(self, color: tuple, radius: int, level: int) -> pygame.Surface:
+        key = (color, radius, level)
+        surf = self._sprites.get(key)
+        if surf is None:
+            alpha = 255 * level // config.PARTICLE_ALPHA_LEVELS
+            surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius)
+            self._sprites[key] = surf
+        return surf
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        offset_x: float = 0.0,
+        offset_y: float = 0.0,
+        zoom: float = 1.0,
+        emitter: int | None = None,
+    ) -> None:
+        """Blit the visible particles, optionally only those of ``emitter``."""
+        n = self.n
+        if not n:
+            return
+        idx = np.arange(n) if emitter is None else np.flatnonzero(self.emitter[:n] == emitter)
+        if not len(idx):
+            return
+        ratio = np.clip(self.life[idx] / self.max_life[idx], 0.0, 1.0)
+        scale = np.where(self.shrink[idx], ratio, 1.0)
+        radius = np.maximum(1, (self.size[idx] * scale * zoom).astype(int))
+        level = np.where(
+            self.fade[idx],
+            np.ceil(ratio * config.PARTICLE_ALPHA_LEVELS),
+            config.PARTICLE_ALPHA_LEVELS,
+        ).astype(int)
+        sx = ((self.x[idx] - offset_x) * zoom).astype(int) - radius
+        sy = ((self.y[idx] - offset_y) * zoom).astype(int) - radius
+        width, height = screen.get_size()
+        seen = (
+            (level > 0)
+            & (sx + 2 * radius >= 0)
+            & (sy + 2 * radius >= 0)
+            & (sx < width)
+            & (sy < height)
+        )
+        if not seen.any():
+            return
+        colors = self.color[idx][seen].tolist()
+        sprite = self._sprite
+        screen.blits(
+            [
+                (sprite(tuple(c), r, lv), (px, py))
+                for c, r, lv, px, py in zip(
+                    colors,
+                    radius[seen].tolist(),
+                    level[seen].tolist(),
+                    sx[seen].tolist(),
+                    sy[seen].tolist(),
+                )
+            ],
+            doreturn=False,
+        )
+
+
+PARTICLES = ParticleEngine()
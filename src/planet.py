@@ -29,6 +29,22 @@ def _lighter_color(color: tuple[int, int, int], factor: float = 1.3) -> tuple[in
 class Planet:
     """Planet that orbits around a star."""
 
+    __slots__ = (
+        "name",
+        "star",
+        "distance",
+        "radius",
+        "color",
+        "angle",
+        "speed",
+        "environment",
+        "biomes",
+        "atmosphere_color",
+        "atmosphere_size",
+        "x",
+        "y",
+    )
+
     _id_counter = 1
 
     def __init__(
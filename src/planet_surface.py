@@ -1,4 +1,5 @@
 import math
+import numpy as np
 import pygame
 import random
 try:
@@ -10,7 +11,25 @@ except ImportError as exc:
     ) from exc
 import config
 import control_settings as controls
+from ai_scheduler import AIScheduler
 from biome import BIOMES, Biome
+from creatures import CreatureManager
+from decorations import Decorations
+from river_index import RiverIndex, segment_distances
+from spatial_index import CellBuckets
+from terrain_layer import TerrainLayer
+from terrain_flags import (
+    BLOCKED,
+    GAS,
+    ICE,
+    LAVA,
+    OUTSIDE,
+    STORM,
+    WATER,
+    TerrainFlags,
+)
+from walk_grid import WalkGrid
+from weather import ScreenTint, StormField
 
 
 
@@ -26,8 +45,75 @@ ENV_COLORS = {
 }
 
 
+def _draw_capsule(
+    surface: pygame.Surface,
+    color,
+    x1: float,
+    y1: float,
+    x2: float,
+    y2: float,
+    radius: int,
+) -> None:
+    """Fill the stadium of ``radius`` around the segment ``(x1, y1)-(x2, y2)``."""
+    pygame.draw.circle(surface, color, (int(x1), int(y1)), radius)
+    pygame.draw.circle(surface, color, (int(x2), int(y2)), radius)
+    length = math.hypot(x2 - x1, y2 - y1)
+    if length:
+        nx = -(y2 - y1) / length * radius
+        ny = (x2 - x1) / length * radius
+        pygame.draw.polygon(
+            surface,
+            color,
+            [(x1 + nx, y1 + ny), (x2 + nx, y2 + ny), (x2 - nx, y2 - ny), (x1 - nx, y1 - ny)],
+        )
+
+
+def _capsule_cells(
+    x1: float,
+    y1: float,
+    x2: float,
+    y2: float,
+    radius: float,
+    cell: int,
+    cols: int,
+    rows: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the ``(rows, cols)`` of grid cells within ``radius`` of a segment.
+
+    A cell counts when the segment crosses its square grown by ``radius``,
+    the same cells a square brush swept along the segment would touch.
+    """
+    c0 = max(0, int((min(x1, x2) - radius) // cell))
+    c1 = min(cols - 1, int((max(x1, x2) + radius) // cell))
+    r0 = max(0, int((min(y1, y2) - radius) // cell))
+    r1 = min(rows - 1, int((max(y1, y2) + radius) // cell))
+    if c0 > c1 or r0 > r1:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+    jj, ii = np.mgrid[r0 : r1 + 1, c0 : c1 + 1]
+    lo = 0.0
+    hi = 1.0
+    inside = np.ones(ii.shape, dtype=bool)
+    for start, delta, idx in ((x1, x2 - x1, ii), (y1, y2 - y1, jj)):
+        near = idx * cell - radius
+        far = (idx + 1) * cell + radius
+        if abs(delta) < 1e-9:
+            inside &= (start >= near) & (start <= far)
+            continue
+        ta = (near - start) / delta
+        tb = (far - start) / delta
+        lo = np.maximum(lo, np.minimum(ta, tb))
+        hi = np.minimum(hi, np.maximum(ta, tb))
+    inside &= lo <= hi
+    return jj[inside], ii[inside]
+
+
 class LavaRiver:
-    """Represents a slowly drifting lava river."""
+    """A lava river drifting along ``direction`` as time passes.
+
+    The polyline itself never changes; the river's current position is its
+    base points shifted by ``elapsed * speed`` so membership and drawing are
+    computed analytically instead of being painted onto full-size surfaces.
+    """
 
     def __init__(
         self,
@@ -36,17 +122,69 @@ class LavaRiver:
         direction: tuple[int, int],
         speed: float = config.LAVA_RIVER_SPEED,
     ) -> None:
-        self.points = [(float(x), float(y)) for x, y in points]
+        self.points = np.asarray(points, dtype=float)
         self.width = width
         self.direction = direction
         self.speed = speed
-        self.last_points = list(points)
+        self.elapsed = 0.0
+        self._min = self.points.min(axis=0) - width / 2
+        self._max = self.points.max(axis=0) + width / 2
+
+    def update(self, dt: float) -> None:
+        self.elapsed += dt
+
+    def offset(self) -> tuple[float, float]:
+        """Return how far the river has drifted from its base polyline."""
+        shift = self.elapsed * self.speed
+        return self.direction[0] * shift, self.direction[1] * shift
+
+    def contains(self, x: float, y: float) -> bool:
+        """Return ``True`` if ``(x, y)`` lies within the river's current course."""
+        dx, dy = self.offset()
+        # Test against the base polyline by shifting the point the other way
+        x -= dx
+        y -= dy
+        if not (self._min[0] <= x <= self._max[0] and self._min[1] <= y <= self._max[1]):
+            return False
+        pts = self.points
+        dist = segment_distances(
+            (x,), (y,), pts[:-1, 0], pts[:-1, 1], pts[1:, 0], pts[1:, 1]
+        )
+        return bool(dist.min() <= self.width / 2)
+
+    def visible_runs(self, view: pygame.Rect) -> list[np.ndarray]:
+        """Return the shifted point runs whose segments intersect ``view``."""
+        if len(self.points) < 2:
+            return []
+        pts = self.points + self.offset()
+        half = self.width / 2
+        a = pts[:-1]
+        b = pts[1:]
+        lo = np.minimum(a, b) - half
+        hi = np.maximum(a, b) + half
+        hit = (
+            (hi[:, 0] >= view.left)
+            & (lo[:, 0] <= view.right)
+            & (hi[:, 1] >= view.top)
+            & (lo[:, 1] <= view.bottom)
+        )
+        runs: list[np.ndarray] = []
+        idx = np.flatnonzero(hit)
+        if not len(idx):
+            return runs
+        # Split consecutive visible segments into runs of connected points
+        breaks = np.flatnonzero(np.diff(idx) > 1) + 1
+        for group in np.split(idx, breaks):
+            runs.append(pts[group[0] : group[-1] + 2])
+        return runs
 
 
 
 class ItemPickup:
     """Collectible item placed on the surface."""
 
+    __slots__ = ("name", "x", "y", "size")
+
     def __init__(self, name: str, x: float, y: float) -> None:
         self.name = name
         self.x = x
@@ -107,7 +245,7 @@ class Explorer:
             self.x -= speed * dt
         if keys[controls.get_key("move_right")]:
             self.x += speed * dt
-        # Clamp position so mask lookups stay within bounds
+        # Clamp position so terrain lookups stay within bounds
         self.x = max(0, min(width - 1, self.x))
         self.y = max(0, min(height - 1, self.y))
         if in_gas and not has_suit:
@@ -143,7 +281,25 @@ class Boat:
 
 
 class Creature:
-    """Simple creature that may wander or chase the explorer."""
+    """Simple creature that may wander or chase the explorer.
+
+    Movement and decisions are driven in bulk by
+    :class:`creatures.CreatureManager`, which writes positions back here.
+    """
+
+    __slots__ = (
+        "x",
+        "y",
+        "world_w",
+        "world_h",
+        "size",
+        "hostile",
+        "color",
+        "speed",
+        "vx",
+        "vy",
+        "chasing",
+    )
 
     def __init__(
         self,
@@ -164,30 +320,7 @@ class Creature:
         self.speed = 40.0
         self.vx = 0.0
         self.vy = 0.0
-
-    def update(self, target_x: float, target_y: float, dt: float) -> None:
-        if self.hostile:
-            dx = target_x - self.x
-            dy = target_y - self.y
-            dist = math.hypot(dx, dy)
-            if dist < 200 and dist > 0:
-                self.vx = (dx / dist) * self.speed
-                self.vy = (dy / dist) * self.speed
-            else:
-                self.vx *= 0.9
-                self.vy *= 0.9
-        else:
-            if random.random() < 0.02:
-                ang = random.uniform(0, 2 * math.pi)
-                self.vx = math.cos(ang) * self.speed
-                self.vy = math.sin(ang) * self.speed
-            self.vx *= 0.98
-            self.vy *= 0.98
-
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.x = max(0, min(self.world_w - 1, self.x))
-        self.y = max(0, min(self.world_h - 1, self.y))
+        self.chasing = False
 
     def draw(self, screen: pygame.Surface, off_x: float, off_y: float) -> None:
         rect = pygame.Rect(
@@ -269,23 +402,22 @@ class PlanetSurface:
             (self.width, self.height), pygame.SRCALPHA
         )
         self.collision_surface.fill((0, 0, 0, 0))
-        self.storm_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.storm_surface.fill((0, 0, 0, 0))
+        self.storms = StormField()
         self.ice_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         self.ice_surface.fill((0, 0, 0, 0))
-        self.desert_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.desert_surface.fill((0, 0, 0, 0))
-        self.snow_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        self.snow_surface.fill((0, 0, 0, 0))
+        self.sandstorm_tint = ScreenTint(config.DESERT_FILTER_COLOR)
+        self.snowstorm_tint = ScreenTint(config.SNOW_STORM_COLOR)
         self.lava_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         self.lava_surface.fill((0, 0, 0, 0))
         self.gas_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         self.gas_surface.fill((0, 0, 0, 0))
-        self.collision_mask: pygame.mask.Mask | None = None
-        self.storm_mask: pygame.mask.Mask | None = None
-        self.ice_mask: pygame.mask.Mask | None = None
-        self.lava_mask: pygame.mask.Mask | None = None
-        self.gas_mask: pygame.mask.Mask | None = None
+        # Tiles are composited lazily, so generation may draw freely. Gas
+        # stays out of the tiles so it is still drawn above storms and lava
+        self.terrain_layer = TerrainLayer(
+            [self.surface, self.ice_surface, self.lava_surface]
+        )
+        # Walkability and hazards for every point, packed into one grid
+        self.terrain = TerrainFlags(self.width, self.height)
         self.desert_storm_active = False
         self.desert_storm_time = 0.0
         self.desert_storm_cooldown = random.uniform(
@@ -297,20 +429,28 @@ class PlanetSurface:
             config.SNOW_STORM_INTERVAL_MIN, config.SNOW_STORM_INTERVAL_MAX
         )
         self.ice_holes: list[dict] = []
-        self.pickups: list[ItemPickup] = []
-        self.healing_plants: list[HealingPlant] = []
-        self.creatures: list[Creature] = []
-        self.platforms: list[FloatingPlatform] = []
-        self.waste_deposits: list[WasteDeposit] = []
         # grid resolution used for walkable map
         self.cell = 60
         self.cols = self.width // self.cell
         self.rows = self.height // self.cell
-        self.blocked: list[list[bool]] = []
+        # Static collectibles are bucketed by walkable-grid cell
+        self.pickups = CellBuckets(self.cell)
+        self.healing_plants = CellBuckets(self.cell)
+        self.creatures = CreatureManager(self.width, self.height)
+        self.platforms: list[FloatingPlatform] = []
+        self.waste_deposits = CellBuckets(self.cell)
+        self.walk = WalkGrid(self.cols, self.rows, self.cell)
+        # Read-only alias of the walkable grid; edit it through ``self.walk``
+        self.blocked = self.walk.blocked
         # Store river segments along with their drawn width
         self.rivers: list[tuple[list[tuple[int, int]], int]] = []
+        self.river_index = RiverIndex()
+        self.decorations = Decorations()
         self.lava_geysers: list[dict] = []
         self.moving_lava_rivers: list[LavaRiver] = []
+        self._lava_overlay = pygame.Surface(
+            (config.WINDOW_WIDTH, config.WINDOW_HEIGHT), pygame.SRCALPHA
+        )
         self.tremor_timer = 0.0
         self.tremor_cooldown = random.uniform(
             config.TREMOR_INTERVAL_MIN, config.TREMOR_INTERVAL_MAX
@@ -333,6 +473,14 @@ class PlanetSurface:
         self.camera_y = self.explorer.y + self.tremor_offset_y
         self.exit_rect = pygame.Rect(config.WINDOW_WIDTH - 110, 10, 100, 30)
         self.inventory_rect = pygame.Rect(10, 10, 100, 30)
+        # Creature decisions are time-sliced; movement still runs every frame
+        self.ai = AIScheduler()
+        self.ai.register(
+            lambda elapsed: self.creatures.think(
+                self.explorer.x, self.explorer.y, elapsed
+            ),
+            config.AI_CREATURE_THINK_RATE,
+        )
 
     def _random_variation(self, base: tuple[int, int, int]) -> tuple[int, int, int]:
         """Return the same colour to avoid tonal changes inside a region."""
@@ -391,30 +539,18 @@ class PlanetSurface:
         canopy_color: tuple[int, int, int] | None = None,
         trunk_color: tuple[int, int, int] | None = None,
     ) -> None:
-        """Draw a tree made of a small trunk and a round canopy."""
-        # Trees are scaled up slightly for a denser look and then increased by
-        # an additional 10% as requested
-        r = int(r * 1.38 * 1.15 * 1.2 * 1.10)
+        """Queue a tree made of a small trunk and a round canopy.
+
+        Trees are drawn when :meth:`_flush_decorations` runs.
+        """
         if canopy_color is None:
             canopy_color = (20, 70, 20)
         if trunk_color is None:
             trunk_color = (80, 50, 20)
-        trunk_width = max(2, r // 2)
-        trunk_height = r * 2
-        trunk_rect = pygame.Rect(
-            x - trunk_width // 2,
-            y,
-            trunk_width,
-            trunk_height,
-        )
-        pygame.draw.rect(self.surface, trunk_color, trunk_rect)
-        # Add collision only for the lower half of the trunk so canopies do not
-        # block movement and only the bottom portion collides
-        collision_rect = trunk_rect.copy()
-        collision_rect.height //= 2
-        collision_rect.top += trunk_height // 2
-        pygame.draw.rect(self.collision_surface, (255, 255, 255), collision_rect)
-        pygame.draw.circle(self.surface, canopy_color, (x, y), r)
+        self.decorations.tree(x, y, r, canopy_color, trunk_color)
+
+    def _flush_decorations(self) -> None:
+        self.decorations.flush(self.surface, self.collision_surface)
 
     def _draw_river(
         self,
@@ -455,6 +591,7 @@ class PlanetSurface:
                 self.lava_surface, (200, 60, 60, 180), False, points, width
             )
         self.rivers.append((points, width))
+        self.river_index.add(points, width)
         self._plant_trees_along_river(points, width)
         return points, width, start_side
     def _draw_river_in_area(
@@ -489,35 +626,17 @@ class PlanetSurface:
                 self.lava_surface, (200, 60, 60, 180), False, points, width
             )
         self.rivers.append((points, width))
+        self.river_index.add(points, width)
         self._plant_trees_along_river(points, width)
 
-    def _distance_to_segment(
-        self, x: float, y: float, p1: tuple[int, int], p2: tuple[int, int]
-    ) -> float:
-        """Return the distance from point ``(x, y)`` to the line segment ``p1``-``p2``."""
-        x1, y1 = p1
-        x2, y2 = p2
-        if (x1, y1) == (x2, y2):
-            return math.hypot(x - x1, y - y1)
-        dx = x2 - x1
-        dy = y2 - y1
-        t = max(0, min(1, ((x - x1) * dx + (y - y1) * dy) / float(dx * dx + dy * dy)))
-        proj_x = x1 + t * dx
-        proj_y = y1 + t * dy
-        return math.hypot(x - proj_x, y - proj_y)
-
     def _point_near_river(self, x: float, y: float, margin: float = 10.0) -> bool:
         """Return ``True`` if ``(x, y)`` is within ``margin`` of any river."""
-        for points, width in self.rivers:
-            half = width / 2 + margin
-            for i in range(len(points) - 1):
-                if self._distance_to_segment(x, y, points[i], points[i + 1]) <= half:
-                    return True
-        return False
+        return self.river_index.near(x, y, margin)
 
     def _plant_trees_along_river(self, points: list[tuple[int, int]], width: int) -> None:
         """Plant trees along both sides of a river without covering the water."""
         spacing = 60
+        spots: list[tuple[float, float]] = []
         for i in range(len(points) - 1):
             p1 = points[i]
             p2 = points[i + 1]
@@ -535,31 +654,23 @@ class PlanetSurface:
                 norm_y = dx / seg_len
                 offset = width / 2 + random.randint(10, 20)
                 for side in (-1, 1):
-                    tx = px + norm_x * offset * side
-                    ty = py + norm_y * offset * side
-                    if self._point_near_river(tx, ty, 0):
-                        continue
-                    ix, iy = int(tx), int(ty)
-                    if not (0 <= ix < self.width and 0 <= iy < self.height):
-                        continue
-                    r = random.randint(3, 8)
-                    base_color = self.surface.get_at((ix, iy))[:3]
-                    canopy, trunk = self._forest_palette(base_color)
-                    self._draw_tree(ix, iy, r, canopy, trunk)
-
-    def _point_in_polygon(self, x: int, y: int, poly: list[tuple[int, int]]) -> bool:
-        """Return ``True`` if ``(x, y)`` lies inside polygon ``poly``."""
-        inside = False
-        j = len(poly) - 1
-        for i in range(len(poly)):
-            xi, yi = poly[i]
-            xj, yj = poly[j]
-            if ((yi > y) != (yj > y)) and (
-                x < (xj - xi) * (y - yi) / (yj - yi + 1e-9) + xi
-            ):
-                inside = not inside
-            j = i
-        return inside
+                    spots.append((px + norm_x * offset * side, py + norm_y * offset * side))
+        if not spots:
+            return
+        xs, ys = zip(*spots)
+        wet = self.river_index.near_many(xs, ys, 0)
+        for (tx, ty), skip in zip(spots, wet.tolist()):
+            if skip:
+                continue
+            ix, iy = int(tx), int(ty)
+            if not (0 <= ix < self.width and 0 <= iy < self.height):
+                continue
+            r = random.randint(3, 8)
+            # Snap the ground colour so bank trees share a few sprites
+            base_color = tuple(c & 0xF0 for c in self.surface.get_at((ix, iy))[:3])
+            canopy, trunk = self._forest_palette(base_color)
+            self._draw_tree(ix, iy, r, canopy, trunk)
+        self._flush_decorations()
 
     def _draw_forest(self, extra_dense: bool = False) -> None:
         """Draw a cluster of trees to represent a forested area."""
@@ -581,23 +692,29 @@ class PlanetSurface:
             tree_count = int(tree_count * 1.5)
         base_color = self.surface.get_at(area.center)[:3]
         canopy_color, trunk_color = self._forest_palette(base_color)
-        for _ in range(tree_count):
-            tx = random.randint(area.left, area.right)
-            ty = random.randint(area.top, area.bottom)
-            if self._point_near_river(tx, ty, margin):
+        trees = [
+            (random.randint(area.left, area.right), random.randint(area.top, area.bottom))
+            for _ in range(tree_count)
+        ]
+        wet = self.river_index.near_many(*zip(*trees), margin)
+        for (tx, ty), skip in zip(trees, wet.tolist()):
+            if skip:
                 continue
             r = random.randint(3, 8)
             self._draw_tree(tx, ty, r, canopy_color, trunk_color)
 
         # Scatter some small stones throughout the forest
-        for _ in range(30):
-            sx = random.randint(area.left, area.right)
-            sy = random.randint(area.top, area.bottom)
-            if self._point_near_river(sx, sy, margin):
+        stones = [
+            (random.randint(area.left, area.right), random.randint(area.top, area.bottom))
+            for _ in range(30)
+        ]
+        wet = self.river_index.near_many(*zip(*stones), margin)
+        for (sx, sy), skip in zip(stones, wet.tolist()):
+            if skip:
                 continue
             sr = random.randint(2, 5)
-            pygame.draw.circle(self.surface, (80, 80, 80), (sx, sy), sr)
-            pygame.draw.circle(self.collision_surface, (255, 255, 255), (sx, sy), sr)
+            self.decorations.stone(sx, sy, sr)
+        self._flush_decorations()
 
     def _draw_crater_field(self) -> None:
         """Draw several irregular craters that may contain rare minerals."""
@@ -618,11 +735,7 @@ class PlanetSurface:
                 points.append((px, py))
             pygame.draw.polygon(self.surface, (80, 80, 80), points)
             pygame.draw.polygon(self.collision_surface, (255, 255, 255), points)
-            rect = pygame.Rect(x - r, y - r, r * 2, r * 2)
-            for i in range(rect.left // self.cell, rect.right // self.cell + 1):
-                for j in range(rect.top // self.cell, rect.bottom // self.cell + 1):
-                    if 0 <= i < self.cols and 0 <= j < self.rows:
-                        self.blocked[j][i] = True
+            self.walk.fill_rect(x - r, y - r, x + r, y + r)
             if random.random() < 0.3:
                 self.pickups.append(ItemPickup(random.choice(minerals), x, y))
             if random.random() < 0.5:
@@ -652,7 +765,7 @@ class PlanetSurface:
                         ItemPickup(random.choice(minerals), int(nx), int(ny))
                     )
                 if random.random() < 0.3:
-                    self.creatures.append(
+                    self.creatures.add(
                         Creature(int(nx), int(ny), self.width, self.height, hostile=True)
                     )
 
@@ -661,19 +774,15 @@ class PlanetSurface:
         pygame.draw.circle(self.surface, (50, 50, 50), (int(x), int(y)), radius)
         pygame.draw.circle(self.collision_surface, (0, 0, 0, 0), (int(x), int(y)), radius)
         rect = pygame.Rect(int(x - radius), int(y - radius), radius * 2, radius * 2)
-        for i in range(rect.left // self.cell, rect.right // self.cell + 1):
-            for j in range(rect.top // self.cell, rect.bottom // self.cell + 1):
-                if 0 <= i < self.cols and 0 <= j < self.rows:
-                    self.blocked[j][i] = False
+        self.terrain_layer.invalidate(rect)
+        self.walk.fill_rect(rect.left, rect.top, rect.right, rect.bottom, False)
 
     def _carve_tunnel(self, x1: float, y1: float, x2: float, y2: float, radius: int) -> None:
-        """Draw a tunnel between two points clearing collisions."""
-        steps = int(max(abs(x2 - x1), abs(y2 - y1)) // 8)
-        for i in range(steps + 1):
-            t = i / steps
-            x = x1 + (x2 - x1) * t
-            y = y1 + (y2 - y1) * t
-            self._carve_circle(x, y, radius)
+        """Draw a capsule-shaped tunnel between two points clearing collisions."""
+        _draw_capsule(self.surface, (50, 50, 50), x1, y1, x2, y2, radius)
+        _draw_capsule(self.collision_surface, (0, 0, 0, 0), x1, y1, x2, y2, radius)
+        rows, cols = _capsule_cells(x1, y1, x2, y2, radius, self.cell, self.cols, self.rows)
+        self.walk.fill_cells(rows, cols, False)
 
     def _draw_mountains(self) -> None:
         """Draw mountain ranges that block movement on the grid."""
@@ -693,14 +802,12 @@ class PlanetSurface:
                 points.append((int(x), int(y)))
             pygame.draw.lines(self.surface, (120, 120, 120), False, points, width)
             pygame.draw.lines(self.collision_surface, (255, 255, 255), False, points, width)
-            min_x = min(p[0] for p in points) - width // 2
-            max_x = max(p[0] for p in points) + width // 2
-            min_y = min(p[1] for p in points) - width // 2
-            max_y = max(p[1] for p in points) + width // 2
-            for i in range(min_x // self.cell, max_x // self.cell + 1):
-                for j in range(min_y // self.cell, max_y // self.cell + 1):
-                    if 0 <= i < self.cols and 0 <= j < self.rows:
-                        self.blocked[j][i] = True
+            self.walk.fill_rect(
+                min(p[0] for p in points) - width // 2,
+                min(p[1] for p in points) - width // 2,
+                max(p[0] for p in points) + width // 2,
+                max(p[1] for p in points) + width // 2,
+            )
 
     def _draw_storms(self) -> None:
         """Overlay semi-transparent storm clouds that slow movement."""
@@ -711,7 +818,7 @@ class PlanetSurface:
             x = random.randint(0, self.width - w)
             y = random.randint(0, self.height - h)
             rect = pygame.Rect(x, y, w, h)
-            pygame.draw.ellipse(self.storm_surface, config.STORM_COLOR, rect)
+            self.storms.add(rect)
 
     def _spawn_platforms(self) -> None:
         """Create small floating platforms containing optional items."""
@@ -761,7 +868,7 @@ class PlanetSurface:
             x = random.randint(0, self.width - 1)
             y = random.randint(0, self.height - 1)
             hostile = random.random() < 0.5
-            self.creatures.append(
+            self.creatures.add(
                 Creature(x, y, self.width, self.height, hostile=hostile)
             )
 
@@ -776,7 +883,7 @@ class PlanetSurface:
                     hostile = random.random() < 0.5
                     creature = Creature(x, y, self.width, self.height, hostile=hostile)
                     creature.color = (80, 120, 200) if hostile else (60, 180, 190)
-                    self.creatures.append(creature)
+                    self.creatures.add(creature)
                     break
 
     def _draw_islands(self) -> None:
@@ -795,17 +902,7 @@ class PlanetSurface:
                 pts.append((int(cx + math.cos(ang) * rad), int(cy + math.sin(ang) * rad)))
             pygame.draw.polygon(self.surface, land_color, pts)
             pygame.draw.polygon(self.collision_surface, (0, 0, 0, 0), pts)
-            min_x = min(p[0] for p in pts)
-            max_x = max(p[0] for p in pts)
-            min_y = min(p[1] for p in pts)
-            max_y = max(p[1] for p in pts)
-            for i in range(min_x // self.cell, max_x // self.cell + 1):
-                for j in range(min_y // self.cell, max_y // self.cell + 1):
-                    if 0 <= i < self.cols and 0 <= j < self.rows:
-                        cx_cell = i * self.cell + self.cell // 2
-                        cy_cell = j * self.cell + self.cell // 2
-                        if self._point_in_polygon(cx_cell, cy_cell, pts):
-                            self.blocked[j][i] = False
+            self.walk.fill_polygon(pts, False)
 
     def _draw_underwater_biomes(self) -> None:
         """Create colourful patches representing underwater biomes."""
@@ -865,7 +962,9 @@ class PlanetSurface:
         """Generate slow moving lava rivers."""
         count = random.randint(1, 2)
         for _ in range(count):
-            points, width, side = self._draw_river(color=(180, 40, 40), damage=True)
+            # Moving rivers leave their start as scenery only; their current
+            # course is tested analytically by ``_dynamic_lava_at``
+            points, width, side = self._draw_river(color=(180, 40, 40), block=False)
             if side == "top":
                 direction = (0, 1)
             elif side == "bottom":
@@ -878,7 +977,6 @@ class PlanetSurface:
 
     def _update_lava_geysers(self, dt: float) -> None:
         """Advance timers, erupt geysers and apply damage."""
-        # surface will be cleared before drawing rivers and geysers
         for geyser in self.lava_geysers:
             geyser["timer"] -= dt
             if geyser["erupt"]:
@@ -897,67 +995,77 @@ class PlanetSurface:
                                 geyser["y"] + dy,
                             )
                         )
-                else:
-                    pygame.draw.circle(
-                        self.lava_surface,
-                        (200, 60, 60, 180),
-                        (geyser["x"], geyser["y"]),
-                        int(geyser["radius"] * 1.5),
-                    )
-                    if (
-                        math.hypot(self.explorer.x - geyser["x"], self.explorer.y - geyser["y"])
-                        < geyser["radius"] * 1.5
-                    ):
-                        self.explorer.take_damage(config.LAVA_GEYSER_DAMAGE * dt)
+                elif (
+                    math.hypot(self.explorer.x - geyser["x"], self.explorer.y - geyser["y"])
+                    < geyser["radius"] * 1.5
+                ):
+                    self.explorer.take_damage(config.LAVA_GEYSER_DAMAGE * dt)
             else:
                 if geyser["timer"] <= 0:
                     geyser["erupt"] = True
                     geyser["timer"] = config.LAVA_GEYSER_DURATION
 
     def _update_lava_rivers(self, dt: float) -> None:
-        """Move lava rivers and update collision masks."""
+        """Let lava rivers drift; their position is derived from elapsed time."""
         for river in self.moving_lava_rivers:
-            # erase previous position from collision surface
-            pygame.draw.lines(
-                self.collision_surface,
-                (0, 0, 0, 0),
-                False,
-                river.last_points,
-                river.width,
-            )
-            river.last_points = []
-            for i, (x, y) in enumerate(river.points):
-                nx = x + river.direction[0] * river.speed * dt
-                ny = y + river.direction[1] * river.speed * dt
-                river.points[i] = (nx, ny)
-                river.last_points.append((int(nx), int(ny)))
-            pygame.draw.lines(
-                self.lava_surface,
+            river.update(dt)
+
+    def _dynamic_lava_at(self, x: float, y: float) -> int:
+        """Return the terrain bits contributed by drifting rivers and geysers."""
+        for river in self.moving_lava_rivers:
+            if river.contains(x, y):
+                return WATER | LAVA
+        for geyser in self.lava_geysers:
+            if (
+                geyser["erupt"]
+                and math.hypot(x - geyser["x"], y - geyser["y"]) <= geyser["radius"] * 1.5
+            ):
+                return LAVA
+        return 0
+
+    def _draw_dynamic_lava(self, screen: pygame.Surface, offset_x: float, offset_y: float) -> None:
+        """Draw drifting rivers and erupting geysers that fall inside the view."""
+        view = pygame.Rect(int(offset_x), int(offset_y), config.WINDOW_WIDTH, config.WINDOW_HEIGHT)
+        overlay = self._lava_overlay
+        dirty: pygame.Rect | None = None
+        for river in self.moving_lava_rivers:
+            for run in river.visible_runs(view):
+                points = [(x - offset_x, y - offset_y) for x, y in run]
+                rect = pygame.draw.lines(overlay, (200, 60, 60, 180), False, points, river.width)
+                dirty = rect if dirty is None else dirty.union(rect)
+        for geyser in self.lava_geysers:
+            if not geyser["erupt"]:
+                continue
+            r = int(geyser["radius"] * 1.5)
+            if not view.colliderect((geyser["x"] - r, geyser["y"] - r, 2 * r, 2 * r)):
+                continue
+            rect = pygame.draw.circle(
+                overlay,
                 (200, 60, 60, 180),
-                False,
-                river.last_points,
-                river.width,
-            )
-            pygame.draw.lines(
-                self.collision_surface,
-                (255, 255, 255),
-                False,
-                river.last_points,
-                river.width,
+                (geyser["x"] - offset_x, geyser["y"] - offset_y),
+                r,
             )
+            dirty = rect if dirty is None else dirty.union(rect)
+        if dirty is not None:
+            screen.blit(overlay, dirty.topleft, dirty)
+            # Only the touched area needs clearing for the next frame
+            overlay.fill((0, 0, 0, 0), dirty)
 
     def _open_ice_hole(self, x: float, y: float, radius: int) -> None:
         """Create a temporary hole in the ice."""
         pygame.draw.circle(self.surface, (30, 80, 160), (int(x), int(y)), radius)
         pygame.draw.circle(self.collision_surface, (255, 255, 255), (int(x), int(y)), radius)
         pygame.draw.circle(self.ice_surface, (0, 0, 0, 0), (int(x), int(y)), radius)
+        self.terrain_layer.invalidate(
+            pygame.Rect(int(x) - radius, int(y) - radius, radius * 2, radius * 2)
+        )
         self.ice_holes.append({
             "x": x,
             "y": y,
             "radius": radius,
             "timer": config.ICE_HOLE_DURATION,
         })
-        self._update_collision_masks()
+        self._update_terrain_flags(WATER)
 
     def _close_ice_hole(self, hole: dict) -> None:
         """Refreeze a previously cracked ice hole."""
@@ -967,7 +1075,8 @@ class PlanetSurface:
         pygame.draw.circle(self.surface, BIOMES["ice world"].color, (int(x), int(y)), r)
         pygame.draw.circle(self.collision_surface, (0, 0, 0, 0), (int(x), int(y)), r)
         pygame.draw.circle(self.ice_surface, config.ICE_COLOR, (int(x), int(y)), r)
-        self._update_collision_masks()
+        self.terrain_layer.invalidate(pygame.Rect(int(x) - r, int(y) - r, r * 2, r * 2))
+        self._update_terrain_flags(WATER)
 
     def _shift_dunes(self) -> None:
         """Randomly toggle some blocked cells to mimic shifting sand dunes."""
@@ -975,15 +1084,15 @@ class PlanetSurface:
         for _ in range(changes):
             i = random.randrange(self.cols)
             j = random.randrange(self.rows)
-            self.blocked[j][i] = not self.blocked[j][i]
             rect = pygame.Rect(i * self.cell, j * self.cell, self.cell, self.cell)
             color = ENV_COLORS["desert"]
-            if self.blocked[j][i]:
+            if self.walk.toggle_cell(i, j):
                 pygame.draw.rect(self.collision_surface, (255, 255, 255), rect)
             else:
                 pygame.draw.rect(self.collision_surface, (0, 0, 0, 0), rect)
             pygame.draw.rect(self.surface, color, rect)
-        self._update_collision_masks()
+            self.terrain_layer.invalidate(rect)
+        self._update_terrain_flags()
 
     def _spawn_oasis(self) -> None:
         """Create a small water patch with healing plants."""
@@ -992,18 +1101,13 @@ class PlanetSurface:
         y = random.randint(r, self.height - r)
         pygame.draw.circle(self.surface, ENV_COLORS["ocean world"], (x, y), r)
         pygame.draw.circle(self.collision_surface, (255, 255, 255), (x, y), r)
-        for i in range((x - r) // self.cell, (x + r) // self.cell + 1):
-            for j in range((y - r) // self.cell, (y + r) // self.cell + 1):
-                if 0 <= i < self.cols and 0 <= j < self.rows:
-                    cx = i * self.cell + self.cell // 2
-                    cy = j * self.cell + self.cell // 2
-                    if math.hypot(cx - x, cy - y) <= r:
-                        self.blocked[j][i] = True
+        self.terrain_layer.invalidate(pygame.Rect(x - r, y - r, r * 2, r * 2))
+        self.walk.fill_circle(x, y, r)
         for _ in range(random.randint(1, 3)):
             hx = random.randint(x - r // 2, x + r // 2)
             hy = random.randint(y - r // 2, y + r // 2)
             self.healing_plants.append(HealingPlant(hx, hy))
-        self._update_collision_masks()
+        self._update_terrain_flags()
 
     def _draw_ice_fields(self) -> None:
         """Overlay semi-transparent ice zones that affect movement."""
@@ -1045,7 +1149,7 @@ class PlanetSurface:
         cell = self.cell
         cols = self.cols
         rows = self.rows
-        self.blocked = [[False for _ in range(cols)] for _ in range(rows)]
+        self.walk.clear()
         self.surface.fill((0, 0, 0))
         self.collision_surface.fill((0, 0, 0, 0))
 
@@ -1079,7 +1183,7 @@ class PlanetSurface:
                 rect = pygame.Rect(i * cell, j * cell, cell, cell)
                 pygame.draw.rect(self.surface, biome.color, rect)
                 if is_ocean_planet or biome_names[biome_idx] == "ocean world":
-                    self.blocked[j][i] = True
+                    self.walk.set_cell(i, j)
                     pygame.draw.rect(self.collision_surface, (255, 255, 255), rect)
                 for _ in range(3):
                     self._draw_patch(rect, biome)
@@ -1124,82 +1228,59 @@ class PlanetSurface:
             self._draw_gas_clouds()
             self._spawn_waste_deposits()
 
-        if self.storm_surface.get_width():
-            self.storm_mask = pygame.mask.from_surface(self.storm_surface)
-
-        if self.ice_surface.get_width():
-            self.ice_mask = pygame.mask.from_surface(self.ice_surface)
-
-        if self.lava_surface.get_width():
-            self.lava_mask = pygame.mask.from_surface(self.lava_surface)
-        if self.gas_surface.get_width():
-            self.gas_mask = pygame.mask.from_surface(self.gas_surface)
-
-        self.collision_mask = pygame.mask.from_surface(self.collision_surface)
-
-    def _update_collision_masks(self) -> None:
-        """Recreate masks after dynamic terrain changes."""
-        if self.lava_surface.get_width():
-            self.lava_mask = pygame.mask.from_surface(self.lava_surface)
-        self.collision_mask = pygame.mask.from_surface(self.collision_surface)
+        terrain = self.terrain
+        terrain.stamp_surface(ICE, self.ice_surface)
+        terrain.stamp_surface(GAS, self.gas_surface)
+        self.gas_bounds = self.gas_surface.get_bounding_rect()
+        self._update_terrain_flags()
+
+    def _update_terrain_flags(self, bits: int = WATER | LAVA | BLOCKED) -> None:
+        """Resample the given terrain bits after dynamic terrain changes."""
+        if bits & WATER:
+            self.terrain.stamp_surface(WATER, self.collision_surface)
+        if bits & LAVA:
+            self.terrain.stamp_surface(LAVA, self.lava_surface)
+        if bits & BLOCKED:
+            self.terrain.stamp_cells(BLOCKED, self.blocked, self.cell)
+            self.creatures.set_obstacles(self.blocked, self.cell)
+
+    def terrain_at(self, x: float, y: float) -> int:
+        """Return all terrain flags at ``(x, y)`` with a single lookup."""
+        flags = self.terrain.at(x, y)
+        if self.moving_lava_rivers or self.lava_geysers:
+            flags |= self._dynamic_lava_at(x, y)
+        return flags
+
+    def _walkable(self, flags: int) -> bool:
+        if flags & OUTSIDE:
+            return False
+        if flags & WATER:
+            return self.boat_active or self.player.inventory.get("traje de buceo", 0) > 0
+        return not flags & BLOCKED
 
     def is_walkable(self, x: float, y: float) -> bool:
         """Return ``True`` if the coordinates correspond to a walkable cell."""
-        ix = int(x)
-        iy = int(y)
-        if not (0 <= ix < self.width and 0 <= iy < self.height):
-            return False
-        if self.collision_mask and self.collision_mask.get_at((ix, iy)):
-            if self.boat_active:
-                return True
-            if self.player.inventory.get("traje de buceo", 0) > 0:
-                return True
-            return False
-        cx = ix // self.cell
-        cy = iy // self.cell
-        if 0 <= cx < self.cols and 0 <= cy < self.rows:
-            return not self.blocked[cy][cx]
-        return False
+        return self._walkable(self.terrain_at(x, y))
 
     def is_water(self, x: float, y: float) -> bool:
-        """Return ``True`` if ``(x, y)`` is water based on the collision mask."""
-        ix = int(x)
-        iy = int(y)
-        if not (0 <= ix < self.width and 0 <= iy < self.height):
-            return False
-        return bool(self.collision_mask and self.collision_mask.get_at((ix, iy)))
+        """Return ``True`` if ``(x, y)`` is water based on the collision surface."""
+        return bool(self.terrain_at(x, y) & WATER)
 
     def is_in_storm(self, x: float, y: float) -> bool:
         """Return ``True`` if ``(x, y)`` falls inside a storm zone."""
-        ix = int(x)
-        iy = int(y)
-        if not (0 <= ix < self.width and 0 <= iy < self.height):
-            return False
-        return bool(self.storm_mask and self.storm_mask.get_at((ix, iy)))
+        return bool(self.terrain.at(x, y) & STORM)
 
     def is_on_ice(self, x: float, y: float) -> bool:
         """Return ``True`` if ``(x, y)`` lies within an icy area."""
-        ix = int(x)
-        iy = int(y)
-        if not (0 <= ix < self.width and 0 <= iy < self.height):
-            return False
-        return bool(self.ice_mask and self.ice_mask.get_at((ix, iy)))
+        return bool(self.terrain.at(x, y) & ICE)
 
     def is_in_lava(self, x: float, y: float) -> bool:
         """Return ``True`` if ``(x, y)`` falls within a lava zone."""
-        ix = int(x)
-        iy = int(y)
-        if not (0 <= ix < self.width and 0 <= iy < self.height):
-            return False
-        return bool(self.lava_mask and self.lava_mask.get_at((ix, iy)))
+        return bool(self.terrain_at(x, y) & LAVA)
 
     def is_in_gas(self, x: float, y: float) -> bool:
         """Return ``True`` if ``(x, y)`` lies inside a toxic cloud."""
-        ix = int(x)
-        iy = int(y)
-        if not (0 <= ix < self.width and 0 <= iy < self.height):
-            return False
-        return bool(self.gas_mask and self.gas_mask.get_at((ix, iy)))
+        return bool(self.terrain.at(x, y) & GAS)
 
     def handle_event(self, event) -> bool:
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -1229,7 +1310,7 @@ class PlanetSurface:
             tx = self.explorer.x + random.randint(-40, 40)
             ty = self.explorer.y + random.randint(-40, 40)
             self._carve_circle(tx, ty, random.randint(10, 20))
-            self._update_collision_masks()
+            self._update_terrain_flags()
         if self.tremor_timer > 0:
             self.tremor_timer -= dt
             self.tremor_offset_x = random.uniform(-config.TREMOR_SHAKE, config.TREMOR_SHAKE)
@@ -1239,12 +1320,11 @@ class PlanetSurface:
             self.tremor_offset_y = 0.0
         speed = config.EXPLORER_SPEED
         wind_dx = 0.0
-        if (
-            self.planet.environment == "gas giant"
-            and self.is_in_storm(self.explorer.x, self.explorer.y)
-        ):
+        # One lookup answers every terrain question about the explorer's spot
+        here = self.terrain_at(self.explorer.x, self.explorer.y)
+        if self.planet.environment == "gas giant" and here & STORM:
             wind_dx = config.STORM_WIND_STRENGTH * dt
-        on_water = self.is_water(self.explorer.x, self.explorer.y)
+        on_water = here & WATER
         if self.boat_active:
             if on_water:
                 speed = config.BOAT_SPEED_WATER
@@ -1253,9 +1333,9 @@ class PlanetSurface:
             if self.boat:
                 self.boat.x = self.explorer.x
                 self.boat.y = self.explorer.y
-        if self.is_in_storm(self.explorer.x, self.explorer.y):
+        if here & STORM:
             speed *= config.STORM_SLOW_FACTOR
-        if self.is_on_ice(self.explorer.x, self.explorer.y):
+        if here & ICE:
             speed *= config.ICE_SLOW_FACTOR
         if self.planet.environment == "ice world":
             if self.snow_storm_active:
@@ -1263,7 +1343,6 @@ class PlanetSurface:
                 self.snow_storm_time -= dt
                 if self.snow_storm_time <= 0:
                     self.snow_storm_active = False
-                    self.snow_surface.fill((0, 0, 0, 0))
                     self.snow_storm_cooldown = random.uniform(
                         config.SNOW_STORM_INTERVAL_MIN, config.SNOW_STORM_INTERVAL_MAX
                     )
@@ -1275,13 +1354,12 @@ class PlanetSurface:
                         self.snow_storm_time = random.uniform(
                             config.SNOW_STORM_MIN_TIME, config.SNOW_STORM_MAX_TIME
                         )
-                        self.snow_surface.fill(config.SNOW_STORM_COLOR)
                     else:
                         self.snow_storm_cooldown = random.uniform(
                             config.SNOW_STORM_INTERVAL_MIN, config.SNOW_STORM_INTERVAL_MAX
                         )
             if (
-                self.is_on_ice(self.explorer.x, self.explorer.y)
+                here & ICE
                 and not self.boat_active
                 and random.random() < config.ICE_CRACK_PROBABILITY * dt
             ):
@@ -1296,10 +1374,8 @@ class PlanetSurface:
                     self._close_ice_hole(hole)
                     self.ice_holes.remove(hole)
         if self.planet.environment == "lava":
-            self.lava_surface.fill((0, 0, 0, 0))
             self._update_lava_rivers(dt)
             self._update_lava_geysers(dt)
-            self._update_collision_masks()
             if self.is_in_lava(self.explorer.x, self.explorer.y):
                 self.explorer.take_damage(config.LAVA_DAMAGE_RATE * dt)
         if self.planet.environment == "desert":
@@ -1307,7 +1383,6 @@ class PlanetSurface:
                 self.desert_storm_time -= dt
                 if self.desert_storm_time <= 0:
                     self.desert_storm_active = False
-                    self.desert_surface.fill((0, 0, 0, 0))
                     self._shift_dunes()
                     if random.random() < 0.25:
                         self._spawn_oasis()
@@ -1323,11 +1398,10 @@ class PlanetSurface:
                         config.DESERT_STORM_MIN_TIME,
                         config.DESERT_STORM_MAX_TIME,
                     )
-                    self.desert_surface.fill(config.DESERT_FILTER_COLOR)
         in_gas = False
         has_suit = self.player.inventory.get("traje aislante", 0) > 0
         if self.planet.environment == "toxic":
-            in_gas = self.is_in_gas(self.explorer.x, self.explorer.y)
+            in_gas = bool(here & GAS)
         self.explorer.update(keys, dt, self.width, self.height, speed, in_gas, has_suit)
         if not self.is_walkable(self.explorer.x, self.explorer.y):
             self.explorer.x, self.explorer.y = old_x, old_y
@@ -1337,35 +1411,36 @@ class PlanetSurface:
                 self.explorer.x = new_x
             if self.boat_active and self.boat:
                 self.boat.x = self.explorer.x
-            for platform in self.platforms:
-                if self.is_in_storm(platform.x, platform.y):
+            drifting = self.terrain.query(
+                [p.x for p in self.platforms], [p.y for p in self.platforms]
+            ) & STORM
+            for platform, in_storm in zip(self.platforms, drifting.tolist()):
+                if in_storm:
                     platform.x = max(
                         platform.radius,
                         min(self.width - platform.radius, platform.x + wind_dx),
                     )
         self.camera_x = self.explorer.x + self.tremor_offset_x
         self.camera_y = self.explorer.y + self.tremor_offset_y
-        for creature in self.creatures:
-            creature.update(self.explorer.x, self.explorer.y, dt)
-            if creature.hostile and math.hypot(
-                creature.x - self.explorer.x, creature.y - self.explorer.y
-            ) < creature.size + self.explorer.size:
-                self.explorer.take_damage(20 * dt)
-        for plant in self.healing_plants[:]:
-            if math.hypot(
-                plant.x - self.explorer.x, plant.y - self.explorer.y
-            ) < plant.radius + self.explorer.size:
+        self.creatures.wake(self.explorer.x, self.explorer.y)
+        self.ai.tick(dt)
+        self.creatures.update(dt)
+        contacts = self.creatures.hostile_contacts(
+            self.explorer.x, self.explorer.y, self.explorer.size
+        )
+        if contacts:
+            self.explorer.take_damage(20 * dt * contacts)
+        ex, ey = self.explorer.x, self.explorer.y
+        for plant in self.healing_plants.near(ex, ey, self.explorer.size):
+            if math.hypot(plant.x - ex, plant.y - ey) < plant.radius + self.explorer.size:
                 plant.interact(self.explorer)
                 self.healing_plants.remove(plant)
-        for pickup in self.pickups[:]:
-            if (
-                abs(self.explorer.x - pickup.x) < 10
-                and abs(self.explorer.y - pickup.y) < 10
-            ):
+        for pickup in self.pickups.near(ex, ey, 10):
+            if abs(ex - pickup.x) < 10 and abs(ey - pickup.y) < 10:
                 self.player.add_item(pickup.name)
                 self.pickups.remove(pickup)
-        for deposit in self.waste_deposits[:]:
-            if math.hypot(self.explorer.x - deposit.x, self.explorer.y - deposit.y) < deposit.radius + self.explorer.size:
+        for deposit in self.waste_deposits.near(ex, ey, self.explorer.size):
+            if math.hypot(ex - deposit.x, ey - deposit.y) < deposit.radius + self.explorer.size:
                 self.player.add_item("residuo toxico")
                 self.explorer.take_damage(config.RESIDUE_EXTRACTION_DAMAGE)
                 self.waste_deposits.remove(deposit)
@@ -1373,20 +1448,27 @@ class PlanetSurface:
     def draw(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
         offset_x = self.camera_x - config.WINDOW_WIDTH / 2
         offset_y = self.camera_y - config.WINDOW_HEIGHT / 2
-        screen.blit(self.surface, (-offset_x, -offset_y))
-        screen.blit(self.storm_surface, (-offset_x, -offset_y))
-        screen.blit(self.ice_surface, (-offset_x, -offset_y))
-        screen.blit(self.lava_surface, (-offset_x, -offset_y))
-        screen.blit(self.gas_surface, (-offset_x, -offset_y))
+        self.terrain_layer.draw(screen, offset_x, offset_y)
+        if self.storms:
+            self.storms.draw(screen, offset_x, offset_y)
+        if self.moving_lava_rivers or self.lava_geysers:
+            self._draw_dynamic_lava(screen, offset_x, offset_y)
+        if self.gas_bounds:
+            screen.blit(self.gas_surface, (-offset_x, -offset_y))
         for platform in self.platforms:
             platform.draw(screen, offset_x, offset_y)
-        for plant in self.healing_plants:
+        view = (
+            offset_x,
+            offset_y,
+            offset_x + config.WINDOW_WIDTH,
+            offset_y + config.WINDOW_HEIGHT,
+        )
+        for plant in self.healing_plants.in_box(*view):
             plant.draw(screen, offset_x, offset_y)
-        for deposit in self.waste_deposits:
+        for deposit in self.waste_deposits.in_box(*view):
             deposit.draw(screen, offset_x, offset_y)
-        for creature in self.creatures:
-            creature.draw(screen, offset_x, offset_y)
-        for pickup in self.pickups:
+        self.creatures.draw(screen, offset_x, offset_y)
+        for pickup in self.pickups.in_box(*view):
             show = (
                 abs(self.explorer.x - pickup.x) < 40
                 and abs(self.explorer.y - pickup.y) < 40
@@ -1417,9 +1499,9 @@ class PlanetSurface:
             self.boat.draw(screen, offset_x, offset_y)
         self.explorer.draw(screen, offset_x, offset_y)
         if self.desert_storm_active:
-            screen.blit(self.desert_surface, (-offset_x, -offset_y))
+            self.sandstorm_tint.draw(screen)
         if self.snow_storm_active:
-            screen.blit(self.snow_surface, (-offset_x, -offset_y))
+            self.snowstorm_tint.draw(screen)
         # exit button
         pygame.draw.rect(screen, (60, 60, 90), self.exit_rect)
         pygame.draw.rect(screen, (200, 200, 200), self.exit_rect, 1)
@@ -0,0 +1,76 @@
+"""Free-list pools for short-lived objects."""
+
+from dataclasses import dataclass
+
+import config
+
+
+@dataclass
+class PoolStats:
+    """Counters describing how a pool has been used."""
+
+    name: str
+    created: int
+    reused: int
+    released: int
+    free: int
+
+
+class Pool:
+    """Free list of reusable instances of one ``__slots__`` class.
+
+    Pooled classes implement ``reset(*args)`` to initialise themselves;
+    ``acquire`` calls it on a recycled instance or on a fresh one built
+    with ``cls.__new__``. Only exact instances of ``cls`` are taken back,
+    so subclasses can share a creation site without polluting the pool.
+    """
+
+    def __init__(self, cls: type, capacity: int = config.POOL_CAPACITY) -> None:
+        self.cls = cls
+        self.capacity = capacity
+        self._free: list = []
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        POOLS.append(self)
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            self.reused += 1
+        else:
+            obj = self.cls.__new__(self.cls)
+            self.created += 1
+        obj.reset(*args, **kwargs)
+        return obj
+
+    def release(self, obj) -> None:
+        if type(obj) is self.cls and len(self._free) < self.capacity:
+            self._free.append(obj)
+            self.released += 1
+
+    def release_all(self, objs) -> None:
+        for obj in objs:
+            self.release(obj)
+
+    def stats(self) -> PoolStats:
+        return PoolStats(
+            self.cls.__name__, self.created, self.reused, self.released, len(self._free)
+        )
+
+
+POOLS: list[Pool] = []
+
+
+def pool_stats() -> list[PoolStats]:
+    """Return the statistics of every pool created so far."""
+    return [pool.stats() for pool in POOLS]
+
+
+def pool_report() -> str:
+    """Return one line of usage counters per pool, for the exit report."""
+    return "\n".join(
+        f"{s.name}: {s.created} created, {s.reused} reused, "
+        f"{s.released} released, {s.free} free"
+        for s in pool_stats()
+    )
@@ -0,0 +1,84 @@
+"""Grid of river segments for fast "is this point near water" tests."""
+
+import math
+
+import numpy as np
+
+import config
+from spatial_index import SpatialIndex
+
+
+def segment_distances(px, py, x1, y1, x2, y2) -> np.ndarray:
+    """Return the ``points x segments`` distances from each point to each segment."""
+    px = np.asarray(px, dtype=float)[:, None]
+    py = np.asarray(py, dtype=float)[:, None]
+    x1 = np.asarray(x1, dtype=float)[None, :]
+    y1 = np.asarray(y1, dtype=float)[None, :]
+    dx = np.asarray(x2, dtype=float)[None, :] - x1
+    dy = np.asarray(y2, dtype=float)[None, :] - y1
+    # Degenerate segments collapse to their first point with t = 0
+    length2 = np.maximum(dx * dx + dy * dy, 1e-12)
+    t = np.clip(((px - x1) * dx + (py - y1) * dy) / length2, 0.0, 1.0)
+    return np.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
+
+
+class RiverIndex:
+    """River polylines split into segments and bucketed by a :class:`SpatialIndex`.
+
+    Each segment is stored with half its river's width, so proximity tests
+    measure the distance to the river's bank rather than its centreline.
+    """
+
+    def __init__(self, cell: int = config.RIVER_INDEX_CELL) -> None:
+        self._grid = SpatialIndex(cell)
+        self._segments: list[tuple[float, float, float, float, float]] = []
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def add(self, points: list[tuple[float, float]], width: float) -> None:
+        half = width / 2
+        for (x1, y1), (x2, y2) in zip(points, points[1:]):
+            self._grid.insert(
+                len(self._segments),
+                (x1 + x2) / 2,
+                (y1 + y2) / 2,
+                math.hypot(x2 - x1, y2 - y1) / 2 + half,
+            )
+            self._segments.append((x1, y1, x2, y2, half))
+
+    def _nearby(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        ids = [entry[0] for entry in self._grid.candidates(x0, y0, x1, y1)]
+        return np.array([self._segments[i] for i in ids], dtype=float).reshape(-1, 5)
+
+    def near(self, x: float, y: float, margin: float = 0.0) -> bool:
+        """Return ``True`` if ``(x, y)`` lies within ``margin`` of any river bank."""
+        return bool(self.near_many([x], [y], margin)[0])
+
+    def near_many(self, xs, ys, margin: float = 0.0) -> np.ndarray:
+        """Vectorised :meth:`near` for a batch of points.
+
+        Points are grouped by grid cell and each group is only tested
+        against the segments bucketed around its own cell, so a batch
+        spread along a whole river still checks nearby segments only.
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        out = np.zeros(len(xs), dtype=bool)
+        if not len(xs) or not self._segments:
+            return out
+        cell = self._grid.cell
+        keys = np.floor(xs / cell).astype(np.int64) * 1_000_003 + np.floor(ys / cell).astype(np.int64)
+        order = np.argsort(keys, kind="stable")
+        starts = np.flatnonzero(np.r_[True, keys[order][1:] != keys[order][:-1]])
+        for group in np.split(order, starts[1:]):
+            gx = xs[group]
+            gy = ys[group]
+            segs = self._nearby(
+                gx.min() - margin, gy.min() - margin, gx.max() + margin, gy.max() + margin
+            )
+            if not len(segs):
+                continue
+            dist = segment_distances(gx, gy, segs[:, 0], segs[:, 1], segs[:, 2], segs[:, 3])
+            out[group] = (dist <= segs[:, 4] + margin).any(axis=1)
+        return out
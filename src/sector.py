@@ -4,6 +4,7 @@ import pygame
 from star_system import StarSystem
 from blackhole import BlackHole
 from wormhole import WormHole
+from spatial_index import SpatialIndex
 import config
 
 class Sector:
@@ -49,6 +50,20 @@ class Sector:
         if random.random() < config.WORMHOLE_CHANCE:
             self._add_wormhole_pair()
 
+        self.index = SpatialIndex()
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Re-bucket every solid body; planets orbit and asteroids get mined."""
+        index = self.index
+        index.clear()
+        for system in self.systems:
+            index.insert(system.star, system.star.x, system.star.y, system.star.radius)
+            for body in system.planets + system.asteroids + system.stations:
+                index.insert(body, body.x, body.y, body.radius)
+        for hole in self.blackholes:
+            index.insert(hole, hole.x, hole.y, hole.radius)
+
     def _add_wormhole_pair(self) -> None:
         """Generate and store a paired set of wormholes in this sector."""
         first = None
@@ -94,6 +109,7 @@ class Sector:
             system.update(dt)
         for hole in self.blackholes:
             hole.update(dt)
+        self._rebuild_index()
 
     def draw(
         self,
@@ -120,6 +136,17 @@ class Sector:
                 return True
         return False
 
+    def sweep_circle(self, x0: float, y0: float, x1: float, y1: float, radius: float):
+        """Return the first body hit by a circle moving through this sector."""
+        if (
+            max(x0, x1) + radius < self.x
+            or min(x0, x1) - radius > self.x + self.width
+            or max(y0, y1) + radius < self.y
+            or min(y0, y1) - radius > self.y + self.height
+        ):
+            return None
+        return self.index.sweep(x0, y0, x1, y1, radius)
+
     def get_object_at_point(self, x: float, y: float, radius: float):
         """Return the star or planet at the given point if any."""
         if not (self.x <= x <= self.x + self.width and self.y <= y <= self.y + self.height):
@@ -1,5 +1,6 @@
 import pygame
 import math
+import types
 from dataclasses import dataclass, field
 import config
 import control_settings as controls
@@ -19,20 +20,18 @@ from combat import (
     SlowField,
     SporeCloud,
     BasicWeapon,
+    render_projectiles,
 )
 from light_channeler import Channeler, Battery, StarTurret
 from artifact import (
     Artifact,
     AreaShieldAura,
     AreaShieldArtifact,
-    EMPWave,
-    TractorProbe,
-    RepairNanobots,
-    SolarLink,
-    Decoy,
-    MiningBeam,
 )
-from blackhole import TemporaryBlackHole
+from spatial_index import SweepHit, sweep_circle
+from special_systems import SpecialSystems
+from combat_events import compact
+from particles import PARTICLES
 
 
 @dataclass
@@ -94,30 +93,23 @@ SHIP_MODELS = [
 ]
 
 
-class _ShipParticle:
-    """Simple exhaust particle emitted by a ship."""
-
-    def __init__(self, x: float, y: float, vx: float, vy: float) -> None:
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = config.SHIP_PARTICLE_COLOR
-        self.lifetime = config.SHIP_PARTICLE_DURATION
-        # Store starting lifetime so we can fade the particle out over time
-        self.max_life = config.SHIP_PARTICLE_DURATION
-
-    def update(self, dt: float) -> None:
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.lifetime -= dt
+def hyperjump_duration(dist: float) -> float:
+    """Return the travel time of a hyperjump covering ``dist`` pixels."""
+    d_pc = dist / config.HYPERJUMP_UNIT
+    v = config.HYPERJUMP_BASE_SPEED * (
+        1 + config.HYPERJUMP_SPEED_SCALE * math.log10(1 + d_pc / config.HYPERJUMP_D0)
+    )
+    t = d_pc / v if v > 0 else 0.0
+    return max(config.HYPERJUMP_MIN_TIME, min(t, config.HYPERJUMP_MAX_TIME))
 
-    def expired(self) -> bool:
-        return self.lifetime <= 0
 
 class Ship:
     """Simple controllable ship with optional model attributes."""
 
+    # Shared queue that batches specials from all ships; ``None`` updates
+    # each ship's specials immediately.
+    special_systems: SpecialSystems | None = None
+
     def __init__(
         self,
         x: float,
@@ -133,6 +125,12 @@ class Ship:
         self.vx = 0.0
         self.vy = 0.0
         self.autopilot_target = None
+        self.autopilot_route: list = []
+        self._autopilot_goal = None
+        self._autopilot_wait = 0.0
+        self._autopilot_detours = 0
+        self._detour_turn = 1
+        self.flow_field = None
         self.orbit_target = None
         self.orbit_time = 0.0
         self.orbit_radius = 0.0
@@ -165,8 +163,10 @@ class Ship:
             w.owner = self
         self.projectiles: list[Projectile] = []
         self.specials: list = []
-        self.particles: list[_ShipParticle] = []
+        # Exhaust lives in the shared particle engine, tagged by this id
+        self.emitter = PARTICLES.new_emitter()
         self._structures: list | None = None
+        self._structures_source: list | None = None
         shield_strength = model.shield if model else 100
         self.shield = Shield(max_strength=shield_strength)
         self.artifacts: list[Artifact] = []
@@ -231,13 +231,13 @@ class Ship:
         structures: list | None = None,
     ) -> None:
         self._structures = list(structures or [])
+        self._structures_source = structures
         # Include any active drones launched from capital ships or other
         # structures so they can participate in collision checks.
         for struct in structures or []:
             for dr in getattr(struct, "drones", []):
                 self._structures.append(dr)
         self._sectors = sectors
-        self._update_particles(dt)
         if self.invisible_timer > 0:
             self.invisible_timer = max(0.0, self.invisible_timer - dt)
         if self.orbit_cooldown > 0:
@@ -271,6 +271,9 @@ class Ship:
             )
             return
 
+        if not self.pilot and self.flow_field is not None:
+            self._update_flow(dt, world_width, world_height, blackholes)
+
         if self.pilot:
             accel = (
                 config.SHIP_ACCELERATION * self.accel_factor * self.speed_factor
@@ -322,31 +325,81 @@ class Ship:
                     hole.apply_pull(self, dt)
 
             old_x, old_y = self.x, self.y
-
-            self.x += self.vx * dt
-            self.y += self.vy * dt
-
-            self.x = max(0, min(world_width, self.x))
-            self.y = max(0, min(world_height, self.y))
-
-            if self._check_collision(sectors):
-                self.x, self.y = old_x, old_y
-                self.vx *= -config.BOUNCE_FACTOR
-                self.vy *= -config.BOUNCE_FACTOR
-                # Nudge slightly away from the obstacle
-                self.x += self.vx * dt
-                self.y += self.vy * dt
+            new_x = max(0, min(world_width, self.x + self.vx * dt))
+            new_y = max(0, min(world_height, self.y + self.vy * dt))
+            # Sweep the whole step so boosts and long frames cannot tunnel
+            hit = self._sweep_collision(old_x, old_y, new_x, new_y)
+            if hit:
+                self._bounce(hit, old_x, old_y, new_x, new_y)
+            else:
+                self.x, self.y = new_x, new_y
 
         self._update_projectiles(dt, world_width, world_height)
         self._update_specials(dt, world_width, world_height, targets)
 
-    def start_autopilot(self, target) -> None:
+    def start_autopilot(self, target, route=None) -> None:
+        """Fly to ``target``, following the legs of ``route`` when given."""
         if not self.pilot:
             return
-        self.autopilot_target = target
+        self._autopilot_goal = target
+        self._autopilot_detours = 0
+        self.autopilot_route = list(route.legs) if route else []
+        if self.autopilot_route:
+            self._advance_route()
+        else:
+            self.autopilot_target = target
+
+    def follow_flow(self, field) -> None:
+        """Steer toward ``field``'s goal by sampling the shared flow field."""
+        self.flow_field = field
+
+    def _update_flow(
+        self, dt: float, world_width: int, world_height: int, blackholes: list | None
+    ) -> None:
+        field = self.flow_field
+        if math.hypot(field.goal_x - self.x, field.goal_y - self.y) < config.FLOW_FIELD_ARRIVE_RADIUS:
+            self.flow_field = None
+            self.vx = 0.0
+            self.vy = 0.0
+            return
+        dir_x, dir_y = field.sample(self.x, self.y)
+        accel = config.SHIP_ACCELERATION * self.accel_factor * self.speed_factor
+        self.vx += dir_x * accel * dt
+        self.vy += dir_y * accel * dt
+        self.vx *= config.SHIP_FRICTION
+        self.vy *= config.SHIP_FRICTION
+        speed_limit = config.AUTOPILOT_SPEED * self.speed_factor
+        vel = math.hypot(self.vx, self.vy)
+        if vel > speed_limit:
+            self.vx *= speed_limit / vel
+            self.vy *= speed_limit / vel
+        if vel > 1e-3:
+            self.angle = math.atan2(self.vy, self.vx)
+        for hole in blackholes or []:
+            hole.apply_pull(self, dt)
+        self.x = max(0, min(world_width, self.x + self.vx * dt))
+        self.y = max(0, min(world_height, self.y + self.vy * dt))
 
     def cancel_autopilot(self) -> None:
         self.autopilot_target = None
+        self.autopilot_route = []
+
+    def _advance_route(self) -> None:
+        """Move on to the next leg of ``autopilot_route``."""
+        self._autopilot_wait = 0.0
+        if getattr(self.autopilot_target, "kind", None) != "detour":
+            self._autopilot_detours = 0
+        if not self.autopilot_route:
+            self.autopilot_target = None
+            return
+        leg = self.autopilot_route.pop(0)
+        self.autopilot_target = getattr(leg, "target", None) or leg
+
+    def hyperjump_wait(self) -> float | None:
+        """Return seconds until a hyperjump can start, or ``None`` if it cannot."""
+        if not self.pilot or self.hyperjump_target is not None or self.hyperjump_timer > 0:
+            return None
+        return self.hyperjump_cooldown
 
     def start_hyperjump(self, x: float, y: float) -> None:
         """Initiate a hyperjump to the given coordinates."""
@@ -363,15 +416,7 @@ class Ship:
         # Face the ship toward its destination
         self.angle = math.atan2(y - self.y, x - self.x)
         dist = math.hypot(x - self.x, y - self.y)
-        d_pc = dist / config.HYPERJUMP_UNIT
-        v = config.HYPERJUMP_BASE_SPEED * (
-            1 + config.HYPERJUMP_SPEED_SCALE * math.log10(1 + d_pc / config.HYPERJUMP_D0)
-        )
-        self.hyperjump_anim_time = d_pc / v if v > 0 else 0.0
-        self.hyperjump_anim_time = max(
-            config.HYPERJUMP_MIN_TIME,
-            min(self.hyperjump_anim_time, config.HYPERJUMP_MAX_TIME),
-        )
+        self.hyperjump_anim_time = hyperjump_duration(dist)
         self.hyperjump_elapsed = 0.0
         self._hyperjump_start = (self.x, self.y)
         self.autopilot_target = None
@@ -452,20 +497,49 @@ class Ship:
         sectors: list,
         blackholes: list | None = None,
     ) -> None:
-        dest_x, dest_y = self.autopilot_target.x, self.autopilot_target.y
+        target = self.autopilot_target
+        kind = getattr(target, "kind", None)
+        if kind == "jump":
+            self.start_hyperjump(target.x, target.y)
+            if self.hyperjump_target is not None:
+                self._advance_route()
+                return
+            # The drive is not ready: fly toward the jump point meanwhile
+            # and jump as soon as it can, so the route never stalls
+        if kind in ("wormhole", "portal"):
+            # Wait at the entry until the transit moves us to its exit
+            self._autopilot_wait += dt
+            if math.hypot(target.x - self.x, target.y - self.y) < config.NAV_WAYPOINT_RADIUS:
+                self._advance_route()
+            elif self._autopilot_wait > config.NAV_TRANSIT_TIMEOUT:
+                self.autopilot_route = []
+                self.autopilot_target = self._autopilot_goal
+            self.vx *= config.SHIP_FRICTION
+            self.vy *= config.SHIP_FRICTION
+            return
+
+        dest_x, dest_y = target.x, target.y
         dx = dest_x - self.x
         dy = dest_y - self.y
         distance = math.hypot(dx, dy)
+        if (
+            (kind == "fly" or kind == "detour")
+            and self.autopilot_route
+            and getattr(self.autopilot_route[0], "kind", None) not in ("wormhole", "portal")
+            and distance < config.NAV_WAYPOINT_RADIUS
+        ):
+            self._advance_route()
+            return
         speed_limit = config.AUTOPILOT_SPEED * self.speed_factor
-        if isinstance(self.autopilot_target, Planet):
+        if isinstance(target, Planet):
             speed_limit = config.PLANET_LANDING_SPEED * self.speed_factor
         step = speed_limit * dt
         if distance <= step:
             self.x = dest_x
             self.y = dest_y
-            self.autopilot_target = None
             self.vx = 0.0
             self.vy = 0.0
+            self._advance_route()
             return
 
         angle = math.atan2(dy, dx)
@@ -495,13 +569,10 @@ class Ship:
                 self.x += self.vx * dt
                 self.y += self.vy * dt
 
-        if self._check_collision(sectors):
-            self.x, self.y = old_x, old_y
-            self.vx *= -config.BOUNCE_FACTOR
-            self.vy *= -config.BOUNCE_FACTOR
-            self.x += self.vx * dt
-            self.y += self.vy * dt
-            self.autopilot_target = None
+        hit = self._sweep_collision(old_x, old_y, self.x, self.y)
+        if hit:
+            self._bounce(hit, old_x, old_y, self.x, self.y)
+            self._detour(dest_x, dest_y)
 
         self._update_projectiles(dt, world_width, world_height)
 
@@ -552,27 +623,78 @@ class Ship:
                 t = min(t_candidates)
         return target.x + dvx * t, target.y + dvy * t
 
-    def _check_collision(self, sectors: list) -> bool:
+    def _detour(self, dest_x: float, dest_y: float) -> None:
+        """Sidestep an obstacle blocking the autopilot instead of stopping."""
+        goal = self._autopilot_goal
+        if self.autopilot_target is goal and goal is not None:
+            reach = getattr(goal, "radius", 0) + self.collision_radius
+            if math.hypot(goal.x - self.x, goal.y - self.y) < reach + config.NAV_DETOUR_DISTANCE:
+                # Bumped into the destination itself, so we have arrived
+                self.cancel_autopilot()
+                return
+        self._autopilot_detours += 1
+        if self._autopilot_detours > config.NAV_MAX_DETOURS:
+            self.cancel_autopilot()
+            return
+        angle = math.atan2(dest_y - self.y, dest_x - self.x)
+        dist = config.NAV_DETOUR_DISTANCE
+        steps = max(1, int(dist // self.collision_radius))
+        # Keep turning the same way as the previous detour so the ship works
+        # its way around an obstacle instead of oscillating in front of it
+        turn = self._detour_turn
+        for side in (turn, -turn, 2 * turn, -2 * turn, 3 * turn, -3 * turn):
+            ang = angle + side * math.pi / 4
+            x = self.x + math.cos(ang) * dist
+            y = self.y + math.sin(ang) * dist
+            if not any(
+                self._structure_collision(
+                    self.x + (x - self.x) * i / steps,
+                    self.y + (y - self.y) * i / steps,
+                    self.collision_radius,
+                )
+                for i in range(1, steps + 1)
+            ):
+                break
+        else:
+            self.cancel_autopilot()
+            return
+        self._detour_turn = 1 if side > 0 else -1
+        if getattr(self.autopilot_target, "kind", None) != "detour":
+            self.autopilot_route.insert(0, self.autopilot_target)
+        self.autopilot_target = types.SimpleNamespace(kind="detour", x=x, y=y)
+
+    def _sweep_collision(
+        self, x0: float, y0: float, x1: float, y1: float
+    ) -> SweepHit | None:
+        """Return the first obstacle hit while moving from ``(x0, y0)`` to ``(x1, y1)``."""
         radius = self.collision_radius
-        for sector in sectors:
-            if sector.collides_with_point(self.x, self.y, radius):
-                return True
-        for struct in self._structures:
-            # Skip small drones so they don't trap the player when colliding.
-            if isinstance(struct, Drone):
-                continue
-            if struct is self:
+        best = None
+        for sector in getattr(self, "_sectors", None) or []:
+            hit = sector.sweep_circle(x0, y0, x1, y1, radius)
+            if hit and (best is None or hit.t < best.t):
+                best = hit
+        for struct in self._structures or []:
+            if isinstance(struct, Drone) or struct is self:
                 continue
-            # Drones only provide ``size`` representing their collision radius,
-            # while larger structures expose a ``radius`` attribute. Handle both
-            # so ships properly avoid them.
-            if hasattr(struct, "radius"):
-                struct_radius = struct.radius
-            else:
-                struct_radius = getattr(struct, "size", 0)
-            if math.hypot(struct.x - self.x, struct.y - self.y) < radius + struct_radius:
-                return True
-        return False
+            struct_radius = (
+                struct.radius if hasattr(struct, "radius") else getattr(struct, "size", 0)
+            )
+            hit = sweep_circle(x0, y0, x1 - x0, y1 - y0, radius, struct.x, struct.y, struct_radius)
+            if hit and (best is None or hit.t < best.t):
+                hit.obj = struct
+                best = hit
+        return best
+
+    def _bounce(self, hit: SweepHit, x0: float, y0: float, x1: float, y1: float) -> None:
+        """Stop at the point of impact and reflect the velocity off the surface."""
+        t = max(0.0, hit.t - 1e-3)
+        push = hit.depth + 0.5
+        self.x = x0 + (x1 - x0) * t + hit.nx * push
+        self.y = y0 + (y1 - y0) * t + hit.ny * push
+        dot = self.vx * hit.nx + self.vy * hit.ny
+        if dot < 0:
+            self.vx = (self.vx - 2 * dot * hit.nx) * config.BOUNCE_FACTOR
+            self.vy = (self.vy - 2 * dot * hit.ny) * config.BOUNCE_FACTOR
 
     def _structure_collision(self, x: float, y: float, r: float = 0) -> bool:
         """Return ``True`` if the point overlaps any stationary structure."""
@@ -830,7 +952,8 @@ class Ship:
                 art.activate(self, targets)
 
     def _update_projectiles(self, dt: float, world_width: int, world_height: int) -> None:
-        for proj in list(self.projectiles):
+        dead = []
+        for proj in self.projectiles:
             proj.update(dt)
             hit = self._structure_collision(
                 proj.x,
@@ -839,220 +962,40 @@ class Ship:
             )
             out_of_bounds = not (0 <= proj.x <= world_width and 0 <= proj.y <= world_height)
             if proj.expired() or out_of_bounds or hit:
-                self.projectiles.remove(proj)
-
-    def _update_particles(self, dt: float) -> None:
-        for p in list(self.particles):
-            p.update(dt)
-            if p.expired():
-                self.particles.remove(p)
+                dead.append(proj)
+        compact(self.projectiles, dead)
+        Projectile.pool.release_all(dead)
 
     def _emit_particle(self) -> None:
-        if len(self.particles) >= config.SHIP_PARTICLE_MAX:
-            self.particles.pop(0)
         hx = self.size * 1.5 / 2
         px = self.x - math.cos(self.angle) * hx
         py = self.y - math.sin(self.angle) * hx
         speed = 60.0
         vx = self.vx - math.cos(self.angle) * speed
         vy = self.vy - math.sin(self.angle) * speed
-        self.particles.append(_ShipParticle(px, py, vx, vy))
+        if PARTICLES.count(self.emitter) >= config.SHIP_PARTICLE_MAX:
+            return
+        PARTICLES.emit(
+            self.emitter,
+            px,
+            py,
+            vx,
+            vy,
+            life=config.SHIP_PARTICLE_DURATION,
+            size=2,
+            color=config.SHIP_PARTICLE_COLOR,
+            shrink=True,
+        )
 
     def _update_specials(self, dt: float, world_width: int, world_height: int, targets: list | None = None) -> None:
-        structures = list(self._structures or [])
-        for obj in list(self.specials):
-            if isinstance(obj, LaserBeam):
-                obj.update(dt, (targets or []) + structures)
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, TimedMine):
-                obj.update(dt)
-                if obj.exploded:
-                    if targets:
-                        for tar in targets:
-                            if math.hypot(tar.ship.x - obj.x, tar.ship.y - obj.y) <= obj.radius:
-                                tar.ship.take_damage(obj.damage)
-                    for struct in structures:
-                        sr = getattr(struct, "radius", getattr(struct, "size", 0))
-                        if math.hypot(struct.x - obj.x, struct.y - obj.y) <= obj.radius + sr:
-                            pass
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, Drone):
-                obj.update(dt, (targets or []) + structures)
-                for proj in list(obj.projectiles):
-                    for tar in targets or []:
-                        if (
-                            math.hypot(proj.x - tar.ship.x, proj.y - tar.ship.y)
-                            <= tar.ship.collision_radius
-                        ):
-                            tar.ship.take_damage(proj.damage)
-                            obj.projectiles.remove(proj)
-                            break
-                    else:
-                        for struct in structures:
-                            sr = getattr(struct, "radius", getattr(struct, "size", 0))
-                            if math.hypot(proj.x - struct.x, proj.y - struct.y) <= sr:
-                                obj.projectiles.remove(proj)
-                                break
-                drone_rect = pygame.Rect(
-                    obj.x - obj.size / 2,
-                    obj.y - obj.size / 2,
-                    obj.size,
-                    obj.size,
-                )
-                for tar in targets or []:
-                    for proj in list(tar.ship.projectiles):
-                        if drone_rect.collidepoint(proj.x, proj.y):
-                            obj.hp -= proj.damage
-                            tar.ship.projectiles.remove(proj)
-                            if obj.hp <= 0:
-                                break
-                for struct in structures:
-                    for proj in list(getattr(struct, "projectiles", [])):
-                        if drone_rect.collidepoint(proj.x, proj.y):
-                            obj.hp -= getattr(proj, "damage", 0)
-                            getattr(struct, "projectiles").remove(proj)
-                            if obj.hp <= 0:
-                                break
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, BombDrone):
-                obj.update(dt, (targets or []) + structures)
-                bomb_rect = pygame.Rect(
-                    obj.x - obj.size / 2,
-                    obj.y - obj.size / 2,
-                    obj.size,
-                    obj.size,
-                )
-                hit = False
-                for tar in targets or []:
-                    for proj in list(tar.ship.projectiles):
-                        if bomb_rect.collidepoint(proj.x, proj.y):
-                            obj.hp -= proj.damage
-                            tar.ship.projectiles.remove(proj)
-                            if obj.hp <= 0:
-                                hit = True
-                                break
-                    if hit:
-                        break
-                    if (
-                        math.hypot(tar.ship.x - obj.x, tar.ship.y - obj.y)
-                        <= tar.ship.collision_radius
-                    ):
-                        hit = True
-                        break
-                if not hit:
-                    for struct in structures:
-                        for proj in list(getattr(struct, "projectiles", [])):
-                            if bomb_rect.collidepoint(proj.x, proj.y):
-                                obj.hp -= getattr(proj, "damage", 0)
-                                getattr(struct, "projectiles").remove(proj)
-                                if obj.hp <= 0:
-                                    hit = True
-                                    break
-                        if hit:
-                            break
-                        sr = getattr(struct, "radius", getattr(struct, "size", 0))
-                        if math.hypot(struct.x - obj.x, struct.y - obj.y) <= sr:
-                            hit = True
-                            break
-                if hit:
-                    obj._explode()
-                if obj.exploded:
-                    if targets:
-                        for tar in targets:
-                            if math.hypot(tar.ship.x - obj.x, tar.ship.y - obj.y) <= obj.radius:
-                                tar.ship.take_damage(obj.damage)
-                    for struct in structures:
-                        sr = getattr(struct, "radius", getattr(struct, "size", 0))
-                        if math.hypot(struct.x - obj.x, struct.y - obj.y) <= obj.radius + sr:
-                            pass
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, IonSymbiontShot):
-                obj.update(dt, targets or [])
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, SlowField):
-                obj.update(dt)
-                for tar in targets or []:
-                    obj.apply_slow(tar.ship)
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, SporeCloud):
-                tick = obj.update(dt)
-                for struct in structures:
-                    if obj.contains(struct):
-                        sr = getattr(struct, "radius", getattr(struct, "size", 0))
-                        dist = math.hypot(struct.x - obj.x, struct.y - obj.y) - sr
-                        if dist <= 0:
-                            self.specials.remove(obj)
-                            break
-                        obj.radius = min(obj.radius, dist)
-                else:
-                    if tick:
-                        for tar in targets or []:
-                            if obj.contains(tar.ship):
-                                tar.ship.take_damage(obj.damage)
-                    if obj.expired():
-                        self.specials.remove(obj)
-            elif isinstance(obj, EMPWave):
-                obj.update(dt)
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, TractorProbe):
-                obj.update(dt)
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, TemporaryBlackHole):
-                obj.update(dt)
-                obj.apply_pull(self, dt)
-                for tar in targets or []:
-                    obj.apply_pull(tar.ship, dt)
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, AreaShieldAura):
-                # Intercept incoming projectiles while the aura holds
-                for tar in targets or []:
-                    for proj in list(tar.ship.projectiles):
-                        if math.hypot(proj.x - self.x, proj.y - self.y) <= obj.radius:
-                            obj.take_damage(proj.damage)
-                            tar.ship.projectiles.remove(proj)
-                if obj.expired():
-                    self.area_shield = None
-                    self.specials.remove(obj)
-            elif isinstance(obj, RepairNanobots):
-                obj.update(dt)
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, SolarLink):
-                obj.update(dt)
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, Decoy):
-                obj.update(dt, targets or [])
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, MiningBeam):
-                obj.update(dt)
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, Channeler):
-                obj.update(dt)
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, Battery):
-                obj.update(dt)
-                if obj.expired():
-                    self.specials.remove(obj)
-            elif isinstance(obj, StarTurret):
-                obj.update(dt, targets or [])
-                for sc in list(obj.projectiles):
-                    if sc.expired():
-                        obj.projectiles.remove(sc)
-                if obj.expired():
-                    self.specials.remove(obj)
+        key = (id(targets), id(self._structures_source))
+        if Ship.special_systems is not None:
+            # Updated with every other ship's specials in SpecialSystems.run
+            Ship.special_systems.queue(self, targets, self._structures or [], key)
+            return
+        systems = SpecialSystems()
+        systems.queue(self, targets, self._structures or [], key)
+        systems.run(dt)
 
     def take_damage(self, amount: float) -> None:
         """Apply damage to the shield and hull."""
@@ -1074,31 +1017,17 @@ class Ship:
             self.hull = max(0, self.hull - amount)
 
     def draw_projectiles(self, screen: pygame.Surface, offset_x: float = 0.0, offset_y: float = 0.0, zoom: float = 1.0) -> None:
-        for proj in self.projectiles:
-            proj.draw(screen, offset_x, offset_y, zoom)
+        render_projectiles(screen, self.projectiles, offset_x, offset_y, zoom)
 
     def draw_specials(self, screen: pygame.Surface, offset_x: float = 0.0, offset_y: float = 0.0, zoom: float = 1.0) -> None:
+        # Drones and star turrets draw their own shots
         for obj in self.specials:
-            if isinstance(obj, Drone):
-                for proj in obj.projectiles:
-                    proj.draw(screen, offset_x, offset_y, zoom)
-            elif isinstance(obj, StarTurret):
-                for sc in obj.projectiles:
-                    sc.draw(screen, offset_x, offset_y, zoom)
             obj.draw(screen, offset_x, offset_y, zoom)
         if self.area_shield:
             self.area_shield.draw(screen, offset_x, offset_y, zoom)
 
     def draw_particles(self, screen: pygame.Surface, offset_x: float = 0.0, offset_y: float = 0.0, zoom: float = 1.0) -> None:
-        for p in self.particles:
-            px = int((p.x - offset_x) * zoom)
-            py = int((p.y - offset_y) * zoom)
-            # Fade out by scaling alpha with remaining life
-            alpha = max(0.0, min(1.0, p.lifetime / p.max_life))
-            radius = max(1, int(2 * alpha * zoom))
-            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surface, p.color + (int(alpha * 255),), (radius, radius), radius)
-            screen.blit(surface, (px - radius, py - radius))
+        PARTICLES.draw(screen, offset_x, offset_y, zoom, emitter=self.emitter)
 
     def draw_at(
         self,
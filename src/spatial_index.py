@@ -0,0 +1,226 @@
+"""Uniform grid of circular bodies with overlap and swept-circle queries."""
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+import config
+
+
+@dataclass
+class SweepHit:
+    """First contact of a moving circle.
+
+    ``t`` is the fraction of the motion completed at impact, ``(nx, ny)`` the
+    unit normal pointing from the body toward the mover and ``depth`` how far
+    the mover already overlapped the body when it started moving.
+    """
+
+    t: float
+    nx: float
+    ny: float
+    obj: object
+    depth: float = 0.0
+
+
+def sweep_circle(
+    x0: float,
+    y0: float,
+    dx: float,
+    dy: float,
+    radius: float,
+    cx: float,
+    cy: float,
+    cr: float,
+) -> SweepHit | None:
+    """Sweep a circle from ``(x0, y0)`` by ``(dx, dy)`` against a static one."""
+    reach = radius + cr
+    fx = x0 - cx
+    fy = y0 - cy
+    c = fx * fx + fy * fy - reach * reach
+    if c < 0:
+        dist = math.sqrt(fx * fx + fy * fy)
+        if dist < 1e-9:
+            return SweepHit(0.0, 1.0, 0.0, None, reach)
+        return SweepHit(0.0, fx / dist, fy / dist, None, reach - dist)
+    a = dx * dx + dy * dy
+    b = fx * dx + fy * dy
+    if a < 1e-12 or b >= 0:
+        return None
+    disc = b * b - a * c
+    if disc < 0:
+        return None
+    t = (-b - math.sqrt(disc)) / a
+    if t > 1.0:
+        return None
+    hx = fx + dx * t
+    hy = fy + dy * t
+    return SweepHit(t, hx / reach, hy / reach, None)
+
+
+def first_hits(x0, y0, x1, y1, cx, cy, cr) -> tuple[np.ndarray, np.ndarray]:
+    """Return the first circle each segment touches and where along it.
+
+    Takes ``n`` segments and ``m`` circles as arrays and returns, per segment,
+    the index of the earliest circle hit (``-1`` for none) and the fraction of
+    the segment covered at that point. Segments starting inside a circle hit
+    it at ``0``.
+    """
+    x0 = np.asarray(x0, dtype=float)[:, None]
+    y0 = np.asarray(y0, dtype=float)[:, None]
+    dx = np.asarray(x1, dtype=float)[:, None] - x0
+    dy = np.asarray(y1, dtype=float)[:, None] - y0
+    cr = np.asarray(cr, dtype=float)[None, :]
+    if cr.shape[1] == 0:
+        return np.full(len(x0), -1), np.full(len(x0), np.inf)
+    fx = x0 - np.asarray(cx, dtype=float)[None, :]
+    fy = y0 - np.asarray(cy, dtype=float)[None, :]
+    a = np.maximum(dx * dx + dy * dy, 1e-12)
+    b = fx * dx + fy * dy
+    c = fx * fx + fy * fy - cr * cr
+    disc = b * b - a * c
+    with np.errstate(invalid="ignore"):
+        t = (-b - np.sqrt(disc)) / a
+    t = np.where((disc >= 0) & (t >= 0) & (t <= 1), t, np.inf)
+    t = np.where(c <= 0, 0.0, t)
+    idx = np.argmin(t, axis=1)
+    best = t[np.arange(len(idx)), idx]
+    idx[np.isinf(best)] = -1
+    return idx, best
+
+
+class SpatialIndex:
+    """Bucket circles into grid cells so queries only touch nearby bodies."""
+
+    def __init__(self, cell: int = config.SPATIAL_INDEX_CELL) -> None:
+        self.cell = cell
+        self._cells: dict[tuple[int, int], list[tuple[object, float, float, float]]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._count = 0
+
+    def insert(self, obj, x: float, y: float, radius: float) -> None:
+        entry = (obj, x, y, radius)
+        for key in self._keys(x - radius, y - radius, x + radius, y + radius):
+            self._cells.setdefault(key, []).append(entry)
+        self._count += 1
+
+    def _keys(self, x0: float, y0: float, x1: float, y1: float):
+        c = self.cell
+        for gx in range(int(x0 // c), int(x1 // c) + 1):
+            for gy in range(int(y0 // c), int(y1 // c) + 1):
+                yield gx, gy
+
+    def candidates(self, x0: float, y0: float, x1: float, y1: float) -> list:
+        """Return each body whose cells touch the box ``(x0, y0)-(x1, y1)`` once."""
+        seen = set()
+        found = []
+        for key in self._keys(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)):
+            for entry in self._cells.get(key, ()):
+                if id(entry) not in seen:
+                    seen.add(id(entry))
+                    found.append(entry)
+        return found
+
+    def query(self, x: float, y: float, radius: float) -> list:
+        """Return the objects overlapping the circle at ``(x, y)``."""
+        return [
+            obj
+            for obj, bx, by, br in self.candidates(x - radius, y - radius, x + radius, y + radius)
+            if math.hypot(bx - x, by - y) < br + radius
+        ]
+
+    def sweep(
+        self, x0: float, y0: float, x1: float, y1: float, radius: float
+    ) -> SweepHit | None:
+        """Return the earliest hit of a circle moving from ``(x0, y0)`` to ``(x1, y1)``."""
+        best = None
+        box = self.candidates(
+            min(x0, x1) - radius,
+            min(y0, y1) - radius,
+            max(x0, x1) + radius,
+            max(y0, y1) + radius,
+        )
+        for obj, bx, by, br in box:
+            hit = sweep_circle(x0, y0, x1 - x0, y1 - y0, radius, bx, by, br)
+            if hit and (best is None or hit.t < best.t or (hit.t == best.t and hit.depth > best.depth)):
+                hit.obj = obj
+                best = hit
+        return best
+
+
+class CellBuckets:
+    """Static point objects bucketed by grid cell.
+
+    Objects are filed under the cell holding their ``x``/``y`` when added and
+    must not move afterwards. Adding and removing are O(1), and box queries
+    only visit the cells they cover. ``extent`` tracks the largest ``radius``
+    added so queries still find objects whose centre sits just outside.
+    """
+
+    def __init__(self, cell: int) -> None:
+        self.cell = cell
+        self.extent = 0.0
+        self._cells: dict[tuple[int, int], dict[object, None]] = {}
+        self._where: dict[object, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __iter__(self):
+        return iter(list(self._where))
+
+    def __contains__(self, obj) -> bool:
+        return obj in self._where
+
+    def append(self, obj) -> None:
+        key = (int(obj.x // self.cell), int(obj.y // self.cell))
+        self._cells.setdefault(key, {})[obj] = None
+        self._where[obj] = key
+        self.extent = max(self.extent, getattr(obj, "radius", 0))
+
+    def remove(self, obj) -> None:
+        key = self._where.pop(obj)
+        bucket = self._cells[key]
+        del bucket[obj]
+        if not bucket:
+            del self._cells[key]
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._where.clear()
+        self.extent = 0.0
+
+    def in_box(self, x0: float, y0: float, x1: float, y1: float) -> list:
+        """Return the objects whose cells touch the box, padded by ``extent``."""
+        c = self.cell
+        pad = self.extent
+        found = []
+        for gy in range(int((y0 - pad) // c), int((y1 + pad) // c) + 1):
+            for gx in range(int((x0 - pad) // c), int((x1 + pad) // c) + 1):
+                bucket = self._cells.get((gx, gy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def near(self, x: float, y: float, radius: float) -> list:
+        """Return the candidates within ``radius`` (plus ``extent``) of ``(x, y)``."""
+        return self.in_box(x - radius, y - radius, x + radius, y + radius)
+
+
+def clip_motion(sectors, x0: float, y0: float, x1: float, y1: float, radius: float):
+    """Return where a circle moving from ``(x0, y0)`` to ``(x1, y1)`` stops."""
+    best = None
+    for sector in sectors or []:
+        hit = sector.sweep_circle(x0, y0, x1, y1, radius)
+        if hit and (best is None or hit.t < best.t):
+            best = hit
+    if best is None or best.depth > 0:
+        return x1, y1
+    return x0 + (x1 - x0) * best.t, y0 + (y1 - y0) * best.t
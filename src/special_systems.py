@@ -0,0 +1,315 @@
+"""Per-type update systems for ship specials such as beams, mines and drones.
+
+Each special type maps to a system function that updates every queued
+special of that type in one pass. Specials from ships sharing the same
+hostiles and structures also share one :class:`SpecialContext`, so the
+broad-phase lists are gathered once per frame rather than per object.
+"""
+
+import math
+import types
+from typing import Callable
+
+import pygame
+
+from combat import (
+    LaserBeam,
+    probe_beams,
+    TimedMine,
+    Drone,
+    BombDrone,
+    IonSymbiontShot,
+    SlowField,
+    SporeCloud,
+)
+from light_channeler import Channeler, Battery, StarTurret
+from artifact import (
+    AreaShieldAura,
+    EMPWave,
+    TractorProbe,
+    RepairNanobots,
+    SolarLink,
+    Decoy,
+    MiningBeam,
+)
+from blackhole import TemporaryBlackHole
+from threat_map import ThreatMap
+from combat_events import CombatEvents, compact, deal_damage, in_play
+from particles import PARTICLES
+
+SYSTEMS: dict[type, Callable] = {}
+_RESOLVED: dict[type, Callable | None] = {}
+
+
+def special_system(*kinds: type):
+    """Register the decorated function as the system updating ``kinds``.
+
+    Systems receive ``(items, dt)`` where ``items`` is a list of
+    ``(ship, special, context)`` tuples.
+    """
+
+    def wrap(fn):
+        for kind in kinds:
+            SYSTEMS[kind] = fn
+        _RESOLVED.clear()
+        return fn
+
+    return wrap
+
+
+def system_for(kind: type) -> Callable | None:
+    """Return the system for ``kind``, falling back to its base classes."""
+    try:
+        return _RESOLVED[kind]
+    except KeyError:
+        fn = next((SYSTEMS[k] for k in kind.__mro__ if k in SYSTEMS), None)
+        _RESOLVED[kind] = fn
+        return fn
+
+
+def _radius(struct) -> float:
+    return getattr(struct, "radius", getattr(struct, "size", 0))
+
+
+class SpecialContext:
+    """Hostiles and structures shared by the specials of several ships."""
+
+    def __init__(
+        self, targets: list, structures: list, events: CombatEvents | None = None
+    ) -> None:
+        self.targets = targets
+        self.structures = structures
+        self.events = events
+        self._bodies: list | None = None
+        self._shots: ThreatMap | None = None
+        self._target_shots: ThreatMap | None = None
+
+    @property
+    def bodies(self) -> list:
+        """Targets followed by structures, as laser beams probe them."""
+        if self._bodies is None:
+            self._bodies = self.targets + self.structures
+        return self._bodies
+
+    @property
+    def shots(self) -> ThreatMap:
+        """Projectiles fired by targets and structures, bucketed once."""
+        if self._shots is None:
+            sources = list(self.targets)
+            sources.extend(
+                types.SimpleNamespace(ship=s)
+                for s in self.structures
+                if hasattr(s, "projectiles")
+            )
+            self._shots = ThreatMap(sources, events=self.events)
+        return self._shots
+
+    @property
+    def target_shots(self) -> ThreatMap:
+        """Projectiles fired by targets only."""
+        if self._target_shots is None:
+            self._target_shots = ThreatMap(self.targets, events=self.events)
+        return self._target_shots
+
+
+class SpecialSystems:
+    """Queue specials from many ships and update each type in one pass.
+
+    Damage and destroyed projectiles go to ``events`` when given, to be
+    applied in the combat resolution phase.
+    """
+
+    def __init__(self, events: CombatEvents | None = None) -> None:
+        self.events = events
+        self._queue: list[tuple[object, SpecialContext]] = []
+        self._contexts: dict[tuple, SpecialContext] = {}
+
+    def queue(self, ship, targets: list | None, structures: list, key=None) -> None:
+        """Schedule ``ship``'s specials; ships with the same ``key`` share a context."""
+        ctx = self._contexts.get(key) if key is not None else None
+        if ctx is None:
+            ctx = SpecialContext(list(targets or []), list(structures), self.events)
+            if key is not None:
+                self._contexts[key] = ctx
+        self._queue.append((ship, ctx))
+
+    def run(self, dt: float) -> None:
+        groups: dict[Callable, list] = {}
+        for ship, ctx in self._queue:
+            for obj in ship.specials:
+                fn = system_for(type(obj))
+                if fn is not None:
+                    groups.setdefault(fn, []).append((ship, obj, ctx))
+        self._queue.clear()
+        self._contexts.clear()
+        for fn, items in groups.items():
+            fn(items, dt)
+        expired: dict[int, tuple[object, list]] = {}
+        for items in groups.values():
+            for ship, obj, _ in items:
+                if obj.expired():
+                    expired.setdefault(id(ship), (ship, []))[1].append(obj)
+        for ship, dead in expired.values():
+            compact(ship.specials, dead)
+
+
+def _discard(ship, obj) -> None:
+    if obj in ship.specials:
+        ship.specials.remove(obj)
+
+
+@special_system(
+    EMPWave,
+    TractorProbe,
+    RepairNanobots,
+    SolarLink,
+    MiningBeam,
+    Channeler,
+    Battery,
+)
+def _timed(items: list, dt: float) -> None:
+    for _, obj, _ in items:
+        obj.update(dt)
+
+
+@special_system(IonSymbiontShot, Decoy)
+def _seeking(items: list, dt: float) -> None:
+    for _, obj, ctx in items:
+        obj.update(dt, ctx.targets, ctx.events)
+
+
+@special_system(LaserBeam)
+def _laser_beams(items: list, dt: float) -> None:
+    by_context: dict[int, tuple[SpecialContext, list]] = {}
+    for _, beam, ctx in items:
+        by_context.setdefault(id(ctx), (ctx, []))[1].append(beam)
+    for ctx, beams in by_context.values():
+        probe_beams(beams, ctx.bodies)
+    for _, beam, ctx in items:
+        beam.update(dt, [], ctx.events)
+
+
+def _blast(obj, ctx: SpecialContext) -> None:
+    for tar in ctx.targets:
+        if math.hypot(tar.ship.x - obj.x, tar.ship.y - obj.y) <= obj.radius:
+            deal_damage(ctx.events, tar.ship, obj.damage, obj)
+
+
+@special_system(TimedMine)
+def _mines(items: list, dt: float) -> None:
+    for _, mine, ctx in items:
+        mine.update(dt)
+        if mine.exploded:
+            _blast(mine, ctx)
+
+
+def _absorb_shots(obj, ctx: SpecialContext) -> bool:
+    """Let ``obj`` soak incoming shots; return ``True`` once it is destroyed."""
+    rect = pygame.Rect(obj.x - obj.size / 2, obj.y - obj.size / 2, obj.size, obj.size)
+    shots = ctx.shots
+    for proj, source in shots.projectiles_in(rect):
+        if shots.remove_projectile(proj, source):
+            obj.hp -= getattr(proj, "damage", 0)
+            if obj.hp <= 0:
+                return True
+    return False
+
+
+@special_system(Drone)
+def _drones(items: list, dt: float) -> None:
+    for _, drone, ctx in items:
+        drone.update(dt, ctx.bodies)
+        spent = []
+        for proj in in_play(ctx.events, drone.projectiles):
+            for tar in ctx.targets:
+                if (
+                    math.hypot(proj.x - tar.ship.x, proj.y - tar.ship.y)
+                    <= tar.ship.collision_radius
+                ):
+                    deal_damage(ctx.events, tar.ship, proj.damage, drone)
+                    spent.append(proj)
+                    break
+            else:
+                for struct in ctx.structures:
+                    if math.hypot(proj.x - struct.x, proj.y - struct.y) <= _radius(struct):
+                        spent.append(proj)
+                        break
+        compact(drone.projectiles, spent)
+        _absorb_shots(drone, ctx)
+
+
+@special_system(BombDrone)
+def _bomb_drones(items: list, dt: float) -> None:
+    for _, bomb, ctx in items:
+        bomb.update(dt, ctx.bodies)
+        hit = _absorb_shots(bomb, ctx)
+        if not hit:
+            hit = any(
+                math.hypot(tar.ship.x - bomb.x, tar.ship.y - bomb.y)
+                <= tar.ship.collision_radius
+                for tar in ctx.targets
+            ) or any(
+                math.hypot(struct.x - bomb.x, struct.y - bomb.y) <= _radius(struct)
+                for struct in ctx.structures
+            )
+        if hit:
+            bomb._explode()
+            if ctx.events is not None:
+                ctx.events.explosion(bomb.x, bomb.y, bomb.radius, bomb)
+        if bomb.exploded:
+            _blast(bomb, ctx)
+
+
+@special_system(SlowField)
+def _slow_fields(items: list, dt: float) -> None:
+    for _, field, ctx in items:
+        field.update(dt)
+        for tar in ctx.targets:
+            field.apply_slow(tar.ship)
+
+
+@special_system(SporeCloud)
+def _spore_clouds(items: list, dt: float) -> None:
+    for ship, cloud, ctx in items:
+        tick = cloud.update(dt)
+        for struct in ctx.structures:
+            if cloud.contains(struct):
+                dist = math.hypot(struct.x - cloud.x, struct.y - cloud.y) - _radius(struct)
+                if dist <= 0:
+                    # Clouds dissipate against solid structures
+                    PARTICLES.kill(cloud.emitter)
+                    _discard(ship, cloud)
+                    break
+                cloud.radius = min(cloud.radius, dist)
+        else:
+            if tick:
+                for tar in ctx.targets:
+                    if cloud.contains(tar.ship):
+                        deal_damage(ctx.events, tar.ship, cloud.damage, cloud)
+
+
+@special_system(TemporaryBlackHole)
+def _black_holes(items: list, dt: float) -> None:
+    for ship, hole, ctx in items:
+        hole.update(dt)
+        hole.apply_pull(ship, dt)
+        for tar in ctx.targets:
+            hole.apply_pull(tar.ship, dt)
+
+
+@special_system(AreaShieldAura)
+def _shield_auras(items: list, dt: float) -> None:
+    for ship, aura, ctx in items:
+        # Intercept incoming projectiles while the aura holds
+        shots = ctx.target_shots
+        for proj, source in shots.projectiles_near(ship.x, ship.y, aura.radius):
+            if shots.remove_projectile(proj, source):
+                aura.take_damage(proj.damage)
+        if aura.expired() and ship.area_shield is aura:
+            ship.area_shield = None
+
+
+@special_system(StarTurret)
+def _star_turrets(items: list, dt: float) -> None:
+    for _, turret, ctx in items:
+        turret.update(dt, ctx.targets, ctx.events)
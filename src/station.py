@@ -45,6 +45,8 @@ class SpaceStation:
         # Randomly populate the market with items for trade
         # Each entry maps item name -> {"stock": int, "price": int}
         self.market: dict[str, dict[str, int]] = {}
+        # Callbacks ``fn(station, item_name)`` fired when a market entry changes
+        self.market_listeners: list = []
         self._restock_timer = 0.0
         self._price_timer = 0.0
         self._populate_market()
@@ -72,14 +74,31 @@ class SpaceStation:
 
     # --- Trading ---------------------------------------------------------
 
+    def _notify_market(self, item_name: str) -> None:
+        for listener in self.market_listeners:
+            listener(self, item_name)
+
+    def buy_quote(self, player, item_name: str, qty: int = 1) -> int | None:
+        """Return what ``player`` would pay for ``qty`` of ``item_name``."""
+        if item_name not in self.market:
+            return None
+        price = self.market[item_name]["price"] * qty
+        if getattr(player, "fraction", None) and player.fraction.name == "Cosmic Guild":
+            price = int(price * 0.9)
+        return price
+
+    def sell_quote(self, player, item_name: str, qty: int = 1) -> int:
+        """Return what the station pays ``player`` for ``qty`` of ``item_name``."""
+        price = ITEMS_BY_NAME[item_name].valor * qty
+        if getattr(player, "fraction", None) and player.fraction.name == "Cosmic Guild":
+            price = int(price * 1.1)
+        return price
+
     def buy_item(self, player, item_name: str, qty: int = 1) -> bool:
         """Allow ``player`` to buy ``qty`` of ``item_name`` if available."""
         if item_name not in self.market or self.market[item_name]["stock"] < qty:
             return False
-        item = ITEMS_BY_NAME[item_name]
-        price = self.market[item_name]["price"] * qty
-        if getattr(player, "fraction", None) and player.fraction.name == "Cosmic Guild":
-            price = int(price * 0.9)
+        price = self.buy_quote(player, item_name, qty)
         if player.credits < price:
             return False
         player.credits -= price
@@ -87,6 +106,7 @@ class SpaceStation:
         self.market[item_name]["stock"] -= qty
         if self.market[item_name]["stock"] <= 0:
             del self.market[item_name]
+        self._notify_market(item_name)
         return True
 
     def sell_item(self, player, item_name: str, qty: int = 1) -> bool:
@@ -94,9 +114,7 @@ class SpaceStation:
         if player.inventory.get(item_name, 0) < qty:
             return False
         item = ITEMS_BY_NAME[item_name]
-        price = item.valor * qty
-        if getattr(player, "fraction", None) and player.fraction.name == "Cosmic Guild":
-            price = int(price * 1.1)
+        price = self.sell_quote(player, item_name, qty)
         player.credits += price
         player.remove_item(item_name, qty)
         if item_name in self.market:
@@ -106,6 +124,7 @@ class SpaceStation:
                 "stock": qty,
                 "price": int(item.valor * random.uniform(0.8, 1.2)),
             }
+        self._notify_market(item_name)
         return True
 
     def exchange_for_credits(self, player, item_name: str, qty: int = 1) -> int:
@@ -146,8 +165,9 @@ class SpaceStation:
     def _restock(self) -> None:
         """Increase stock of existing items and occasionally add new ones."""
 
-        for data in self.market.values():
+        for name, data in self.market.items():
             data["stock"] += random.randint(1, 3)
+            self._notify_market(name)
 
         if len(self.market) < 10:
             available = [it for it in ITEMS if it.nombre not in self.market]
@@ -157,6 +177,7 @@ class SpaceStation:
                     "stock": random.randint(1, 5),
                     "price": int(item.valor * random.uniform(0.8, 1.2)),
                 }
+                self._notify_market(item.nombre)
 
     def _update_prices(self) -> None:
         """Apply periodic price fluctuations with clamping."""
@@ -173,6 +194,7 @@ class SpaceStation:
             max_price = base * config.STATION_MAX_PRICE_MULT
             new_price = max(min_price, min(max_price, new_price))
             data["price"] = max(1, int(new_price))
+            self._notify_market(name)
 
     def has_free_hangar(self) -> bool:
         return any(not h.occupied for h in self.hangars)
@@ -0,0 +1,81 @@
+"""Packed per-cell terrain flags for planet surfaces.
+
+One ``uint8`` grid replaces a separate collision mask per terrain kind.
+Each bit marks one property, so a single index answers every terrain
+question about a point.
+"""
+
+import numpy as np
+import pygame
+
+import config
+
+BLOCKED = 1
+WATER = 2
+STORM = 4
+ICE = 8
+LAVA = 16
+GAS = 32
+# Returned for points off the map; never stored in the grid
+OUTSIDE = 64
+
+# Masks built by pygame count a pixel as set above this alpha
+_ALPHA_THRESHOLD = 127
+
+
+class TerrainFlags:
+    """Terrain bits sampled every ``resolution`` pixels of a ``width x height`` map."""
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        resolution: int = config.TERRAIN_FLAG_RESOLUTION,
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.resolution = resolution
+        # Each flag cell samples the pixel at its centre; a partial cell at
+        # the right or bottom edge samples the last pixel inside the map
+        cols = -(-width // resolution)
+        rows = -(-height // resolution)
+        self._xs = np.minimum(np.arange(cols) * resolution + resolution // 2, width - 1)
+        self._ys = np.minimum(np.arange(rows) * resolution + resolution // 2, height - 1)
+        self.flags = np.zeros((len(self._ys), len(self._xs)), dtype=np.uint8)
+
+    def _assign(self, bit: int, mask: np.ndarray) -> None:
+        self.flags &= np.uint8(~bit & 0xFF)
+        self.flags[mask] |= np.uint8(bit)
+
+    def stamp_surface(self, bit: int, surface: pygame.Surface) -> None:
+        """Set ``bit`` where ``surface`` is opaque and clear it elsewhere."""
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        mask = alpha[np.ix_(self._xs, self._ys)].T > _ALPHA_THRESHOLD
+        del alpha
+        self._assign(bit, mask)
+
+    def stamp_cells(self, bit: int, cells, cell: int) -> None:
+        """Set ``bit`` from a coarse boolean grid of ``cell``-pixel squares."""
+        cells = np.asarray(cells, dtype=bool)
+        rows = np.minimum(self._ys // cell, cells.shape[0] - 1)
+        cols = np.minimum(self._xs // cell, cells.shape[1] - 1)
+        self._assign(bit, cells[np.ix_(rows, cols)])
+
+    def at(self, x: float, y: float) -> int:
+        """Return every flag at ``(x, y)``, or ``OUTSIDE`` off the map."""
+        ix = int(x)
+        iy = int(y)
+        if not (0 <= ix < self.width and 0 <= iy < self.height):
+            return OUTSIDE
+        r = self.resolution
+        return int(self.flags[iy // r, ix // r])
+
+    def query(self, xs, ys) -> np.ndarray:
+        """Vectorised :meth:`at` for many points at once."""
+        ix = np.asarray(xs, dtype=float).astype(int)
+        iy = np.asarray(ys, dtype=float).astype(int)
+        inside = (ix >= 0) & (ix < self.width) & (iy >= 0) & (iy < self.height)
+        out = np.full(ix.shape, OUTSIDE, dtype=np.uint8)
+        r = self.resolution
+        out[inside] = self.flags[iy[inside] // r, ix[inside] // r]
+        return out
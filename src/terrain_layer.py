@@ -0,0 +1,65 @@
+"""Pre-composited static terrain for planet surfaces.
+
+The base surface and the overlay layers that only change on rare events
+(ice holes, shifting dunes, tremors) are flattened into opaque tiles the
+first time a tile is seen. Each frame then blits the visible tiles only,
+and terrain edits call :meth:`TerrainLayer.invalidate` for the area they
+touched so the affected tiles are rebuilt on demand.
+"""
+
+import pygame
+
+import config
+
+
+class TerrainLayer:
+    """Opaque tiles composited from ``layers``, bottom layer first."""
+
+    def __init__(
+        self,
+        layers: list[pygame.Surface],
+        tile: int = config.TERRAIN_TILE_SIZE,
+    ) -> None:
+        self.layers = layers
+        self.tile = tile
+        self.width, self.height = layers[0].get_size()
+        self._tiles: dict[tuple[int, int], pygame.Surface] = {}
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def invalidate(self, rect: pygame.Rect | None = None) -> None:
+        """Drop the tiles overlapping ``rect``, or every tile when omitted."""
+        if rect is None:
+            self._tiles.clear()
+            return
+        t = self.tile
+        for i in range(max(rect.left, 0) // t, max(rect.right, 0) // t + 1):
+            for j in range(max(rect.top, 0) // t, max(rect.bottom, 0) // t + 1):
+                self._tiles.pop((i, j), None)
+
+    def _build(self, i: int, j: int) -> pygame.Surface:
+        t = self.tile
+        area = pygame.Rect(i * t, j * t, t, t).clip((0, 0, self.width, self.height))
+        tile = pygame.Surface(area.size)
+        for layer in self.layers:
+            tile.blit(layer, (0, 0), area)
+        self._tiles[(i, j)] = tile
+        return tile
+
+    def draw(self, screen: pygame.Surface, offset_x: float, offset_y: float) -> None:
+        """Blit the tiles visible from the camera at ``(offset_x, offset_y)``."""
+        sw, sh = screen.get_size()
+        t = self.tile
+        left = max(int(offset_x) // t, 0)
+        top = max(int(offset_y) // t, 0)
+        right = min(int(offset_x + sw) // t, (self.width - 1) // t)
+        bottom = min(int(offset_y + sh) // t, (self.height - 1) // t)
+        blits = []
+        for j in range(top, bottom + 1):
+            for i in range(left, right + 1):
+                tile = self._tiles.get((i, j))
+                if tile is None:
+                    tile = self._build(i, j)
+                blits.append((tile, (i * t - offset_x, j * t - offset_y)))
+        screen.blits(blits, doreturn=False)
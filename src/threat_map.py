@@ -0,0 +1,124 @@
+"""Hostile ships and projectiles bucketed once per tick for every defender."""
+
+import math
+
+import config
+from spatial_index import SpatialIndex
+from combat_events import CombatEvents
+
+
+class ThreatMap:
+    """Spatial snapshot of the hostiles a faction's defenders react to.
+
+    ``hostiles`` are the usual wrappers exposing a ``ship`` attribute.  The
+    map is built once per tick and shared by all turrets and drones of a
+    faction, so each of them only looks at the grid cells around it.
+    Distances from a defended owner are cached so repeated lookups by its
+    drones cost a dictionary hit. With ``events`` destroyed projectiles are
+    recorded as despawns instead of being removed from their lists at once.
+    """
+
+    def __init__(
+        self,
+        hostiles: list,
+        cell: int = config.THREAT_MAP_CELL,
+        events: CombatEvents | None = None,
+    ) -> None:
+        self.hostiles = list(hostiles)
+        self.events = events
+        self.ships = SpatialIndex(cell)
+        self.projectiles = SpatialIndex(cell)
+        # Position of each threat in a hostile-by-hostile scan, ship first
+        self._order: dict[int, tuple[int, int]] = {}
+        for k, en in enumerate(self.hostiles):
+            ship = en.ship
+            self.ships.insert(en, ship.x, ship.y, 0.0)
+            self._order[id(ship)] = (k, -1)
+            for j, proj in enumerate(ship.projectiles):
+                self.projectiles.insert((proj, ship), proj.x, proj.y, 0.0)
+                self._order[id(proj)] = (k, j)
+        self._removed: set[int] = set()
+        self._near: dict[tuple, list[tuple[float, object]]] = {}
+
+    def threats_near(self, owner, radius: float) -> list[tuple[float, object]]:
+        """Return ``(distance, threat)`` pairs within ``radius`` of ``owner``.
+
+        Threats are hostile ships and their projectiles, nearest first.
+        """
+        key = (id(owner), owner.x, owner.y, radius)
+        cached = self._near.get(key)
+        if cached is not None:
+            return cached
+        x, y = owner.x, owner.y
+        box = (x - radius, y - radius, x + radius, y + radius)
+        found = []
+        for en, sx, sy, _ in self.ships.candidates(*box):
+            d = math.hypot(sx - x, sy - y)
+            if d <= radius:
+                found.append((d, en.ship))
+        for (proj, _), px, py, _ in self.projectiles.candidates(*box):
+            if id(proj) in self._removed:
+                continue
+            d = math.hypot(px - x, py - y)
+            if d <= radius:
+                found.append((d, proj))
+        found.sort(key=lambda pair: pair[0])
+        self._near[key] = found
+        return found
+
+    def first_threat(self, owner, radius: float):
+        """Return the first threat within ``radius`` of ``owner`` or ``None``.
+
+        "First" follows the order of a linear scan over ``hostiles``: each
+        hostile ship, then its projectiles in list order.
+        """
+        near = self.threats_near(owner, radius)
+        if not near:
+            return None
+        return min(near, key=lambda pair: self._order[id(pair[1])])[1]
+
+    def nearest_ship(self, x: float, y: float, radius: float):
+        """Return ``(hostile, distance)`` for the closest ship within ``radius``."""
+        best = None
+        best_d = float("inf")
+        for en, sx, sy, _ in self.ships.candidates(x - radius, y - radius, x + radius, y + radius):
+            d = math.hypot(sx - x, sy - y)
+            if d <= radius and d < best_d:
+                best = en
+                best_d = d
+        return best, best_d
+
+    def projectiles_in(self, rect) -> list[tuple[object, object]]:
+        """Return ``(projectile, ship)`` pairs whose position lies in ``rect``."""
+        return [
+            (proj, ship)
+            for (proj, ship), px, py, _ in self.projectiles.candidates(
+                rect.left, rect.top, rect.right, rect.bottom
+            )
+            if id(proj) not in self._removed and rect.collidepoint(px, py)
+        ]
+
+    def projectiles_near(self, x: float, y: float, radius: float) -> list[tuple[object, object]]:
+        """Return ``(projectile, ship)`` pairs within ``radius`` of ``(x, y)``."""
+        return [
+            (proj, ship)
+            for (proj, ship), px, py, _ in self.projectiles.candidates(
+                x - radius, y - radius, x + radius, y + radius
+            )
+            if id(proj) not in self._removed and math.hypot(px - x, py - y) <= radius
+        ]
+
+    def remove_projectile(self, proj, ship) -> bool:
+        """Destroy ``proj`` fired by ``ship``; return ``False`` if already gone."""
+        if id(proj) in self._removed:
+            return False
+        if self.events is not None:
+            if not self.events.despawn(ship.projectiles, proj):
+                return False
+        elif proj in ship.projectiles:
+            ship.projectiles.remove(proj)
+        else:
+            return False
+        self._removed.add(id(proj))
+        self._near.clear()
+        return True
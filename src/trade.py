@@ -0,0 +1,328 @@
+"""Best-price lookups and trade route suggestions across all stations."""
+
+import bisect
+import heapq
+import math
+from dataclasses import dataclass
+
+import config
+from ship import hyperjump_duration
+
+
+@dataclass
+class TradeRoute:
+    """Buy ``item`` at ``buy_station`` and sell it at ``sell_station``."""
+
+    item: str
+    buy_station: object
+    sell_station: object
+    quantity: int
+    cost: int
+    revenue: int
+    travel_time: float
+    toll: int = 0
+
+    @property
+    def profit(self) -> int:
+        return self.revenue - self.cost - self.toll
+
+    @property
+    def profit_rate(self) -> float:
+        """Credits earned per second of travel."""
+        return self.profit / max(self.travel_time, 1.0)
+
+
+class MarketIndex:
+    """Per-item price books kept sorted across every registered station.
+
+    Stations push changes through ``SpaceStation.market_listeners`` so the
+    books are updated one entry at a time instead of being rebuilt.
+    """
+
+    def __init__(self, stations=None) -> None:
+        self._stations: dict[int, object] = {}
+        # item name -> sorted [(price, station id)]
+        self._books: dict[str, list[tuple[int, int]]] = {}
+        # station id -> item name -> listed price
+        self._prices: dict[int, dict[str, int]] = {}
+        self._subscribers: list = []
+        for station in stations or []:
+            self.add_station(station)
+
+    @classmethod
+    def from_sectors(cls, sectors) -> "MarketIndex":
+        stations = [
+            st for sector in sectors for system in sector.systems for st in system.stations
+        ]
+        return cls(stations)
+
+    @property
+    def stations(self) -> list:
+        return list(self._stations.values())
+
+    def subscribe(self, callback) -> None:
+        """Call ``callback(item, station, old_price, new_price)`` on changes."""
+        self._subscribers.append(callback)
+
+    def add_station(self, station) -> None:
+        sid = id(station)
+        if sid in self._stations:
+            return
+        self._stations[sid] = station
+        self._prices[sid] = {}
+        station.market_listeners.append(self._on_market_change)
+        self.refresh_station(station)
+
+    def remove_station(self, station) -> None:
+        sid = id(station)
+        if sid not in self._stations:
+            return
+        for name in list(self._prices[sid]):
+            self._set_price(sid, name, None)
+        station.market_listeners.remove(self._on_market_change)
+        del self._prices[sid]
+        del self._stations[sid]
+
+    def refresh_station(self, station) -> None:
+        """Resynchronise ``station`` after its market was replaced wholesale."""
+        sid = id(station)
+        for name in list(self._prices[sid]):
+            if name not in station.market:
+                self._set_price(sid, name, None)
+        for name in station.market:
+            self._on_market_change(station, name)
+
+    def _on_market_change(self, station, item_name: str) -> None:
+        data = station.market.get(item_name)
+        price = data["price"] if data and data["stock"] > 0 else None
+        self._set_price(id(station), item_name, price)
+
+    def _set_price(self, sid: int, item_name: str, price: int | None) -> None:
+        known = self._prices[sid]
+        old = known.get(item_name)
+        if old == price:
+            return
+        book = self._books.setdefault(item_name, [])
+        if old is not None:
+            del book[bisect.bisect_left(book, (old, sid))]
+            del known[item_name]
+        if price is not None:
+            bisect.insort(book, (price, sid))
+            known[item_name] = price
+        if not book:
+            del self._books[item_name]
+        station = self._stations[sid]
+        for callback in self._subscribers:
+            callback(item_name, station, old, price)
+
+    def items(self) -> list[str]:
+        return list(self._books)
+
+    def price_at(self, station, item_name: str) -> int | None:
+        return self._prices.get(id(station), {}).get(item_name)
+
+    def cheapest(self, item_name: str, k: int = 1) -> list[tuple[int, object]]:
+        """Return up to ``k`` ``(price, station)`` pairs, cheapest first."""
+        book = self._books.get(item_name, [])
+        return [(price, self._stations[sid]) for price, sid in book[:k]]
+
+    def sellers(self, item_name: str):
+        """Yield ``(price, station)`` for every station stocking ``item_name``."""
+        for price, sid in self._books.get(item_name, []):
+            yield price, self._stations[sid]
+
+
+class TradeRouteSolver:
+    """Rank trade routes by profit per second of travel.
+
+    Travel time is the cheaper of flying on autopilot, hyperjumping (when
+    ``hyperdrive`` is available) or taking a single wormhole or portal
+    shortcut. Per-item results are cached per origin cell and discarded
+    when a relevant price moves more than ``threshold``.
+    """
+
+    def __init__(
+        self,
+        index: MarketIndex,
+        wormholes=None,
+        portals=None,
+        threshold: float = config.TRADE_CACHE_PRICE_THRESHOLD,
+    ) -> None:
+        self.index = index
+        self.wormholes = [w for w in wormholes or [] if w.pair]
+        self.portals = [p for p in portals or [] if p.pair]
+        self.threshold = threshold
+        # (origin key, item) -> ranked routes for that item
+        self._cache: dict[tuple, list[TradeRoute]] = {}
+        # item -> (station id -> price used, cheapest price left out,
+        # candidate buyer id -> unit quote used, lowest of those quotes)
+        self._snapshots: dict[str, tuple[dict[int, int], float, dict[int, int], int]] = {}
+        # Bumped whenever cached routes are dropped
+        self.version = 0
+        # station pair -> leg (time, toll); stations never move
+        self._legs: dict[tuple, tuple[float, int]] = {}
+        index.subscribe(self._on_price_change)
+
+    def _on_price_change(self, item_name, station, old, new) -> None:
+        snap = self._snapshots.get(item_name)
+        if snap is None:
+            return
+        prices, cutoff, buyers, floor = snap
+        base = prices.get(id(station))
+        if base is None:
+            stale = new is not None and new < cutoff
+        else:
+            stale = new is None or abs(new - base) > base * self.threshold
+        # A listing may also move what the station pays for the item
+        quote = station.sell_quote(None, item_name, 1)
+        paid = buyers.get(id(station))
+        if paid is None:
+            stale = stale or quote > floor * (1 + self.threshold)
+        else:
+            stale = stale or abs(quote - paid) > paid * self.threshold
+        if stale:
+            self.invalidate(item_name)
+
+    def invalidate(self, item_name: str | None = None) -> None:
+        """Forget cached routes for ``item_name`` or for every item."""
+        self.version += 1
+        if item_name is None:
+            self._cache.clear()
+            self._snapshots.clear()
+            return
+        self._snapshots.pop(item_name, None)
+        for key in [k for k in self._cache if k[1] == item_name]:
+            del self._cache[key]
+
+    # --- Travel cost -------------------------------------------------------
+
+    def _direct_time(self, dist: float, speed: float, hyperdrive: bool) -> float:
+        t = dist / speed
+        if hyperdrive:
+            t = min(t, config.HYPERJUMP_DELAY + hyperjump_duration(dist))
+        return t
+
+    def travel_time(
+        self,
+        ax: float,
+        ay: float,
+        bx: float,
+        by: float,
+        speed: float = config.AUTOPILOT_SPEED,
+        hyperdrive: bool = False,
+        faction: str | None = None,
+    ) -> tuple[float, int]:
+        """Return ``(seconds, toll)`` for the fastest way from A to B."""
+        best = (self._direct_time(math.hypot(bx - ax, by - ay), speed, hyperdrive), 0)
+        for hole in self.wormholes:
+            t = (
+                self._direct_time(math.hypot(hole.x - ax, hole.y - ay), speed, hyperdrive)
+                + config.WORMHOLE_DELAY
+                + self._direct_time(
+                    math.hypot(bx - hole.pair.x, by - hole.pair.y), speed, hyperdrive
+                )
+            )
+            if t < best[0]:
+                best = (t, 0)
+        for portal in self.portals:
+            t = self._direct_time(
+                math.hypot(portal.x - ax, portal.y - ay), speed, hyperdrive
+            ) + self._direct_time(
+                math.hypot(bx - portal.pair.x, by - portal.pair.y), speed, hyperdrive
+            )
+            if t < best[0]:
+                toll = 0 if faction == portal.allowed_faction else config.PORTAL_USE_COST
+                best = (t, toll)
+        return best
+
+    def _station_leg(self, a, b, speed, hyperdrive, faction) -> tuple[float, int]:
+        if a is b:
+            return 0.0, 0
+        key = (id(a), id(b), speed, hyperdrive, faction)
+        leg = self._legs.get(key)
+        if leg is None:
+            leg = self.travel_time(a.x, a.y, b.x, b.y, speed, hyperdrive, faction)
+            self._legs[key] = leg
+        return leg
+
+    # --- Queries -----------------------------------------------------------
+
+    def best_price(self, item_name: str):
+        """Return ``(price, station)`` for the cheapest listing or ``None``."""
+        best = self.index.cheapest(item_name, 1)
+        return best[0] if best else None
+
+    def best_routes(
+        self,
+        x: float,
+        y: float,
+        k: int = 5,
+        quantity: int = 1,
+        player=None,
+        speed: float = config.AUTOPILOT_SPEED,
+        hyperdrive: bool = False,
+        items=None,
+    ) -> list[TradeRoute]:
+        """Return the ``k`` most profitable routes starting from ``(x, y)``."""
+        faction = None
+        if player is not None and getattr(player, "fraction", None):
+            faction = player.fraction.name
+        cell = config.TRADE_CACHE_CELL
+        origin = (int(x // cell), int(y // cell), k, quantity, faction, speed, hyperdrive)
+        names = self.index.items() if items is None else items
+        candidates: list[TradeRoute] = []
+        for name in names:
+            key = (origin, name)
+            routes = self._cache.get(key)
+            if routes is None:
+                routes = self._routes_for_item(
+                    name, x, y, k, quantity, player, speed, hyperdrive, faction
+                )
+                self._cache[key] = routes
+            candidates.extend(routes)
+        return heapq.nlargest(k, candidates, key=lambda r: r.profit_rate)
+
+    def _routes_for_item(
+        self, name, x, y, k, quantity, player, speed, hyperdrive, faction
+    ) -> list[TradeRoute]:
+        stations = self.index.stations
+        if not stations:
+            return []
+        sell_at = heapq.nlargest(
+            config.TRADE_SELL_CANDIDATES,
+            stations,
+            key=lambda st: st.sell_quote(player, name, 1),
+        )
+        top_quote = sell_at[0].sell_quote(player, name, 1)
+        buyers = {id(st): st.sell_quote(None, name, 1) for st in sell_at}
+        floor = min(buyers.values())
+        snapshot: dict[int, int] = {}
+        cutoff = math.inf
+        routes: list[TradeRoute] = []
+        for price, seller in self.index.sellers(name):
+            if seller.buy_quote(player, name, 1) >= top_quote:
+                # Books are sorted, so every remaining listing is dearer
+                cutoff = price
+                break
+            snapshot[id(seller)] = price
+            qty = min(quantity, seller.market[name]["stock"])
+            cost = seller.buy_quote(player, name, qty)
+            to_seller, toll_in = self.travel_time(
+                x, y, seller.x, seller.y, speed, hyperdrive, faction
+            )
+            for buyer in dict.fromkeys(sell_at + [seller]):
+                leg, toll_out = self._station_leg(seller, buyer, speed, hyperdrive, faction)
+                route = TradeRoute(
+                    name,
+                    seller,
+                    buyer,
+                    qty,
+                    cost,
+                    buyer.sell_quote(player, name, qty),
+                    to_seller + leg,
+                    toll_in + toll_out,
+                )
+                if route.profit > 0:
+                    routes.append(route)
+        self._snapshots[name] = (snapshot, cutoff, buyers, floor)
+        return heapq.nlargest(k, routes, key=lambda r: r.profit_rate)
@@ -84,17 +84,35 @@ class DropdownMenu:
 class RoutePlanner:
     """Allow selecting a destination and draw a route to it."""
 
-    def __init__(self) -> None:
+    def __init__(self, nav_graph=None) -> None:
         self.active = False
         self.destination = None
+        self.nav_graph = nav_graph
+        self.route = None
 
     def start(self) -> None:
         self.active = True
         self.destination = None
+        self.route = None
 
     def cancel(self) -> None:
         self.active = False
         self.destination = None
+        self.route = None
+
+    def plan(self, ship, hyperdrive: bool = False):
+        """Compute and store the route from ``ship`` to the destination.
+
+        Jump legs are only offered when ``ship`` can hyperjump at all; its
+        remaining cooldown counts towards the jump's time.
+        """
+        self.route = None
+        if self.nav_graph and self.destination:
+            wait = ship.hyperjump_wait() if hyperdrive else None
+            self.route = self.nav_graph.find_route(
+                ship.x, ship.y, self.destination, wait is not None, wait or 0.0
+            )
+        return self.route
 
     def handle_event(self, event, sectors: list, camera_pos, zoom: float) -> None:
         """Process events while selecting a destination."""
@@ -111,6 +129,7 @@ class RoutePlanner:
                 obj = sector.get_object_at_point(world_x, world_y, 0)
                 if obj:
                     self.destination = obj
+                    self.route = None
                     self.active = False
                     break
 
@@ -128,11 +147,31 @@ class RoutePlanner:
                 int((ship.x - offset_x) * zoom),
                 int((ship.y - offset_y) * zoom),
             )
-            end = (
-                int((self.destination.x - offset_x) * zoom),
-                int((self.destination.y - offset_y) * zoom),
+            points = [start]
+            colors = []
+            legs = self.route.legs if self.route else []
+            for leg in legs[:-1]:
+                if leg.entry:
+                    points.append(
+                        (
+                            int((leg.entry[0] - offset_x) * zoom),
+                            int((leg.entry[1] - offset_y) * zoom),
+                        )
+                    )
+                    colors.append((0, 255, 0))
+                points.append(
+                    (int((leg.x - offset_x) * zoom), int((leg.y - offset_y) * zoom))
+                )
+                colors.append((0, 255, 0) if leg.kind == "fly" else (120, 160, 255))
+            points.append(
+                (
+                    int((self.destination.x - offset_x) * zoom),
+                    int((self.destination.y - offset_y) * zoom),
+                )
             )
-            pygame.draw.line(screen, (0, 255, 0), start, end, 2)
+            colors.append((0, 255, 0))
+            for color, a, b in zip(colors, points, points[1:]):
+                pygame.draw.line(screen, color, a, b, 2)
         if self.active:
             width, height = 200, 50
             rect = pygame.Rect((config.WINDOW_WIDTH - width) // 2, 40, width, height)
@@ -360,9 +399,14 @@ class ShipAssemblyWindow:
 class MarketWindow:
     """Trade items between the player and a station."""
 
-    def __init__(self, station, player) -> None:
+    def __init__(self, station, player, market_index=None, trade_solver=None) -> None:
         self.station = station
         self.player = player
+        self.market_index = market_index
+        self.trade_solver = trade_solver
+        # Best route from this station and the solver version it came from
+        self._best_route = None
+        self._route_version = None
         self.close_rect = pygame.Rect(config.WINDOW_WIDTH - 110, 10, 100, 30)
         self.buy_rects: list[tuple[str, pygame.Rect]] = []
         self.sell_rects: list[tuple[str, pygame.Rect]] = []
@@ -447,6 +491,53 @@ class MarketWindow:
         txt = font.render("Close", True, (255, 255, 255))
         screen.blit(txt, txt.get_rect(center=self.close_rect.center))
 
+        if self.trade_solver:
+            self._draw_best_route(screen, font)
+        if self.market_index:
+            self._draw_best_price_hint(screen, font)
+
+    def _draw_best_route(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
+        """Suggest the most profitable trade route starting from this station.
+
+        The route is only looked up again after the solver drops cached
+        routes, not on every frame.
+        """
+        solver = self.trade_solver
+        if self._route_version != solver.version:
+            routes = solver.best_routes(
+                self.station.x, self.station.y, k=1, player=self.player
+            )
+            self._best_route = routes[0] if routes else None
+            self._route_version = solver.version
+        route = self._best_route
+        if route is None:
+            return
+        where = "here" if route.buy_station is self.station else f"at {route.buy_station.name}"
+        txt = font.render(
+            f"Best route: buy {route.item} {where} for {route.cost}, "
+            f"sell at {route.sell_station.name} for {route.revenue} "
+            f"({route.profit:+d} cr, {int(route.travel_time)} s)",
+            True,
+            (160, 220, 160),
+        )
+        screen.blit(txt, (20, config.WINDOW_HEIGHT - 40))
+
+    def _draw_best_price_hint(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
+        """Show where the hovered item is cheapest across all stations."""
+        pos = pygame.mouse.get_pos()
+        for name, rect in self.buy_rects:
+            if not rect.collidepoint(pos):
+                continue
+            best = self.market_index.cheapest(name, 1)
+            if not best or best[0][1] is self.station:
+                return
+            price, station = best[0]
+            hint = font.render(f"Cheapest: {station.name} - {price}", True, (160, 220, 160))
+            bg = hint.get_rect(topleft=(pos[0] + 12, pos[1] + 12)).inflate(8, 4)
+            pygame.draw.rect(screen, (30, 30, 50), bg)
+            screen.blit(hint, hint.get_rect(center=bg.center))
+            return
+
 
 class WeaponMenu:
     """Menu to switch the ship's active weapon."""
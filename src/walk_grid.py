@@ -0,0 +1,95 @@
+"""Walkable grid of a planet surface.
+
+:class:`WalkGrid` keeps one boolean per ``cell``-pixel square and offers
+bulk stamping helpers so terrain edits run as array operations.
+"""
+
+import numpy as np
+
+
+class WalkGrid:
+    """Blocked flags for a ``cols x rows`` grid of ``cell``-pixel squares.
+
+    ``blocked`` is a ``(rows, cols)`` array, so ``blocked[j][i]`` reads as it
+    did with the old list of lists.
+    """
+
+    def __init__(self, cols: int, rows: int, cell: int) -> None:
+        self.cols = cols
+        self.rows = rows
+        self.cell = cell
+        self.blocked = np.zeros((rows, cols), dtype=bool)
+        # Centre of every cell, used by the shape helpers
+        self._cx = np.arange(cols) * cell + cell // 2
+        self._cy = np.arange(rows) * cell + cell // 2
+
+    def _span(self, x0: float, y0: float, x1: float, y1: float) -> tuple[slice, slice] | None:
+        """Return row/col slices of the cells touched by a pixel box, inclusive."""
+        c0 = max(int(x0 // self.cell), 0)
+        c1 = min(int(x1 // self.cell), self.cols - 1)
+        r0 = max(int(y0 // self.cell), 0)
+        r1 = min(int(y1 // self.cell), self.rows - 1)
+        if c0 > c1 or r0 > r1:
+            return None
+        return slice(r0, r1 + 1), slice(c0, c1 + 1)
+
+    def clear(self) -> None:
+        self.blocked[:] = False
+
+    def set_cell(self, i: int, j: int, value: bool = True) -> None:
+        self.blocked[j, i] = value
+
+    def toggle_cell(self, i: int, j: int) -> bool:
+        """Flip cell ``(i, j)`` and return its new state."""
+        self.blocked[j, i] = not self.blocked[j, i]
+        return bool(self.blocked[j, i])
+
+    def fill_cells(self, rows, cols, value: bool = True) -> None:
+        self.blocked[np.asarray(rows, dtype=int), np.asarray(cols, dtype=int)] = value
+
+    def fill_rect(self, left: float, top: float, right: float, bottom: float, value: bool = True) -> None:
+        """Set every cell the pixel box touches, edges included."""
+        span = self._span(left, top, right, bottom)
+        if span is not None:
+            self.blocked[span] = value
+
+    def fill_circle(self, x: float, y: float, radius: float, value: bool = True) -> None:
+        """Set the cells whose centre lies within ``radius`` of ``(x, y)``."""
+        span = self._span(x - radius, y - radius, x + radius, y + radius)
+        if span is None:
+            return
+        rows, cols = span
+        dx = self._cx[cols][None, :] - x
+        dy = self._cy[rows][:, None] - y
+        inside = dx * dx + dy * dy <= radius * radius
+        self.blocked[span][inside] = value
+
+    def fill_polygon(self, poly: list[tuple[float, float]], value: bool = True) -> None:
+        """Set the cells whose centre lies inside ``poly`` (even-odd rule)."""
+        xs = [p[0] for p in poly]
+        ys = [p[1] for p in poly]
+        span = self._span(min(xs), min(ys), max(xs), max(ys))
+        if span is None:
+            return
+        rows, cols = span
+        px = self._cx[cols][None, :].astype(float)
+        py = self._cy[rows][:, None].astype(float)
+        inside = np.zeros((len(py), px.shape[1]), dtype=bool)
+        j = len(poly) - 1
+        for i in range(len(poly)):
+            xi, yi = poly[i]
+            xj, yj = poly[j]
+            crosses = (yi > py) != (yj > py)
+            inside ^= crosses & (px < (xj - xi) * (py - yi) / (yj - yi + 1e-9) + xi)
+            j = i
+        self.blocked[span][inside] = value
+
+    def cell_of(self, x: float, y: float) -> tuple[int, int]:
+        """Return the ``(col, row)`` holding ``(x, y)``, clamped to the grid."""
+        i = min(self.cols - 1, max(0, int(x // self.cell)))
+        j = min(self.rows - 1, max(0, int(y // self.cell)))
+        return i, j
+
+    def is_blocked(self, x: float, y: float) -> bool:
+        i, j = self.cell_of(x, y)
+        return bool(self.blocked[j, i])
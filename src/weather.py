@@ -0,0 +1,63 @@
+"""Screen-space weather overlays for planet surfaces.
+
+Weather used to live on map-sized surfaces that were filled and blitted
+whole every frame. Full-screen filters are now a single window-sized
+tinted surface, and storm regions are kept as shapes that are only
+rasterised where they meet the camera.
+"""
+
+import pygame
+
+import config
+
+
+class ScreenTint:
+    """A translucent colour laid over the whole window."""
+
+    def __init__(self, color: tuple[int, int, int, int]) -> None:
+        self.color = color
+        self._surface: pygame.Surface | None = None
+
+    def draw(self, screen: pygame.Surface) -> None:
+        size = screen.get_size()
+        if self._surface is None or self._surface.get_size() != size:
+            self._surface = pygame.Surface(size, pygame.SRCALPHA)
+            self._surface.fill(self.color)
+        screen.blit(self._surface, (0, 0))
+
+
+class StormField:
+    """Elliptical storm regions in world coordinates.
+
+    Storms are purely visual, as they were when they lived on a surface:
+    their translucent colour never registered as terrain.
+    """
+
+    def __init__(self, color: tuple[int, int, int, int] = config.STORM_COLOR) -> None:
+        self.color = color
+        self.rects: list[pygame.Rect] = []
+        self._overlay: pygame.Surface | None = None
+
+    def __len__(self) -> int:
+        return len(self.rects)
+
+    def add(self, rect: pygame.Rect) -> None:
+        self.rects.append(pygame.Rect(rect))
+
+    def draw(self, screen: pygame.Surface, offset_x: float, offset_y: float) -> None:
+        """Rasterise the storms overlapping the view and blit just that area."""
+        size = screen.get_size()
+        if self._overlay is None or self._overlay.get_size() != size:
+            self._overlay = pygame.Surface(size, pygame.SRCALPHA)
+        view = pygame.Rect(int(offset_x), int(offset_y), *size)
+        dirty: pygame.Rect | None = None
+        for rect in self.rects:
+            if not view.colliderect(rect):
+                continue
+            rect = pygame.draw.ellipse(
+                self._overlay, self.color, rect.move(-int(offset_x), -int(offset_y))
+            )
+            dirty = rect if dirty is None else dirty.union(rect)
+        if dirty is not None:
+            screen.blit(self._overlay, dirty.topleft, dirty)
+            self._overlay.fill((0, 0, 0, 0), dirty)
@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from ai_scheduler import AIScheduler
+
+
+def test_thinkers_are_staggered_and_run_at_their_rate():
+    scheduler = AIScheduler(budget_ms=1000.0)
+    calls = {i: [] for i in range(4)}
+    for i in range(4):
+        scheduler.register(lambda elapsed, i=i: calls[i].append(scheduler.time), 2.0)
+    first_frames = []
+    for _ in range(60):
+        scheduler.tick(1 / 30)
+        first_frames.append(scheduler.ran)
+    # Two seconds at 2 Hz gives every thinker four decisions
+    assert all(len(c) == 4 for c in calls.values())
+    # Registrations land on different frames instead of all at once
+    assert len({round(c[0], 4) for c in calls.values()}) == 4
+    assert max(first_frames) < 4
+
+
+def test_budget_defers_low_priority_thinkers():
+    clock = [0.0]
+
+    def slow(elapsed):
+        clock[0] += 0.002  # each decision costs 2 ms
+
+    scheduler = AIScheduler(budget_ms=3.0, timer=lambda: clock[0])
+    urgent = []
+    scheduler.register(lambda elapsed: urgent.append(elapsed), 100.0, priority=1)
+    for _ in range(5):
+        scheduler.register(slow, 100.0)
+    scheduler.tick(0.05)
+    assert urgent
+    # The urgent thinker and two slow ones fit into 3 ms
+    assert scheduler.ran == 3
+    assert scheduler.deferred == 3
+    # Deferred thinkers run once they have waited too long
+    scheduler.tick(1.0)
+    assert scheduler.deferred == 0
@@ -0,0 +1,76 @@
+import sys
+import types
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from combat_events import CombatEvents
+from threat_map import ThreatMap
+
+
+class _Hull:
+    def __init__(self, hull):
+        self.x = 0.0
+        self.y = 0.0
+        self.hull = hull
+        self.projectiles = []
+        self.calls = 0
+
+    def take_damage(self, amount):
+        self.calls += 1
+        self.hull -= amount
+
+
+def test_resolve_aggregates_damage_and_reports_kills():
+    events = CombatEvents()
+    seen = []
+    events.subscribe(seen.append)
+    tough, weak = _Hull(100), _Hull(5)
+    for _ in range(3):
+        events.hit(tough, 10)
+    events.hit(weak, 4)
+    events.hit(weak, 4)
+    assert tough.hull == 100
+    events.resolve()
+    assert (tough.hull, tough.calls) == (70, 1)
+    assert weak.hull == -3
+    kills = [e.target for e in seen[0] if e.kind == "kill"]
+    assert kills == [weak]
+    assert events.resolve() == []
+
+
+def test_despawned_projectiles_are_compacted_once():
+    shooter = _Hull(50)
+    shots = [types.SimpleNamespace(x=float(i), y=0.0, damage=1) for i in range(5)]
+    shooter.projectiles = list(shots)
+    events = CombatEvents()
+    threats = ThreatMap([types.SimpleNamespace(ship=shooter)], events=events)
+    assert threats.remove_projectile(shots[1], shooter)
+    assert threats.remove_projectile(shots[3], shooter)
+    assert not threats.remove_projectile(shots[1], shooter)
+    # Lists stay intact until the resolution phase
+    assert len(shooter.projectiles) == 5
+    events.resolve()
+    assert shooter.projectiles == [shots[0], shots[2], shots[4]]
+
+
+def test_absorbed_shot_deals_no_damage():
+    from combat import GuidedMissile
+    from faction_structures import CapitalShip
+    from fraction import FRACTIONS
+    from ship import Ship
+
+    explorers = next(f for f in FRACTIONS if f.name == "Free Explorers")
+    cap = CapitalShip(0, 0)
+    cap.apply_fraction_traits(explorers)
+    player = Ship(300, 0)
+    missile = GuidedMissile(300, 0, player, 200, 10)
+    cap.projectiles.append(missile)
+
+    events = CombatEvents()
+    # A drone, decoy or aura soaks the missile earlier in the tick
+    threats = ThreatMap([types.SimpleNamespace(ship=cap)], events=events)
+    assert threats.remove_projectile(missile, cap)
+    cap.update(1 / 60, [], [], player, {}, events)
+    assert [e for e in events.resolve() if e.kind == "hit"] == []
+    assert missile not in cap.projectiles
@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np
+
+import config
+from creatures import CreatureManager
+from planet_surface import Creature
+
+
+def test_only_creatures_near_explorer_wake_and_move():
+    sim = CreatureManager(3000, 3000, cell=200)
+    near = Creature(500, 500, 3000, 3000)
+    far = Creature(2900, 2900, 3000, 3000)
+    for creature in (near, far):
+        creature.vx = 40.0
+        sim.add(creature)
+    sim.wake(450, 450, radius=400)
+    assert sim.awake[:2].tolist() == [True, False]
+    for _ in range(10):
+        sim.update(0.1)
+    assert near.x > 500
+    assert (far.x, far.y) == (2900, 2900) and sim.x[1] == 2900
+
+
+def test_hostile_follows_flow_field_around_wall(monkeypatch):
+    monkeypatch.setattr(config, "CREATURE_CHASE_RADIUS", 1000)
+    blocked = np.zeros((10, 10), dtype=bool)
+    blocked[1:10, 5] = True  # wall with a gap in the top row
+    sim = CreatureManager(600, 600, cell=200)
+    sim.set_obstacles(blocked, 60)
+    hunter = Creature(150, 450, 600, 600, hostile=True)
+    sim.add(hunter)
+    target = (450, 450)
+    top = hunter.y
+    for _ in range(900):
+        sim.wake(*target)
+        sim.think(*target, elapsed=1 / 30)
+        sim.update(1 / 30)
+        top = min(top, hunter.y)
+    # The direct line crosses the wall; the field leads up through the gap
+    assert top < 120
+    assert hunter.chasing
+    assert sim.hostile_contacts(*target, 10) == 1
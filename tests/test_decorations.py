@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import pygame
+
+from decorations import Decorations, tree_radius
+
+
+def test_trees_and_stones_share_sprites_and_footprints():
+    surface = pygame.Surface((200, 200))
+    collision = pygame.Surface((200, 200), pygame.SRCALPHA)
+    deco = Decorations()
+    canopy, trunk = (20, 90, 20), (60, 40, 20)
+    for x in (40, 100, 160):
+        deco.tree(x, 60, 5, canopy, trunk)
+    deco.stone(100, 160, 4)
+    assert len(deco) == 4
+    deco.flush(surface, collision)
+    assert len(deco) == 0
+    r = tree_radius(5)
+    assert surface.get_at((100, 60))[:3] == canopy
+    assert surface.get_at((100, 60 + 2 * r - 1))[:3] == trunk
+    assert surface.get_at((100, 160))[:3] == (80, 80, 80)
+    # Only the lower half of the trunk and the stone collide
+    assert collision.get_at((100, 60 + r + 1)).a == 255
+    assert collision.get_at((100, 60 + r // 2)).a == 0
+    assert collision.get_at((100, 160)).a == 255
+    assert len(deco._sprites) == 4
@@ -0,0 +1,71 @@
+import sys
+import types
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import math
+
+import config
+from blackhole import BlackHole
+from fleet import Fleet
+from ship import Ship
+
+
+def test_fleet_moves_like_ships_and_feels_black_holes():
+    anchor = types.SimpleNamespace(x=1000.0, y=0.0)
+    fleet = Fleet(capacity=2)
+    group = fleet.add_group(anchor)
+    for i in range(5):
+        fleet.add(0.0, 100.0 * i, group=group)
+    for _ in range(200):
+        fleet.update(1 / 30, 4000, 4000)
+    speeds = [math.hypot(fleet.vx[i], fleet.vy[i]) for i in range(len(fleet))]
+    assert max(speeds) <= config.SHIP_MAX_SPEED + 1e-6
+    assert all(fleet.x[i] > 0 for i in range(len(fleet)))
+
+    hole = BlackHole(2000, 2000)
+    fleet.x[0], fleet.y[0] = 2000 + hole.radius - 1, 2000
+    fleet.update(1 / 30, 4000, 4000, [hole])
+    assert len(fleet) == 4
+
+
+def test_promote_and_demote_near_player():
+    anchor = types.SimpleNamespace(x=500.0, y=500.0)
+    fleet = Fleet()
+    group = fleet.add_group(anchor)
+    fleet.add(500.0, 500.0, group=group)
+    fleet.add(3000.0, 3000.0, group=group)
+    fleet.hull[0] = 42
+
+    player = Ship(520, 500)
+    ships: list = []
+    fleet.sync_with(player, ships)
+    assert len(ships) == 1 and len(fleet) == 1
+    assert ships[0].hull == 42
+
+    player.x = 3000
+    player.y = 2900
+    fleet.sync_with(player, ships)
+    assert len(ships) == 1 and len(fleet) == 1
+    assert ships[0].x == 3000.0
+
+
+def test_promoted_escorts_keep_patrolling_with_their_group():
+    anchor = types.SimpleNamespace(x=500.0, y=500.0)
+    fleet = Fleet()
+    group = fleet.add_group(anchor)
+    fleet.add(500.0, 500.0, group=group)
+    field = types.SimpleNamespace(goal_x=2000.0, goal_y=500.0)
+    flow_map = types.SimpleNamespace(
+        update_obstacles=lambda: False, field_to=lambda x, y: field
+    )
+
+    npc_ships: list = []
+    fleet.sync_with(Ship(520, 500), npc_ships)
+    escort = npc_ships[0]
+    assert escort.flow_field is None
+    fleet.groups[group].rally_x = 2000.0
+    fleet.groups[group].field = None
+    fleet.update(1 / 30, 4000, 4000, flow_map=flow_map)
+    assert escort.flow_field is field
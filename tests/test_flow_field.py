@@ -0,0 +1,62 @@
+import sys
+import types
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np
+
+from flow_field import FlowFieldMap
+
+
+def _world(stars):
+    systems = [
+        types.SimpleNamespace(
+            star=types.SimpleNamespace(x=x, y=y, radius=r), planets=[], stations=[]
+        )
+        for x, y, r in stars
+    ]
+    return [types.SimpleNamespace(systems=systems)]
+
+
+def test_field_steers_around_obstacle_and_is_shared():
+    flow = FlowFieldMap(_world([(500, 500, 120)]), 1000, 1000)
+    field = flow.field_to(900, 500)
+    assert flow.field_to(900, 500) is field
+
+    # Walk the field from the far side of the star
+    x, y = 100.0, 500.0
+    for _ in range(400):
+        dx, dy = field.sample(x, y)
+        x += dx * 10
+        y += dy * 10
+        assert not flow.blocked[int(y // flow.cell), int(x // flow.cell)]
+    assert abs(x - 900) < 20 and abs(y - 500) < 20
+
+    xs = np.array([100.0, 880.0])
+    ys = np.array([500.0, 510.0])
+    dx, dy = field.sample_many(xs, ys)
+    assert (dx[0], dy[0]) == field.sample(100, 500)
+    assert (dx[1], dy[1]) == field.sample(880, 510)
+
+
+def test_moving_capital_ship_rebuilds_fields():
+    cap = types.SimpleNamespace(x=500, y=500, radius=100)
+    flow = FlowFieldMap(_world([]), 1000, 1000, capital_ships=[cap])
+    field = flow.field_to(900, 500)
+    assert flow.blocked[10, 10]
+    cap.x = 200
+    assert flow.update_obstacles()
+    assert not flow.blocked[10, 10]
+    assert flow.field_to(900, 500) is not field
+
+
+def test_goals_in_one_cell_share_the_integrated_grid():
+    flow = FlowFieldMap(_world([(500, 500, 120)]), 1000, 1000)
+    field = flow.field_to(905, 505)
+    other = flow.field_to(910, 512)
+    assert other is not field and other.cost is field.cost and other.dir_x is field.dir_x
+    assert (other.goal_x, other.goal_y) == (910, 512)
+    assert flow.field_to(905, 505) is field
+    dx, dy = other.sample(905, 512)
+    assert (dx, dy) == (1.0, 0.0)
@@ -0,0 +1,38 @@
+import gc
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import config
+from gc_policy import GCPolicy
+
+
+def test_freeze_and_pause_timing():
+    policy = GCPolicy(thresholds=(1234, 5, 6))
+    try:
+        world = [[i] for i in range(1000)]
+        assert policy.freeze_world() >= len(world)
+        policy.enter_gameplay()
+        assert gc.get_threshold() == (1234, 5, 6)
+        gc.collect()
+        assert policy.stats.collections[2] >= 1
+        assert policy.stats.worst_ms[2] >= policy.stats.last_ms >= 0.0
+        assert "gen2" in policy.stats.report()
+    finally:
+        gc.unfreeze()
+        policy.close()
+    assert gc.get_threshold() != (1234, 5, 6)
+    assert policy._time not in gc.callbacks
+
+
+def test_idle_collects_once_per_interval():
+    policy = GCPolicy()
+    try:
+        assert not policy.idle(config.GC_IDLE_INTERVAL / 2)
+        before = policy.stats.collections[2]
+        assert policy.idle(config.GC_IDLE_INTERVAL / 2)
+        assert policy.stats.collections[2] == before + 1
+        assert not policy.idle(0.1)
+    finally:
+        policy.close()
@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import pygame
+
+from planet_surface import LavaRiver
+
+
+def test_lava_river_membership_follows_drift():
+    river = LavaRiver([(0, 100), (200, 100), (400, 100)], 20, (0, 1), speed=10.0)
+    assert river.contains(150, 105)
+    assert not river.contains(150, 125)
+    river.update(2.0)
+    assert river.offset() == (0.0, 20.0)
+    assert river.contains(150, 125)
+    assert not river.contains(150, 95)
+    assert not river.contains(500, 120)
+
+
+def test_visible_runs_only_cover_segments_in_view():
+    points = [(i * 100, 0) for i in range(10)]
+    river = LavaRiver(points, 10, (1, 0), speed=50.0)
+    runs = river.visible_runs(pygame.Rect(250, -50, 200, 100))
+    assert len(runs) == 1
+    assert runs[0][0][0] == 200 and runs[0][-1][0] == 500
+    river.update(1.0)
+    runs = river.visible_runs(pygame.Rect(250, -50, 200, 100))
+    assert runs[0][0][0] == 150 and runs[0][-1][0] == 550
+    assert river.visible_runs(pygame.Rect(0, 500, 100, 100)) == []
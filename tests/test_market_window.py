@@ -36,3 +36,25 @@ def test_market_text(monkeypatch):
     assert "Sell hierro (2) +5" in font.texts
     expected = int(2 * 5 * EXCHANGE_RATE)
     assert f"Exchange hierro (2) +{expected}" in font.texts
+
+
+def test_best_route_is_looked_up_once_per_solver_version():
+    from trade import MarketIndex, TradeRouteSolver
+
+    player = Player("Test", 20, Human(), FRACTIONS[0])
+    station = SpaceStation(0, 0)
+    station.market = {"hierro": {"stock": 3, "price": 2}}
+    solver = TradeRouteSolver(MarketIndex([station]))
+    calls = []
+    lookup = solver.best_routes
+    solver.best_routes = lambda *a, **kw: calls.append(1) or lookup(*a, **kw)
+    market = MarketWindow(station, player, trade_solver=solver)
+
+    font = DummyFont()
+    market.draw(SCREEN, font)
+    market.draw(SCREEN, font)
+    assert len(calls) == 1
+    assert any(t.startswith("Best route: buy hierro here") for t in font.texts)
+    solver.invalidate()
+    market.draw(SCREEN, font)
+    assert len(calls) == 2
@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from asteroid import Asteroid
+from combat import Projectile
+from faction_structures import CityBuilding
+from particles import ParticleEngine
+from planet import Planet
+from planet_surface import Creature, ItemPickup
+from star import Star
+
+# Bytes per instance: object header plus one pointer per slot, no __dict__
+BUDGETS = {
+    Asteroid: 96,
+    Planet: 136,
+    ItemPickup: 64,
+    Creature: 128,
+    CityBuilding: 64,
+    Projectile: 120,
+}
+
+
+def test_entities_fit_byte_budget():
+    star = Star(0, 0, 10)
+    samples = [
+        Asteroid(10, 10, 3),
+        Planet(star, 100, 5, (100, 100, 100), 0.0, 0.01),
+        ItemPickup("ore", 1, 2),
+        Creature(1, 2, 100, 100),
+        CityBuilding(1, 2, "circle"),
+        Projectile(0, 0, 1, 0, 100, 1),
+    ]
+    for obj in samples:
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+        assert sys.getsizeof(obj) <= BUDGETS[type(obj)], type(obj).__name__
+
+
+def test_particles_fit_byte_budget():
+    engine = ParticleEngine(capacity=1000)
+    arrays = [v for v in vars(engine).values() if hasattr(v, "nbytes")]
+    assert sum(a.nbytes for a in arrays) / engine.capacity <= 128
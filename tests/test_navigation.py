@@ -0,0 +1,107 @@
+import sys
+import types
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from navigation import NavGraph, segment_hits
+
+
+def _system(x, y, radius=100):
+    star = types.SimpleNamespace(x=x, y=y, radius=radius)
+    return types.SimpleNamespace(star=star, planets=[], stations=[])
+
+
+def _world(*systems):
+    return [types.SimpleNamespace(systems=list(systems))]
+
+
+def _legs_clear(route, start, circles):
+    points = [start] + [(leg.x, leg.y) for leg in route.legs]
+    for (ax, ay), (bx, by) in zip(points, points[1:]):
+        hits = segment_hits([ax], [ay], [bx], [by], *zip(*circles))
+        assert not hits.any()
+
+
+def test_route_goes_around_star_system():
+    graph = NavGraph(_world(_system(500, 500)))
+    goal = types.SimpleNamespace(x=900, y=500)
+    route = graph.find_route(100, 500, goal)
+    assert len(route.legs) > 1
+    assert route.time > 800 / graph.speed
+    _legs_clear(route, (100, 500), [(500, 500, 100)])
+
+
+def test_wormhole_shortcut():
+    hole_a = types.SimpleNamespace(x=300, y=300, pair=None)
+    hole_b = types.SimpleNamespace(x=3300, y=300, pair=hole_a)
+    hole_a.pair = hole_b
+    graph = NavGraph(
+        _world(_system(200, 200, 20), _system(3400, 200, 20)),
+        wormholes=[hole_a, hole_b],
+    )
+    route = graph.find_route(200, 450, types.SimpleNamespace(x=3400, y=450))
+    assert "wormhole" in [leg.kind for leg in route.legs]
+
+
+def test_moving_capital_ship_reopens_edges():
+    cap = types.SimpleNamespace(x=700, y=500, radius=100)
+    graph = NavGraph(
+        _world(_system(200, 500, 20), _system(1200, 500, 20), _system(700, 100, 20)),
+        capital_ships=[cap],
+    )
+    goal = types.SimpleNamespace(x=1300, y=500)
+    before = graph.find_route(100, 500, goal)
+    _legs_clear(before, (100, 500), [(700, 500, 140)])
+
+    cap.y = 2000
+    graph.update_obstacles()
+    after = graph.find_route(100, 500, goal)
+    assert after.time < before.time
+    assert all(leg.y > 300 for leg in after.legs)
+
+
+def test_closing_a_fly_edge_keeps_the_wormhole():
+    hole_a = types.SimpleNamespace(x=300, y=300, pair=None)
+    hole_b = types.SimpleNamespace(x=500, y=300, pair=hole_a)
+    hole_a.pair = hole_b
+    graph = NavGraph(_world(_system(200, 900, 20)), wormholes=[hole_a, hole_b])
+    a, b = graph.refs.index(hole_a), graph.refs.index(hole_b)
+    # Flying the short hop is cheaper than the wormhole delay
+    assert graph.adj[a][b][1] == "fly"
+    graph._unlink(a, b)
+    assert graph.adj[a][b][1] == "wormhole" and graph.adj[b][a][1] == "wormhole"
+
+
+def test_jump_cost_includes_remaining_cooldown():
+    graph = NavGraph(_world(_system(200, 900, 20)))
+    goal = types.SimpleNamespace(x=3000, y=3000)
+    ready = graph.find_route(0, 0, goal, hyperdrive=True)
+    assert ready.legs[0].kind == "jump"
+    waiting = graph.find_route(0, 0, goal, hyperdrive=True, jump_wait=1.0)
+    assert waiting.legs[0].kind == "jump"
+    assert abs(waiting.time - ready.time - 1.0) < 1e-9
+    assert graph.find_route(0, 0, goal, hyperdrive=True, jump_wait=1e6).legs[0].kind == "fly"
+
+
+def test_jump_leg_flies_while_drive_cools_down():
+    from ship import Ship
+
+    class _NoKeys:
+        def __getitem__(self, key):
+            return False
+
+    ship = Ship(0, 0)
+    ship.pilot = object()
+    goal = types.SimpleNamespace(x=3000, y=0)
+    route = types.SimpleNamespace(legs=[types.SimpleNamespace(kind="jump", x=3000, y=0)])
+    ship.start_autopilot(goal, route)
+    ship.hyperjump_cooldown = 0.5
+    assert ship.hyperjump_wait() == 0.5
+    for _ in range(10):
+        ship.update(_NoKeys(), 1 / 30, 5000, 5000, [])
+    assert ship.x > 0 and ship.hyperjump_target is None
+    for _ in range(10):
+        ship.update(_NoKeys(), 1 / 30, 5000, 5000, [])
+    assert ship.hyperjump_target is not None or ship.hyperjump_timer > 0
+    assert ship.hyperjump_wait() is None
@@ -0,0 +1,51 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import pygame
+
+import config
+from particles import PARTICLES, ParticleEngine
+from ship import Ship
+
+
+def test_engine_moves_settles_and_expires():
+    engine = ParticleEngine(capacity=100)
+    a, b = engine.new_emitter(), engine.new_emitter()
+    engine.emit(a, [0.0, 10.0], 0.0, 10.0, 0.0, life=1.0, size=2, color=(255, 0, 0), move=0.5)
+    engine.emit(b, 0.0, 0.0, life=3.0, size=2, color=(0, 0, 255))
+    engine.update(0.25)
+    engine.update(0.5)
+    assert engine.x[:2].tolist() == [5.0, 15.0]
+    assert engine.count(a) == 2 and engine.count(b) == 1
+    engine.update(0.5)
+    assert len(engine) == 1 and engine.count(a) == 0
+    engine.kill(b)
+    assert len(engine) == 0
+
+
+def test_budget_thins_bursts_and_draw_culls():
+    pygame.init()
+    engine = ParticleEngine(capacity=100)
+    eid = engine.new_emitter()
+    assert engine.emit(eid, [5.0] * 80, 5.0, life=1.0, size=1, color=(9, 9, 9)) == 80
+    # Past the soft limit a burst is thinned by the share of budget left
+    assert engine.emit(eid, [5.0] * 20, 5.0, life=1.0, size=1, color=(9, 9, 9)) == 16
+    assert engine.emit(eid, [5.0] * 20, 5.0, life=1.0, size=1, color=(9, 9, 9)) == 3
+    assert engine.dropped == 21
+    engine.emit_orbit(engine.new_emitter(), 0, 0, 0.0, 10.0, 1.0, 1.0, size=1, color=(1, 1, 1))
+    screen = pygame.Surface((20, 20))
+    engine.draw(screen, emitter=eid)
+    assert screen.get_at((5, 5))[:3] == (9, 9, 9)
+    engine.draw(screen, offset_x=1000)
+    assert len(engine._sprites) == 1
+
+
+def test_ship_exhaust_is_capped_per_emitter():
+    ship = Ship(100, 100)
+    for _ in range(config.SHIP_PARTICLE_MAX + 20):
+        ship._emit_particle()
+    assert PARTICLES.count(ship.emitter) == config.SHIP_PARTICLE_MAX
+    PARTICLES.update(config.SHIP_PARTICLE_DURATION + 0.1)
+    assert PARTICLES.count(ship.emitter) == 0
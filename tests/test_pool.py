@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from combat import Projectile
+from pool import pool_report
+
+
+def test_shots_are_recycled():
+    shot = Projectile.pool.acquire(0, 0, 10, 0, 100, 1)
+    Projectile.pool.release(shot)
+    again = Projectile.pool.acquire(5, 5, 5, 10, 100, 2)
+    assert again is shot
+    assert (again.x, again.vy, again.damage, again.traveled) == (5, 100, 2, 0.0)
+    assert "Projectile: " in pool_report() and " reused, " in pool_report()
+
+
+def test_drone_drops_a_recycled_shot():
+    import types
+
+    from defensive_drone import DefensiveDrone
+
+    owner = types.SimpleNamespace(x=0.0, y=0.0, size=20, projectiles=[])
+    shot = Projectile.pool.acquire(100, 0, 200, 0, 100, 1)
+    source = types.SimpleNamespace(ship=types.SimpleNamespace(x=5000.0, y=0.0, projectiles=[shot]))
+    drone = DefensiveDrone(owner)
+    drone.update(0.01, [source])
+    assert drone.target is shot and drone.state == "intercept"
+
+    # The shot dies and is reused as an unrelated projectile far away
+    Projectile.pool.release(shot)
+    assert Projectile.pool.acquire(-300, 0, -400, 0, 100, 1) is shot
+    drone.update(0.01, [])
+    assert drone.target is None and drone.state == "idle"
+
+    drone.scheduled = True
+    drone.think([source])
+    Projectile.pool.release(shot)
+    Projectile.pool.acquire(-300, 0, -400, 0, 100, 1)
+    drone.update(0.01, [])
+    assert drone.target is None and drone.state == "idle"
@@ -0,0 +1,34 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import pygame
+
+from combat import Bomb, Projectile, ProjectileBatch, draw_projectiles
+
+
+def test_draw_projectiles_culls_and_draws_trails():
+    screen = pygame.Surface((100, 100))
+    shot = Projectile(20, 50, 80, 50, 600, 1, trail_color=(0, 0, 255))
+    for _ in range(3):
+        shot.update(1 / 60)
+    far = Projectile(5000, 50, 6000, 50, 100, 1)
+    draw_projectiles(screen, [shot, far])
+    assert screen.get_at((int(shot.x), 50))[:3] == (255, 50, 50)
+    assert screen.get_at((int(shot.trail[0][0]), 50))[:3] == (0, 0, 255)
+
+
+def test_batch_draws_every_owner_once_per_view():
+    screen = pygame.Surface((100, 100))
+    batch = ProjectileBatch()
+    batch.add(screen, [Projectile(10, 10, 20, 10, 1, 1)], 0, 0, 1.0)
+    batch.add(screen, [Bomb(60, 60, 70, 60)], 0, 0, 1.0)
+    assert screen.get_at((10, 10))[:3] == (0, 0, 0)
+    batch.flush()
+    assert screen.get_at((10, 10))[:3] == (255, 50, 50)
+    assert screen.get_at((60, 60))[:3] == (150, 80, 30)
+    # A new camera flushes what was queued under the previous one
+    batch.add(screen, [Projectile(30, 30, 40, 30, 1, 1)], 0, 0, 1.0)
+    batch.add(screen, [], 10, 0, 1.0)
+    assert screen.get_at((30, 30))[:3] == (255, 50, 50)
@@ -0,0 +1,49 @@
+import random
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np
+
+from river_index import RiverIndex, segment_distances
+
+
+def test_segment_distances_clamp_to_endpoints():
+    dist = segment_distances([5, -3, 14, 2], [4, 0, 0, 2], [0, 1], [0, 1], [10, 1], [0, 1])
+    assert np.allclose(dist[:, 0], [4, 3, 4, 2])
+    assert np.allclose(dist[:, 1], [5, 4.123105626, 13.038404810, 1.414213562])
+
+
+def test_near_matches_brute_force():
+    random.seed(3)
+    index = RiverIndex(cell=50)
+    rivers = []
+    for _ in range(3):
+        pts = [(random.uniform(0, 600), random.uniform(0, 600)) for _ in range(8)]
+        width = random.uniform(10, 40)
+        rivers.append((pts, width))
+        index.add(pts, width)
+    xs = [random.uniform(-50, 650) for _ in range(300)]
+    ys = [random.uniform(-50, 650) for _ in range(300)]
+    expected = np.zeros(len(xs), dtype=bool)
+    for pts, width in rivers:
+        x1, y1 = zip(*pts[:-1])
+        x2, y2 = zip(*pts[1:])
+        expected |= (segment_distances(xs, ys, x1, y1, x2, y2) <= width / 2 + 5).any(axis=1)
+    assert index.near_many(xs, ys, 5).tolist() == expected.tolist()
+    assert [index.near(x, y, 5) for x, y in zip(xs[:20], ys[:20])] == expected[:20].tolist()
+    assert not RiverIndex().near(1, 1)
+
+
+def test_batch_along_a_long_river_only_checks_local_segments():
+    index = RiverIndex(cell=100)
+    points = [(x, 500 + (x // 40 % 2) * 30) for x in range(0, 4000, 40)]
+    index.add(points, 30)
+    sizes = []
+    nearby = index._nearby
+    index._nearby = lambda *box: sizes.append(len(nearby(*box))) or nearby(*box)
+    xs = [x for x, _ in points]
+    wet = index.near_many(xs, [y for _, y in points], 0)
+    assert wet.all() and len(sizes) > 10
+    assert max(sizes) < len(index) // 4
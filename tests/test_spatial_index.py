@@ -0,0 +1,81 @@
+import math
+import sys
+import types
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import pygame
+
+from spatial_index import CellBuckets, SpatialIndex, first_hits
+from ship import Ship
+
+
+def test_sweep_returns_time_of_impact_and_normal():
+    index = SpatialIndex(cell=50)
+    rock = object()
+    index.insert(rock, 300, 0, 10)
+    index.insert(object(), 900, 0, 10)
+    hit = index.sweep(0, 0, 600, 0, 5)
+    assert hit.obj is rock
+    assert abs(hit.t - 285 / 600) < 1e-9
+    assert (hit.nx, hit.ny) == (-1.0, 0.0)
+    assert index.sweep(0, 40, 600, 40, 5) is None
+    assert index.query(305, 0, 1) == [rock]
+
+
+class _Keys:
+    def __getitem__(self, key):
+        return False
+
+
+def test_fast_ship_does_not_tunnel_through_asteroid():
+    pygame.init()
+    index = SpatialIndex()
+    index.insert(object(), 300, 500, 4)
+    sector = types.SimpleNamespace(sweep_circle=index.sweep)
+    ship = Ship(100, 500)
+    ship.pilot = object()
+    ship.vx = 2000.0
+    # A long frame moves the ship well past the rock in a single step
+    ship.update(_Keys(), 3.0, 4000, 4000, [sector])
+    assert ship.x < 300
+    assert ship.vx < 0
+
+
+def test_batch_segments_find_first_body():
+    idx, t = first_hits(
+        [0, 0, 600, 205],
+        [0, 100, 0, 10],
+        [600, 600, 0, 300],
+        [0, 100, 0, 10],
+        [400, 200, 200],
+        [0, 10, 300],
+        [20, 20, 20],
+    )
+    assert list(idx) == [1, -1, 0, 1]
+    assert abs(t[0] - (200 - math.sqrt(300)) / 600) < 1e-9
+    assert t[3] == 0.0
+
+
+class _Point:
+    def __init__(self, x, y, radius=0):
+        self.x = x
+        self.y = y
+        self.radius = radius
+
+
+def test_cell_buckets_query_nearby_cells_and_remove():
+    buckets = CellBuckets(60)
+    near = _Point(65, 70)
+    wide = _Point(185, 70, radius=20)
+    far = _Point(900, 900)
+    for obj in (near, wide, far):
+        buckets.append(obj)
+    assert len(buckets) == 3 and buckets.extent == 20
+    assert buckets.near(70, 70, 10) == [near]
+    # The wide object's edge reaches into the queried box
+    assert wide in buckets.in_box(0, 0, 170, 100)
+    buckets.remove(near)
+    assert near not in buckets and buckets.near(70, 70, 10) == []
+    assert list(buckets) == [wide, far]
@@ -0,0 +1,64 @@
+import sys
+import types
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from combat import TimedMine
+from special_systems import SYSTEMS, SpecialSystems, special_system
+
+
+class _Hull:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.projectiles = []
+        self.damage = 0.0
+
+    def take_damage(self, amount):
+        self.damage += amount
+
+
+def test_mines_from_several_ships_update_in_one_pass():
+    enemy = _Hull(0, 0)
+    targets = [types.SimpleNamespace(ship=enemy)]
+    ships = [
+        types.SimpleNamespace(specials=[TimedMine(10, 0, fuse=0.1)]),
+        types.SimpleNamespace(specials=[TimedMine(500, 0, fuse=0.1)]),
+    ]
+    systems = SpecialSystems()
+    for ship in ships:
+        systems.queue(ship, targets, [], key=(id(targets), None))
+    systems.run(0.2)
+    # Only the mine in range hurts the enemy
+    assert enemy.damage == 30.0
+    for ship in ships:
+        systems.queue(ship, targets, [], key=(id(targets), None))
+    systems.run(0.3)
+    assert all(ship.specials == [] for ship in ships)
+
+
+def test_subclasses_use_the_nearest_registered_system():
+    class Spark:
+        def expired(self):
+            return False
+
+    class BrightSpark(Spark):
+        pass
+
+    seen = []
+
+    @special_system(Spark)
+    def _sparks(items, dt):
+        seen.extend(obj for _, obj, _ in items)
+
+    try:
+        a = types.SimpleNamespace(specials=[Spark()])
+        b = types.SimpleNamespace(specials=[BrightSpark(), object()])
+        systems = SpecialSystems()
+        systems.queue(a, [], [])
+        systems.queue(b, [], [])
+        systems.run(0.1)
+        assert seen == [a.specials[0], b.specials[0]]
+    finally:
+        del SYSTEMS[Spark]
@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import pygame
+
+from terrain_flags import BLOCKED, ICE, OUTSIDE, WATER, TerrainFlags
+
+
+def test_stamps_pack_into_one_lookup():
+    terrain = TerrainFlags(100, 80, resolution=2)
+    water = pygame.Surface((100, 80), pygame.SRCALPHA)
+    pygame.draw.rect(water, (255, 255, 255), (0, 0, 50, 80))
+    ice = pygame.Surface((100, 80), pygame.SRCALPHA)
+    ice.fill((200, 230, 255, 100))  # translucent overlays are not solid
+    pygame.draw.rect(ice, (200, 230, 255, 200), (40, 0, 20, 80))
+    terrain.stamp_surface(WATER, water)
+    terrain.stamp_surface(ICE, ice)
+    blocked = [[False, False], [False, True]]
+    terrain.stamp_cells(BLOCKED, blocked, 50)
+    assert terrain.at(10, 10) == WATER
+    assert terrain.at(45, 10) == WATER | ICE
+    assert terrain.at(75, 70) == BLOCKED
+    assert terrain.at(-1, 10) == OUTSIDE and terrain.at(10, 80) == OUTSIDE
+    terrain.stamp_surface(WATER, pygame.Surface((100, 80), pygame.SRCALPHA))
+    assert terrain.at(10, 10) == 0
+
+
+def test_query_matches_single_lookups():
+    terrain = TerrainFlags(30, 30, resolution=3)
+    terrain.stamp_cells(BLOCKED, [[True, False], [False, True]], 15)
+    xs = [0, 20, 5, 29.9, -4, 31]
+    ys = [0, 2, 20, 29.9, 5, 5]
+    assert terrain.query(xs, ys).tolist() == [terrain.at(x, y) for x, y in zip(xs, ys)]
+
+
+def test_resolution_that_does_not_divide_the_map():
+    terrain = TerrainFlags(3000, 3000, resolution=16)
+    assert terrain.flags.shape == (188, 188)
+    assert terrain.at(2999, 2999) == 0
+    edge = pygame.Surface((3000, 3000), pygame.SRCALPHA)
+    pygame.draw.rect(edge, (255, 255, 255), (2990, 2990, 10, 10))
+    terrain.stamp_surface(WATER, edge)
+    assert terrain.at(2999, 2999) == WATER
+    assert terrain.query([2999, 2980], [2999, 2999]).tolist() == [WATER, 0]
+
+    odd = TerrainFlags(100, 50, resolution=9)
+    odd.stamp_cells(BLOCKED, [[False, True]], 50)
+    assert odd.at(99, 49) == BLOCKED and odd.at(10, 49) == 0
@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import pygame
+
+from terrain_layer import TerrainLayer
+
+
+def _layers():
+    base = pygame.Surface((300, 200))
+    base.fill((10, 20, 30))
+    overlay = pygame.Surface((300, 200), pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, 0))
+    pygame.draw.rect(overlay, (200, 0, 0, 255), (100, 0, 50, 200))
+    return base, overlay
+
+
+def test_tiles_composite_layers_and_build_lazily():
+    base, overlay = _layers()
+    layer = TerrainLayer([base, overlay], tile=64)
+    screen = pygame.Surface((120, 80))
+    layer.draw(screen, 60, 10)
+    assert len(layer) == 6  # only the 3x2 tiles touching the view
+    assert screen.get_at((0, 0))[:3] == (10, 20, 30)
+    assert screen.get_at((50, 0))[:3] == (200, 0, 0)
+    # The bottom-right tile is clipped to the map edge
+    layer.draw(screen, 250, 150)
+    assert layer._tiles[(4, 3)].get_size() == (44, 8)
+
+
+def test_invalidate_rebuilds_only_touched_tiles():
+    base, overlay = _layers()
+    layer = TerrainLayer([base, overlay], tile=64)
+    screen = pygame.Surface((300, 200))
+    layer.draw(screen, 0, 0)
+    pygame.draw.circle(base, (0, 255, 0), (20, 20), 5)
+    layer.draw(screen, 0, 0)
+    assert screen.get_at((20, 20))[:3] == (10, 20, 30)
+    layer.invalidate(pygame.Rect(15, 15, 10, 10))
+    assert len(layer) == 19
+    layer.draw(screen, 0, 0)
+    assert screen.get_at((20, 20))[:3] == (0, 255, 0)
+    layer.invalidate()
+    assert len(layer) == 0
@@ -0,0 +1,49 @@
+import sys
+import types
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import pygame
+
+from threat_map import ThreatMap
+from defensive_drone import DefensiveDrone
+from faction_structures import Turret
+
+
+def _hostile(x, y, projectiles=()):
+    ship = types.SimpleNamespace(x=x, y=y, projectiles=list(projectiles))
+    return types.SimpleNamespace(ship=ship)
+
+
+def test_drone_and_turret_queries_match_linear_scan():
+    owner = types.SimpleNamespace(x=0.0, y=0.0, size=20, projectiles=[])
+    shot = types.SimpleNamespace(x=90.0, y=0.0, damage=2)
+    hostiles = [_hostile(2000, 0), _hostile(200, 0, [shot]), _hostile(0, 150)]
+    threats = ThreatMap(hostiles)
+    # Scan order wins over distance: the second hostile comes before its shot
+    assert threats.first_threat(owner, 250) is hostiles[1].ship
+    assert [t for _, t in threats.threats_near(owner, 250)] == [
+        shot,
+        hostiles[2].ship,
+        hostiles[1].ship,
+    ]
+    drone = DefensiveDrone(owner)
+    assert drone._find_threat(hostiles, threats) is drone._find_threat(hostiles)
+    assert drone._find_threat(hostiles[2:], ThreatMap(hostiles[2:])) is hostiles[2].ship
+    far = [_hostile(2000, 0, [shot]), hostiles[2]]
+    assert drone._find_threat(far, ThreatMap(far)) is shot
+    turret = Turret(owner, 0.0, 0.0)
+    assert turret._nearest(0, 0, hostiles, threats)[0] is turret._nearest(0, 0, hostiles, None)[0]
+
+
+def test_removed_projectiles_are_not_reported_again():
+    shot = types.SimpleNamespace(x=5.0, y=5.0, damage=2)
+    source = _hostile(500, 500, [shot])
+    threats = ThreatMap([source])
+    rect = pygame.Rect(0, 0, 10, 10)
+    assert threats.projectiles_in(rect) == [(shot, source.ship)]
+    assert threats.remove_projectile(shot, source.ship)
+    assert source.ship.projectiles == []
+    assert threats.projectiles_in(rect) == []
+    assert not threats.remove_projectile(shot, source.ship)
@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from station import SpaceStation
+from items import ITEMS_BY_NAME
+from trade import MarketIndex, TradeRouteSolver
+
+
+def _station(x, price, stock=5):
+    st = SpaceStation(x, 0)
+    st.market = {"hierro": {"stock": stock, "price": price}}
+    return st
+
+
+def test_price_book_tracks_station_changes():
+    a = _station(0, 30)
+    b = _station(500, 20)
+    index = MarketIndex([a, b])
+    assert index.cheapest("hierro")[0] == (20, b)
+
+    b.market["hierro"]["price"] = 40
+    b._notify_market("hierro")
+    assert [p for p, _ in index.cheapest("hierro", 2)] == [30, 40]
+
+    a.market["hierro"]["stock"] = 0
+    a._notify_market("hierro")
+    assert index.cheapest("hierro", 2) == [(40, b)]
+
+
+def test_routes_cached_until_price_moves():
+    base = ITEMS_BY_NAME["hierro"].valor
+    near = _station(100, base // 2)
+    far = _station(1900, base // 2)
+    index = MarketIndex([near, far])
+    solver = TradeRouteSolver(index)
+
+    routes = solver.best_routes(0, 0, k=2, items=["hierro"])
+    assert routes[0].buy_station is near
+    assert solver.best_routes(0, 0, k=2, items=["hierro"]) == routes
+
+    far.market["hierro"]["price"] = 1
+    far._notify_market("hierro")
+    routes = solver.best_routes(0, 0, k=2, items=["hierro"])
+    assert any(r.buy_station is far and r.cost == 1 for r in routes)
+
+
+def test_small_moves_and_stock_changes_keep_cached_routes():
+    item = "huevo de dragon"
+    near = SpaceStation(100, 0)
+    far = SpaceStation(1900, 0)
+    for st in (near, far):
+        st.market = {item: {"stock": 5, "price": 100}}
+    solver = TradeRouteSolver(MarketIndex([near, far]))
+    routes = solver.best_routes(0, 0, k=2, items=[item])
+    assert routes
+    version = solver.version
+
+    # Restocking a candidate buyer leaves its listing and quote unchanged
+    far.market[item]["stock"] = 9
+    far._notify_market(item)
+    # A move inside the threshold is ignored as well
+    near.market[item]["price"] = 102
+    near._notify_market(item)
+    assert solver.version == version
+    assert solver.best_routes(0, 0, k=2, items=[item]) == routes
+
+    near.market[item]["price"] = 150
+    near._notify_market(item)
+    assert solver.version > version
@@ -0,0 +1,47 @@
+import math
+import random
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import pygame
+
+from planet_surface import _capsule_cells, _draw_capsule
+
+
+def _stepped_cells(x1, y1, x2, y2, radius, cell, cols, rows):
+    """Cells touched by the square brush of the old per-step circle carving."""
+    found = set()
+    steps = 400
+    for k in range(steps + 1):
+        x = x1 + (x2 - x1) * k / steps
+        y = y1 + (y2 - y1) * k / steps
+        for i in range(int((x - radius) // cell), int((x + radius) // cell) + 1):
+            for j in range(int((y - radius) // cell), int((y + radius) // cell) + 1):
+                if 0 <= i < cols and 0 <= j < rows:
+                    found.add((j, i))
+    return found
+
+
+def test_capsule_cells_match_swept_brush():
+    random.seed(5)
+    for _ in range(50):
+        x1, y1 = random.uniform(-50, 650), random.uniform(-50, 650)
+        ang = random.uniform(0, math.tau)
+        length = random.uniform(0, 200)
+        x2, y2 = x1 + math.cos(ang) * length, y1 + math.sin(ang) * length
+        rows, cols = _capsule_cells(x1, y1, x2, y2, 12, 60, 10, 10)
+        got = set(zip(rows.tolist(), cols.tolist()))
+        assert got == _stepped_cells(x1, y1, x2, y2, 12, 60, 10, 10)
+
+
+def test_capsule_clears_collision_along_tunnel():
+    surf = pygame.Surface((200, 200), pygame.SRCALPHA)
+    surf.fill((255, 255, 255))
+    _draw_capsule(surf, (0, 0, 0, 0), 20, 20, 180, 150, 10)
+    for t in (0.0, 0.3, 0.7, 1.0):
+        x = int(20 + 160 * t)
+        y = int(20 + 130 * t)
+        assert surf.get_at((x, y)).a == 0
+    assert surf.get_at((180, 20)).a == 255
@@ -0,0 +1,40 @@
+import math
+import random
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from walk_grid import WalkGrid
+
+
+def _point_in_polygon(x, y, poly):
+    inside = False
+    j = len(poly) - 1
+    for i in range(len(poly)):
+        xi, yi = poly[i]
+        xj, yj = poly[j]
+        if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi + 1e-9) + xi):
+            inside = not inside
+        j = i
+    return inside
+
+
+def test_shape_stamps_match_per_cell_loops():
+    random.seed(3)
+    grid = WalkGrid(20, 15, 60)
+    grid.fill_rect(70, 100, 250, 130)
+    # The old loops included the cell under the right/bottom edge
+    assert grid.blocked[1:3, 1:5].all() and grid.blocked.sum() == 8
+    grid.clear()
+    grid.fill_circle(400, 400, 90)
+    for j in range(grid.rows):
+        for i in range(grid.cols):
+            centre = (i * 60 + 30, j * 60 + 30)
+            assert grid.blocked[j][i] == (math.hypot(centre[0] - 400, centre[1] - 400) <= 90)
+    grid.fill_rect(0, 0, 1200, 900)
+    pts = [(300 + random.randint(-150, 150), 400 + random.randint(-150, 150)) for _ in range(7)]
+    grid.fill_polygon(pts, False)
+    for j in range(grid.rows):
+        for i in range(grid.cols):
+            assert grid.blocked[j][i] == (not _point_in_polygon(i * 60 + 30, j * 60 + 30, pts))
@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import numpy as np
+import pygame
+
+from weather import ScreenTint, StormField
+
+
+def test_storm_shapes_draw_only_in_view():
+    storms = StormField(color=(180, 180, 220, 200))
+    storms.add(pygame.Rect(100, 100, 200, 100))
+    storms.add(pygame.Rect(900, 900, 50, 50))
+    assert len(storms) == 2
+
+    screen = pygame.Surface((400, 300), pygame.SRCALPHA)
+    storms.draw(screen, 50, 50)
+    assert screen.get_at((150, 100)).a == 200
+    assert screen.get_at((55, 55)).a == 0
+    # The overlay is wiped after every blit
+    assert not np.any(pygame.surfarray.pixels_alpha(storms._overlay))
+
+
+def test_screen_tint_covers_window():
+    screen = pygame.Surface((64, 48), pygame.SRCALPHA)
+    ScreenTint((230, 220, 170, 140)).draw(screen)
+    assert screen.get_at((0, 0)) == (230, 220, 170, 140)
+    assert screen.get_at((63, 47)) == (230, 220, 170, 140)